@@ -0,0 +1,20 @@
+"""Benchmarks for looking up arrays of values in a series, using NumPy."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from eseries import ESeries
+from eseries.arrays import (find_nearest_array, find_greater_than_or_equal_array, find_greater_than_array,
+                            find_less_than_or_equal_array, find_less_than_array)
+
+QUERY_ARRAY = 10 ** np.random.RandomState(1729).uniform(-12, 9, size=100000)
+
+
+@pytest.mark.parametrize("function", [find_nearest_array, find_greater_than_or_equal_array, find_greater_than_array,
+                                      find_less_than_or_equal_array, find_less_than_array],
+                         ids=lambda function: function.__name__)
+@pytest.mark.parametrize("series_key", list(ESeries), ids=lambda series_key: series_key.name)
+def test_lookup_array(benchmark, function, series_key):
+    benchmark.group = function.__name__
+    benchmark(function, series_key, QUERY_ARRAY)
@@ -0,0 +1,21 @@
+"""Benchmarks for finding series and parallel combinations of values."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E24, E96, E192
+from eseries.combinations import find_combinations_batch
+
+from .values import QUERY_VALUES
+
+
+def find_all(series_key, targets, num):
+    for _ in find_combinations_batch(series_key, targets, num=num):
+        pass
+
+
+@pytest.mark.parametrize("num", [1, 10])
+@pytest.mark.parametrize("series_key", [E24, E96, E192], ids=lambda series_key: series_key.name)
+def test_find_combinations(benchmark, series_key, num):
+    benchmark.group = "find_combinations-{}".format(num)
+    benchmark(find_all, series_key, QUERY_VALUES, num)
@@ -0,0 +1,21 @@
+"""Benchmarks for finding pairs of values for dividers."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E24, E96, E192
+from eseries.dividers import find_dividers_batch
+
+from .values import QUERY_VALUES
+
+
+def find_all(series_key, ratios, num):
+    for _ in find_dividers_batch(series_key, ratios, num=num):
+        pass
+
+
+@pytest.mark.parametrize("num", [1, 10])
+@pytest.mark.parametrize("series_key", [E24, E96, E192], ids=lambda series_key: series_key.name)
+def test_find_dividers(benchmark, series_key, num):
+    benchmark.group = "find_dividers-{}".format(num)
+    benchmark(find_all, series_key, QUERY_VALUES, num)
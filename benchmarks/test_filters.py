@@ -0,0 +1,24 @@
+"""Benchmarks for finding pairs of values for RC and LC filters."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E6, E12, E24, E96
+from eseries.filters import find_filter_pairs_batch
+
+from .values import QUERY_VALUES
+
+
+def find_all(first_series_key, second_series_key, targets, num, sqrt):
+    for _ in find_filter_pairs_batch(first_series_key, second_series_key, targets, num=num,
+                                     first_range=(1e3, 1e6), sqrt=sqrt):
+        pass
+
+
+@pytest.mark.parametrize("sqrt", [False, True], ids=["product", "sqrt"])
+@pytest.mark.parametrize("num", [1, 10])
+@pytest.mark.parametrize("series_keys", [(E24, E6), (E24, E12), (E96, E24)],
+                         ids=lambda series_keys: "-".join(series_key.name for series_key in series_keys))
+def test_find_filter_pairs(benchmark, series_keys, num, sqrt):
+    benchmark.group = "find_filter_pairs-{}".format(num)
+    benchmark(find_all, series_keys[0], series_keys[1], QUERY_VALUES, num, sqrt)
@@ -0,0 +1,49 @@
+"""Benchmarks for formatting values in engineering notation.
+
+Each benchmark formats all the values of a series over the decades of QUERY_VALUES.
+The bill of materials benchmarks format a long list of repeated series values.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import ESeries, E24, erange
+from eseries.eng import eng_string, eng_strings
+
+
+def format_all(values, prefix):
+    for value in values:
+        eng_string(value, prefix=prefix)
+
+
+def format_all_bulk(values, prefix):
+    for _ in eng_strings(values, prefix=prefix):
+        pass
+
+
+def bill_of_materials():
+    values = list(erange(E24, 1, 1e6))
+    return [random.Random(1729).choice(values) for _ in range(100000)]
+
+
+@pytest.mark.parametrize("prefix", [False, True], ids=["exponent", "prefix"])
+@pytest.mark.parametrize("series_key", list(ESeries), ids=lambda series_key: series_key.name)
+def test_eng_string(benchmark, series_key, prefix):
+    benchmark.group = "eng_string-{}".format("prefix" if prefix else "exponent")
+    values = list(erange(series_key, 1e-12, 1e9))
+    benchmark(format_all, values, prefix)
+
+
+@pytest.mark.parametrize("format_function", [format_all, format_all_bulk], ids=["eng_string", "eng_strings"])
+def test_bill_of_materials(benchmark, format_function):
+    benchmark.group = "eng_string-bill-of-materials"
+    benchmark(format_function, bill_of_materials(), True)
+
+
+def test_bill_of_materials_array(benchmark):
+    np = pytest.importorskip("numpy")
+    from eseries.arrays import eng_string_array
+    benchmark.group = "eng_string-bill-of-materials"
+    benchmark(eng_string_array, np.array(bill_of_materials()), prefix=True)
@@ -0,0 +1,33 @@
+"""Benchmarks for the cost of instrumentation, disabled and enabled.
+
+Each benchmark formats the values of a range of E24 values, which calls each
+of the instrumented functions.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E24, erange, find_nearest_few, enable_instrumentation, disable_instrumentation
+from eseries.eng import eng_string
+
+from .values import QUERY_VALUES
+
+
+def format_range_and_nearest():
+    for value in erange(E24, 1e-12, 1e9):
+        eng_string(value)
+    for value in QUERY_VALUES:
+        find_nearest_few(E24, value)
+
+
+@pytest.fixture(params=[False, True], ids=["disabled", "enabled"])
+def instrumentation(request):
+    if request.param:
+        enable_instrumentation()
+    yield
+    disable_instrumentation()
+
+
+def test_instrumentation(benchmark, instrumentation):
+    benchmark.group = "instrumentation"
+    benchmark(format_range_and_nearest)
@@ -0,0 +1,36 @@
+"""Benchmarks for worst-case analysis of a divider with interval arithmetic, for 10000 pairs of values."""
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E24, erange
+from eseries.intervals import Interval
+
+_random = random.Random(1729)
+_values = list(erange(E24, 1e3, 1e5))
+
+UPPER = [_random.choice(_values) for _ in range(10000)]
+LOWER = [_random.choice(_values) for _ in range(10000)]
+
+
+def divider(r1, r2):
+    return 1 / (1 + r1 / r2)
+
+
+def evaluate_all(upper, lower):
+    for r1, r2 in zip(upper, lower):
+        divider(Interval.from_series(E24, r1), Interval.from_series(E24, r2))
+
+
+def test_intervals(benchmark):
+    benchmark.group = "intervals-divider"
+    benchmark(evaluate_all, UPPER, LOWER)
+
+
+def test_intervals_array(benchmark):
+    np = pytest.importorskip("numpy")
+    from eseries.arrays import evaluate_intervals_array
+    benchmark.group = "intervals-divider"
+    benchmark(evaluate_intervals_array, divider, [(E24, np.array(UPPER)), (E24, np.array(LOWER))])
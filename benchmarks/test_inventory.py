@@ -0,0 +1,56 @@
+"""Benchmarks for finding the nearest values among the parts in stock.
+
+The catalog comprises 200,000 parts with a sparse subset of the E96 values
+from 1e-12 to 1e9.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E96, erange
+from eseries.inventory import Inventory
+
+from .values import QUERY_VALUES
+
+_random = random.Random(1729)
+
+_STOCKED_VALUES = _random.sample(list(erange(E96, 1e-12, 1e9)), 1000)
+
+CATALOG = [(_random.choice(_STOCKED_VALUES), "SKU-{}".format(sku)) for sku in range(200000)]
+
+
+def lookup_all(function, values):
+    for value in values:
+        function(value)
+
+
+@pytest.fixture(scope="module")
+def inventory():
+    return Inventory(CATALOG)
+
+
+@pytest.fixture(scope="module")
+def inventory_path(tmp_path_factory, inventory):
+    path = str(tmp_path_factory.mktemp("inventory") / "inventory.bin")
+    inventory.save(path)
+    return path
+
+
+def test_build(benchmark):
+    benchmark.group = "inventory-build"
+    benchmark(Inventory, CATALOG)
+
+
+def test_load(benchmark, inventory_path):
+    benchmark.group = "inventory-build"
+    benchmark(Inventory.load, inventory_path)
+
+
+@pytest.mark.parametrize("loaded", [False, True], ids=["memory", "mapped"])
+def test_find_nearest(benchmark, inventory, inventory_path, loaded):
+    if loaded:
+        inventory = Inventory.load(inventory_path)
+    benchmark.group = "inventory-find_nearest"
+    benchmark(lookup_all, inventory.find_nearest, QUERY_VALUES)
@@ -0,0 +1,91 @@
+"""Benchmarks for looking up values in a series.
+
+Each benchmark performs one lookup for each of the 100 values in QUERY_VALUES.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import (ESeries, E192, find_nearest, find_nearest_few, find_greater_than_or_equal, find_greater_than,
+                     find_less_than_or_equal, find_less_than, find_k_nearest_batch, is_member, classify, classify_batch,
+                     register_series, unregister_series)
+from eseries.eseries import tolerance_limits
+
+from .values import QUERY_VALUES
+
+
+def lookup_all(function, series_key, values):
+    for value in values:
+        function(series_key, value)
+
+
+@pytest.mark.parametrize("function", [find_nearest, find_nearest_few, find_greater_than_or_equal, find_greater_than,
+                                      find_less_than_or_equal, find_less_than, tolerance_limits],
+                         ids=lambda function: function.__name__)
+@pytest.mark.parametrize("series_key", list(ESeries), ids=lambda series_key: series_key.name)
+def test_lookup(benchmark, function, series_key):
+    benchmark.group = function.__name__
+    benchmark(lookup_all, function, series_key, QUERY_VALUES)
+
+
+# Members of the finest series, which are members of a variety of coarser series
+MEMBER_VALUES = [find_nearest(E192, value) for value in QUERY_VALUES]
+
+
+@pytest.mark.parametrize("series_key", list(ESeries), ids=lambda series_key: series_key.name)
+def test_is_member(benchmark, series_key):
+    benchmark.group = "is_member"
+    benchmark(lookup_all, is_member, series_key, MEMBER_VALUES)
+
+
+def classify_all(values):
+    for value in values:
+        classify(value)
+
+
+def classify_all_batch(values):
+    for _ in classify_batch(values):
+        pass
+
+
+@pytest.mark.parametrize("function", [classify_all, classify_all_batch], ids=["classify", "classify_batch"])
+def test_classify(benchmark, function):
+    benchmark.group = "classify"
+    benchmark(function, MEMBER_VALUES)
+
+
+@pytest.fixture(scope="module")
+def reels():
+    series_key = register_series("REELS", [1.0, 2.2, 3.3, 4.7, 6.8, 8.2], tolerance=0.05)
+    yield series_key
+    unregister_series(series_key)
+
+
+@pytest.mark.parametrize("function", [find_nearest, find_greater_than_or_equal, find_less_than_or_equal],
+                         ids=lambda function: function.__name__)
+def test_lookup_registered_series(benchmark, function, reels):
+    benchmark.group = function.__name__
+    benchmark(lookup_all, function, reels, QUERY_VALUES)
+
+
+def lookup_all_exact(function, series_key, values):
+    for value in values:
+        function(series_key, value, exact=True)
+
+
+@pytest.mark.parametrize("function", [find_nearest, find_greater_than_or_equal, find_less_than_or_equal],
+                         ids=lambda function: function.__name__)
+def test_lookup_exact(benchmark, function):
+    benchmark.group = function.__name__
+    benchmark(lookup_all_exact, function, ESeries.E24, QUERY_VALUES)
+
+
+def find_k_nearest_all(series_key, values, k):
+    for _ in find_k_nearest_batch(series_key, values, k):
+        pass
+
+
+@pytest.mark.parametrize("k", [3, 50, 300])
+def test_find_k_nearest(benchmark, k):
+    benchmark.group = "find_k_nearest"
+    benchmark(find_k_nearest_all, ESeries.E96, QUERY_VALUES, k)
@@ -0,0 +1,21 @@
+"""Benchmarks for Monte-Carlo analysis of circuits with one million samples."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("numpy")
+
+from eseries import E24, E96
+from eseries.montecarlo import monte_carlo, Part, UNIFORM, NORMAL
+
+CIRCUITS = {
+    'divider': (lambda r1, r2: r2 / (r1 + r2), [Part(E96, 10e3), Part(E96, 4.75e3)]),
+    'rc': (lambda r, c: r * c, [Part(E96, 10e3), Part(E24, 100e-9)]),
+}
+
+
+@pytest.mark.parametrize("distribution", [UNIFORM, NORMAL])
+@pytest.mark.parametrize("circuit", sorted(CIRCUITS))
+def test_monte_carlo(benchmark, circuit, distribution):
+    benchmark.group = "monte_carlo-{}".format(circuit)
+    expression, parts = CIRCUITS[circuit]
+    benchmark(monte_carlo, expression, parts, num_samples=1000000, seed=1729, spec=(0, 1), distribution=distribution)
@@ -0,0 +1,41 @@
+"""Benchmarks for finding values in several series at once.
+
+Each benchmark finds the nearest, less-than-or-equal and greater-than-or-equal
+values in E6, E12, E24 and E96 for each of the 100 values in QUERY_VALUES.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E6, E12, E24, E96, find_nearest, find_less_than_or_equal, find_greater_than_or_equal
+from eseries.multi import find_multi_batch
+
+from .values import QUERY_VALUES
+
+SERIES_KEYS = [E6, E12, E24, E96]
+
+
+def find_separately(series_keys, values):
+    for value in values:
+        for series_key in series_keys:
+            find_less_than_or_equal(series_key, value)
+            find_nearest(series_key, value)
+            find_greater_than_or_equal(series_key, value)
+
+
+def find_together(series_keys, values):
+    for _ in find_multi_batch(series_keys, values):
+        pass
+
+
+@pytest.mark.parametrize("function", [find_separately, find_together], ids=lambda function: function.__name__)
+def test_find_multi(benchmark, function):
+    benchmark.group = "find_multi"
+    benchmark(function, SERIES_KEYS, QUERY_VALUES)
+
+
+def test_find_multi_array(benchmark):
+    np = pytest.importorskip("numpy")
+    from eseries.arrays import find_multi_array
+    benchmark.group = "find_multi"
+    benchmark(find_multi_array, SERIES_KEYS, np.array(QUERY_VALUES))
@@ -0,0 +1,37 @@
+"""Benchmarks for finding the nearest values using a pool of processes.
+
+Each benchmark snaps 100000 values, including the cost of starting the pool.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E96, find_nearest
+from eseries.parallel import find_nearest_parallel
+
+_random = random.Random(1729)
+
+VALUES = [10 ** _random.uniform(-3, 6) for _ in range(100000)]
+
+
+def find_all(values):
+    for value in values:
+        find_nearest(E96, value)
+
+
+def find_all_parallel(values, max_workers):
+    for _ in find_nearest_parallel(E96, values, max_workers=max_workers):
+        pass
+
+
+def test_find_nearest_serial(benchmark):
+    benchmark.group = "find_nearest-100000"
+    benchmark.pedantic(find_all, args=(VALUES,), rounds=3)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 4])
+def test_find_nearest_parallel(benchmark, max_workers):
+    benchmark.group = "find_nearest-100000"
+    benchmark.pedantic(find_all_parallel, args=(VALUES, max_workers), rounds=3)
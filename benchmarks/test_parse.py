@@ -0,0 +1,62 @@
+"""Benchmarks for parsing values, compared with float() and with looking up the parsed values."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E24, find_nearest
+from eseries.eng import eng_string
+from eseries.parse import parse_value, parse_values
+
+from .values import QUERY_VALUES
+
+
+
+def rkm_code(value):
+    number, _, prefix = eng_string(value, prefix=True).partition(' ')
+    integer, _, fraction = number.partition('.')
+    return integer + (prefix or 'R') + fraction
+
+
+TEXTS = {
+    'float': [repr(value) for value in QUERY_VALUES],
+    'prefix': [eng_string(value, prefix=True) for value in QUERY_VALUES],
+    'rkm': [rkm_code(value) for value in QUERY_VALUES],
+}
+
+
+def parse_all(parse_function, texts):
+    for text in texts:
+        parse_function(text)
+
+
+def parse_all_bulk(texts):
+    for _ in parse_values(texts):
+        pass
+
+
+def parse_and_find_all(texts):
+    for text in texts:
+        find_nearest(E24, parse_value(text))
+
+
+def test_float(benchmark):
+    benchmark.group = "parse-float"
+    benchmark(parse_all, float, TEXTS['float'])
+
+
+@pytest.mark.parametrize("style", sorted(TEXTS))
+def test_parse_value(benchmark, style):
+    benchmark.group = "parse-{}".format(style)
+    benchmark(parse_all, parse_value, TEXTS[style])
+
+
+@pytest.mark.parametrize("style", sorted(TEXTS))
+def test_parse_values(benchmark, style):
+    benchmark.group = "parse-{}".format(style)
+    benchmark(parse_all_bulk, TEXTS[style])
+
+
+@pytest.mark.parametrize("style", sorted(TEXTS))
+def test_parse_and_find_nearest(benchmark, style):
+    benchmark.group = "parse-and-find-nearest"
+    benchmark(parse_and_find_all, TEXTS[style])
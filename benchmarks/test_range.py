@@ -0,0 +1,45 @@
+"""Benchmarks for generating ranges of values from a series."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import ESeries, erange, open_erange
+
+
+def consume(range_function, series_key, start, stop, **kwargs):
+    for _ in range_function(series_key, start, stop, **kwargs):
+        pass
+
+
+# (start, stop) limits spanning 1, 10 and 100 decades
+SPANS = {
+    1: (1e3, 1e4),
+    10: (1e-3, 1e7),
+    100: (1e-50, 1e50),
+}
+
+
+@pytest.mark.parametrize("range_function", [erange, open_erange], ids=lambda function: function.__name__)
+@pytest.mark.parametrize("decades", sorted(SPANS))
+@pytest.mark.parametrize("series_key", list(ESeries), ids=lambda series_key: series_key.name)
+def test_range(benchmark, range_function, decades, series_key):
+    benchmark.group = "{}-{}-decades".format(range_function.__name__, decades)
+    start, stop = SPANS[decades]
+    benchmark(consume, range_function, series_key, start, stop)
+
+
+@pytest.mark.parametrize("options", [{'reverse': True}, {'step': 3}, {'reverse': True, 'step': 3}],
+                         ids=lambda options: '-'.join(sorted(options)))
+@pytest.mark.parametrize("decades", sorted(SPANS))
+def test_erange_options(benchmark, options, decades):
+    benchmark.group = "erange-options-{}-decades".format(decades)
+    start, stop = SPANS[decades]
+    benchmark(consume, erange, ESeries.E192, start, stop, **options)
+
+
+@pytest.mark.parametrize("exact", [False, True], ids=["float", "exact"])
+@pytest.mark.parametrize("decades", sorted(SPANS))
+def test_erange_exact(benchmark, exact, decades):
+    benchmark.group = "erange-exact-{}-decades".format(decades)
+    start, stop = SPANS[decades]
+    benchmark(consume, erange, ESeries.E192, start, stop, exact=exact)
@@ -0,0 +1,48 @@
+"""Benchmarks for the lookup service.
+
+Each end-to-end benchmark makes one request for each of the 100 values in
+QUERY_VALUES, concurrently, each over its own connection to a local server.
+"""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import E24
+from eseries.server import start_server, LookupBatcher, lookup_batch
+
+from .values import QUERY_VALUES
+
+
+def test_lookup_batch(benchmark):
+    benchmark.group = "server-lookup_batch"
+    benchmark(lookup_batch, "find_nearest", E24, QUERY_VALUES)
+
+
+async def post(port, value):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps({"series": "E24", "value": value}).encode("utf-8")
+    writer.write("POST /find_nearest HTTP/1.1\r\nContent-Length: {}\r\nConnection: close\r\n\r\n"
+                 .format(len(body)).encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+async def request_all(batcher):
+    server = await start_server("127.0.0.1", 0, batcher)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        await asyncio.gather(*(post(port, value) for value in QUERY_VALUES))
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.parametrize("max_batch_size", [1, 1024])
+def test_concurrent_requests(benchmark, max_batch_size):
+    benchmark.group = "server-requests"
+    benchmark(lambda: asyncio.run(request_all(LookupBatcher(max_batch_size=max_batch_size, max_latency=0.001))))
@@ -0,0 +1,38 @@
+"""Benchmarks for building precomputed tables, and for loading them from the table cache."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eseries import ESeries, enable_table_cache, disable_table_cache
+from eseries.dividers import _ratio_table, _RATIO_TABLES
+from eseries.eseries import _decade_table, _DECADE_TABLES
+
+TABLES = {
+    "decade": (_decade_table, _DECADE_TABLES),
+    "ratio": (_ratio_table, _RATIO_TABLES),
+}
+
+
+@pytest.fixture(params=[False, True], ids=["built", "mapped"])
+def table_cache(request, tmp_path):
+    if request.param:
+        enable_table_cache(str(tmp_path))
+    yield
+    disable_table_cache()
+    _DECADE_TABLES.clear()
+    _RATIO_TABLES.clear()
+
+
+def fresh_table(function, tables, series_key):
+    tables.pop(series_key, None)
+    function(series_key)
+
+
+@pytest.mark.parametrize("table", sorted(TABLES))
+@pytest.mark.parametrize("series_key", [ESeries.E24, ESeries.E192], ids=lambda series_key: series_key.name)
+def test_table(benchmark, table_cache, table, series_key):
+    function, tables = TABLES[table]
+    # Populate the table cache, if it is enabled
+    fresh_table(function, tables, series_key)
+    benchmark.group = "{}-table-{}".format(table, series_key.name)
+    benchmark(fresh_table, function, tables, series_key)
@@ -0,0 +1,7 @@
+"""Query values shared by the benchmarks."""
+import random
+
+_random = random.Random(1729)
+
+# Values spread log-uniformly over the decades commonly used for components
+QUERY_VALUES = [10 ** _random.uniform(-12, 9) for _ in range(100)]
@@ -2,14 +2,16 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
-try:
-    from future import standard_library
-    standard_library.install_aliases()
-except ImportError:
-    pass
 from .eseries import (ESeries, E3, E6, E12, E24, E48, E96, E192, series, series_keys, series_key_from_name, tolerance,
                       find_greater_than_or_equal, find_greater_than, find_less_than_or_equal, find_less_than,
-                      find_nearest, find_nearest_few, erange, open_erange)
+                      find_nearest, find_nearest_few, find_k_nearest, find_k_nearest_batch, erange, open_erange,
+                      is_member, is_member_batch, classify, classify_batch, CustomSeries, register_series,
+                      unregister_series)
+from .cache import enable_cache, disable_cache, clear_cache, cache_info
+from .exact import ExactValue
+from .instrumentation import (CallStats, enable_instrumentation, disable_instrumentation, clear_instrumentation,
+                              instrumentation_snapshot, dump_instrumentation)
+from .tables import enable_table_cache, disable_table_cache, table_cache_directory, build_table_cache
 
 __all__ = [
     'ESeries',
@@ -30,6 +32,30 @@ __all__ = [
     'find_less_than',
     'find_nearest',
     'find_nearest_few',
+    'find_k_nearest',
+    'find_k_nearest_batch',
     'erange',
     'open_erange',
+    'is_member',
+    'is_member_batch',
+    'classify',
+    'classify_batch',
+    'CustomSeries',
+    'register_series',
+    'unregister_series',
+    'ExactValue',
+    'enable_cache',
+    'disable_cache',
+    'clear_cache',
+    'cache_info',
+    'enable_table_cache',
+    'disable_table_cache',
+    'table_cache_directory',
+    'build_table_cache',
+    'CallStats',
+    'enable_instrumentation',
+    'disable_instrumentation',
+    'clear_instrumentation',
+    'instrumentation_snapshot',
+    'dump_instrumentation',
 ]
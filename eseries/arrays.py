@@ -0,0 +1,366 @@
+"""Array-in, array-out variants of the lookup and formatting functions, using NumPy.
+
+NumPy is an optional dependency of eseries, so this module is not imported
+by the top-level eseries package. Install the extra with:
+
+    $ pip install eseries[numpy]
+
+The results are identical to those of the corresponding scalar functions
+in eseries.eseries and eseries.eng, element by element.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("eseries.arrays requires NumPy. Install it with: pip install eseries[numpy]")
+
+from collections import OrderedDict
+from functools import reduce
+
+from eseries.eseries import (series, tolerance, LOG10_MANTISSA_E, GEOMETRIC_SCALE_E, _MINIMUM_E_VALUE, _decade_table,
+                             _table_start_position, _position_value)
+from eseries.eng import eng_strings
+from eseries.intervals import Interval, _IntervalOperators
+from eseries.multi import Neighbours, _merged_index
+
+
+def find_greater_than_or_equal_array(series_key, values):
+    """Find the smallest values greater-than or equal-to the given values.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        values: An array_like of query values.
+
+    Returns:
+        An array of the same shape as values, containing for each query value
+        the smallest value from the specified series which is greater-than or
+        equal-to the query value.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    shape, values, below, floor, above = _neighbours(series_key, values)
+    return np.where(floor == values, floor, above).reshape(shape)
+
+
+def find_greater_than_array(series_key, values):
+    """Find the smallest values greater-than the given values.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        values: An array_like of query values.
+
+    Returns:
+        An array of the same shape as values, containing for each query value
+        the smallest value from the specified series which is greater-than the
+        query value.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    shape, values, below, floor, above = _neighbours(series_key, values)
+    return above.reshape(shape)
+
+
+def find_less_than_or_equal_array(series_key, values):
+    """Find the largest values less-than or equal-to the given values.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        values: An array_like of query values.
+
+    Returns:
+        An array of the same shape as values, containing for each query value
+        the largest value from the specified series which is less-than or
+        equal-to the query value.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    shape, values, below, floor, above = _neighbours(series_key, values)
+    return floor.reshape(shape)
+
+
+def find_less_than_array(series_key, values):
+    """Find the largest values less-than the given values.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        values: An array_like of query values.
+
+    Returns:
+        An array of the same shape as values, containing for each query value
+        the largest value from the specified series which is less-than the
+        query value.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    shape, values, below, floor, above = _neighbours(series_key, values)
+    return np.where(floor < values, floor, below).reshape(shape)
+
+
+def find_nearest_array(series_key, values):
+    """Find the nearest values.
+
+    Args:
+        series_key: The ESeries to use.
+        values: An array_like of values for which the nearest values are to be found.
+
+    Returns:
+        An array of the same shape as values, containing for each query value
+        the value in the specified E-series closest to it. Where a query value
+        is equidistant from two series values, the lower is returned.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    shape, values, below, floor, above = _neighbours(series_key, values)
+    ceiling = np.where(floor == values, floor, above)
+    return np.where(values - floor <= ceiling - values, floor, ceiling).reshape(shape)
+
+
+def find_multi_array(series_keys, values):
+    """Find the values neighbouring many values in several series at once.
+
+    The logarithms of the query values are computed, and located within the
+    merged index of the series, once for all the series. See eseries.multi.
+
+    Args:
+        series_keys: An iterable series of series keys.
+        values: An array_like of query values.
+
+    Returns:
+        An OrderedDict mapping each series key, in order, to Neighbours of
+        arrays of the same shape as values, containing the same values as
+        find_less_than_or_equal_array(), find_nearest_array() and
+        find_greater_than_or_equal_array().
+
+    Raises:
+        ValueError: If series_keys is empty.
+        ValueError: If any series key is not known.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    index = _merged_index(tuple(series_keys))
+    values = _checked_values(index.widest_series_key, values)
+    flat_values = values.ravel()
+    decades, mantissas = np.divmod(np.log10(flat_values), 1.0)
+    decades = decades.astype(np.int64)
+    merged_positions = np.searchsorted(np.asarray(index.log_mantissas), mantissas, side='right')
+    found = OrderedDict()
+    for series_key, offsets in zip(index.series_keys, index.offsets):
+        positions = decades * len(LOG10_MANTISSA_E[series_key]) + np.asarray(offsets)[merged_positions]
+        below, floor, above = _corrected_neighbours(series_key, flat_values, positions)
+        ceiling = np.where(floor == flat_values, floor, above)
+        nearest = np.where(flat_values - floor <= ceiling - flat_values, floor, ceiling)
+        found[series_key] = Neighbours(floor.reshape(values.shape),
+                                       nearest.reshape(values.shape),
+                                       ceiling.reshape(values.shape))
+    return found
+
+
+def eng_string_array(values, sig_figs=3, prefix=True):
+    """Format values in engineering format.
+
+    Each distinct value is formatted only once.
+
+    Args:
+        values: An array_like of values.
+        sig_figs: As for eseries.eng.eng_string().
+        prefix: As for eseries.eng.eng_string().
+
+    Returns:
+        An array of strings of the same shape as values, containing for each
+        value the same string as eseries.eng.eng_string().
+    """
+    values = np.asarray(values, dtype=float)
+    distinct_values, inverse = np.unique(values.ravel(), return_inverse=True)
+    texts = list(eng_strings(distinct_values.tolist(), sig_figs, prefix))
+    return np.array(texts, dtype=str)[inverse.ravel()].reshape(values.shape)
+
+
+class IntervalArray(_IntervalOperators):
+    """Arrays of nominal values with lower and upper limits.
+
+    IntervalArrays support the same arithmetic as eseries.intervals.Interval,
+    element by element, and may be combined with Intervals and with values.
+
+    Attributes:
+        nominal: An array of nominal values.
+        lower: An array of lower limits.
+        upper: An array of upper limits.
+    """
+
+    __slots__ = ('nominal', 'lower', 'upper')
+
+    _priority = 1
+
+    def __init__(self, nominal, lower, upper):
+        """Initialise an array of intervals from array_likes of the same shape.
+
+        Raises:
+            ValueError: If any nominal value is not between its lower and upper limits inclusive.
+        """
+        nominal, lower, upper = np.broadcast_arrays(*(np.asarray(values, dtype=float)
+                                                      for values in (nominal, lower, upper)))
+        if not np.all((lower <= nominal) & (nominal <= upper)):
+            raise ValueError("Nominal values are not all between their lower and upper limits")
+        self.nominal = nominal
+        self.lower = lower
+        self.upper = upper
+
+    @classmethod
+    def from_series(cls, series_key, nominals):
+        """The intervals for nominal values within the tolerance of a series.
+
+        Args:
+            series_key: The ESeries to use.
+            nominals: An array_like of nominal values. These values need not be
+                members of the specified E-series.
+
+        Returns:
+            An IntervalArray with limits identical to those of
+            lower_tolerance_limit() and upper_tolerance_limit() for each
+            nominal value.
+
+        Raises:
+            ValueError: If series_key is not known.
+        """
+        nominals = np.asarray(nominals, dtype=float)
+        deviations = nominals * tolerance(series_key)
+        return cls(nominals, nominals - deviations, nominals + deviations)
+
+    def __len__(self):
+        return len(self.nominal)
+
+    def __getitem__(self, index):
+        """The interval, or array of intervals, at an index or slice of the arrays."""
+        nominal, lower, upper = self.nominal[index], self.lower[index], self.upper[index]
+        if np.ndim(nominal) == 0:
+            return Interval(float(nominal), float(lower), float(upper))
+        return self._interval(nominal, lower, upper)
+
+    def __repr__(self):
+        return "{}(nominal={!r}, lower={!r}, upper={!r})".format(
+            type(self).__name__, self.nominal, self.lower, self.upper)
+
+    def _interval(self, nominal, lower, upper):
+        intervals = IntervalArray.__new__(IntervalArray)
+        intervals.nominal = nominal
+        intervals.lower = lower
+        intervals.upper = upper
+        return intervals
+
+    @staticmethod
+    def _minimum(values):
+        return reduce(np.minimum, values)
+
+    @staticmethod
+    def _maximum(values):
+        return reduce(np.maximum, values)
+
+    def _contains_zero(self):
+        return np.any((self.lower <= 0) & (0 <= self.upper))
+
+
+def evaluate_intervals_array(expression, parts):
+    """Evaluate the worst-case limits of a circuit expression for arrays of nominal part values.
+
+    Args:
+        expression: A function which accepts one argument for each part, and
+            returns the value of the circuit, using the arithmetic operators
+            and eseries.intervals.parallel().
+        parts: A sequence of (series_key, nominals) pairs, in the order of
+            the arguments of the expression, where nominals is an array_like
+            of nominal values. Arrays for different parts must have the same
+            shape, or shapes which can be broadcast together.
+
+    Returns:
+        An IntervalArray containing, for each set of nominal part values, the
+        nominal value of the expression and its lower and upper limits.
+
+    Raises:
+        ValueError: If any series_key is not known.
+    """
+    return expression(*(IntervalArray.from_series(series_key, nominals) for series_key, nominals in parts))
+
+
+def _neighbours(series_key, values):
+    """Locate query values within a series.
+
+    Returns:
+        A 5-tuple containing the shape of the query values, followed by four
+        flat arrays containing the query values and, for each query value,
+        the series value below the floor value, the floor value (the largest
+        series value less-than or equal-to the query value) and the series
+        value above the floor value.
+    """
+    values = _checked_values(series_key, values)
+    flat_values = values.ravel()
+    series_log = np.asarray(LOG10_MANTISSA_E[series_key])
+    decades, mantissas = np.divmod(np.log10(flat_values), 1.0)
+    indexes = np.searchsorted(series_log, mantissas, side='right') - 1
+    positions = decades.astype(np.int64) * len(series_log) + indexes
+    return (values.shape, flat_values) + _corrected_neighbours(series_key, flat_values, positions)
+
+
+def _corrected_neighbours(series_key, flat_values, positions):
+    """Locate query values, given estimates of their positions from their logarithms. See _neighbours().
+
+    Returns:
+        A 3-tuple of arrays containing, for each query value, the series value
+        below the floor value, the floor value and the series value above the
+        floor value.
+    """
+    table, table_start = _position_table(series_key, positions)
+    # log10 is inexact, so the estimated positions may be out by one either way.
+    table_indexes = positions - table_start
+    table_indexes += table[table_indexes + 1] <= flat_values
+    table_indexes -= table[table_indexes] > flat_values
+    return table[table_indexes - 1], table[table_indexes], table[table_indexes + 1]
+
+
+def _position_table(series_key, positions):
+    """A table of series values covering two positions either side of every given position.
+
+    Returns:
+        A 2-tuple containing an array of series values and the position of its first item.
+    """
+    table = np.frombuffer(_decade_table(series_key), dtype=float)
+    table_start = _table_start_position(series_key)
+    if len(positions) == 0:
+        return table, table_start
+    lowest = int(positions.min()) - 2
+    highest = int(positions.max()) + 2
+    if table_start <= lowest and highest < table_start + len(table):
+        return table, table_start
+    table = np.array([_position_value(series_key, position) for position in range(lowest, highest + 1)],
+                     dtype=float)
+    return table, lowest
+
+
+def _checked_values(series_key, values):
+    series(series_key)
+    values = np.asarray(values, dtype=float)
+    margin = pow(GEOMETRIC_SCALE_E[series_key], 1.5)
+    with np.errstate(over='ignore', invalid='ignore'):
+        bad = ~(np.isfinite(values) & (values / margin >= _MINIMUM_E_VALUE) & np.isfinite(values * margin))
+    if np.any(bad):
+        raise ValueError("Value {} is out of range. Values must be finite and greater than or equal to {}"
+                         .format(values[bad].flat[0], _MINIMUM_E_VALUE * margin))
+    return values
@@ -0,0 +1,138 @@
+"""An optional, bounded, least-recently-used cache for lookup results.
+
+The cache is disabled by default. When enabled it is shared by all threads.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+DEFAULT_CACHE_SIZE = 4096
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+_MISSING = object()
+
+
+class _LRUCache(object):
+    """A thread-safe mapping with a bounded size, which evicts the least-recently-used items."""
+
+    def __init__(self, maxsize):
+        # Imported here so that the cost is only paid when the cache is enabled
+        import threading
+        self._maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.pop(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+            else:
+                self._items[key] = value
+                self._hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(hits=self._hits,
+                             misses=self._misses,
+                             evictions=self._evictions,
+                             maxsize=self._maxsize,
+                             currsize=len(self._items))
+
+
+_cache = None
+
+
+def enable_cache(maxsize=DEFAULT_CACHE_SIZE):
+    """Cache the results of the find functions and tolerance_limits().
+
+    Any existing cache, and its statistics, are discarded.
+
+    Args:
+        maxsize: The maximum number of results to retain. When the cache
+            is full, the least-recently-used result is evicted.
+
+    Raises:
+        ValueError: If maxsize is less than one.
+    """
+    global _cache
+    if maxsize < 1:
+        raise ValueError("Cache maxsize {} is not at least one".format(maxsize))
+    _cache = _LRUCache(maxsize)
+
+
+def disable_cache():
+    """Stop caching results, and discard the cache."""
+    global _cache
+    _cache = None
+
+
+def clear_cache():
+    """Discard all cached results and reset the cache statistics.
+
+    Has no effect if the cache is not enabled.
+    """
+    cache = _cache
+    if cache is not None:
+        cache.clear()
+
+
+def cache_info():
+    """Statistics for the cache.
+
+    Returns:
+        A CacheInfo named tuple with hits, misses, evictions, maxsize and
+        currsize attributes, or None if the cache is not enabled.
+    """
+    cache = _cache
+    if cache is None:
+        return None
+    return cache.info()
+
+
+def memoized(function):
+    """Decorate a function so its results are cached, when the cache is enabled.
+
+    Results are keyed on the function and its arguments. Calls with
+    unhashable arguments, and calls which raise exceptions, are not cached.
+    """
+    @wraps(function)
+    def memoized_function(*args, **kwargs):
+        cache = _cache
+        if cache is None:
+            return function(*args, **kwargs)
+        key = (function.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            result = cache.get(key)
+        except TypeError:
+            return function(*args, **kwargs)
+        if result is _MISSING:
+            result = function(*args, **kwargs)
+            cache.put(key, result)
+        return result
+
+    return memoized_function
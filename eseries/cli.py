@@ -5,11 +5,6 @@ from __future__ import division
 from __future__ import unicode_literals
 
 from builtins import int
-try:
-    from future import standard_library
-    standard_library.install_aliases()
-except ImportError:
-    pass
 import os
 import sys
 
@@ -17,6 +12,8 @@ import docopt
 import docopt_subcommands as dsc
 
 from eseries.eng import eng_string
+from eseries.instrumentation import enable_instrumentation, disable_instrumentation, dump_instrumentation
+from eseries.parse import parse_value
 from eseries.version import __version__
 from eseries.eseries import series_key_from_name, find_nearest, find_nearest_few, find_greater_than_or_equal, \
     find_greater_than, find_less_than, find_less_than_or_equal, tolerance, series, erange, lower_tolerance_limit, \
@@ -29,6 +26,8 @@ Usage: {program} [options] <command> [<args> ...]
 Options:
   -h --help     Show this screen.
   -v --verbose  Use verbose logging
+  --profile     Print the calls to, and time spent in, eseries functions
+                to stderr as JSON.
 
 Available commands:
   {available_commands}
@@ -39,107 +38,96 @@ See '{program} help <command>' for help on specific commands.
 
 @dsc.command()
 def handle_nearest(precommand, args):
-    """usage: {program} nearest <e-series> <value> [--symbol]
+    """usage: {program} nearest <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The nearest value in an E-Series.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    nearest = find_nearest(series_key, value)
-    nearest_text = present_value(args, nearest)
-    print(nearest_text)
-    return os.EX_OK
+    return present_results(args, lambda value: (find_nearest(series_key, value),))
 
 
 @dsc.command()
 def handle_nearby(precommand, args):
-    """usage: {program} nearby <e-series> <value> [--symbol]
+    """usage: {program} nearby <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     At least three nearby values in an E-Series, and least one of
     which will be less-than the given value, and at least one
-    greater-than the given value.
+    greater-than the given value. When reading values from standard
+    input or a file, the values nearby each are printed on one line,
+    separated by tabs.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    nearby_few = find_nearest_few(series_key, value)
-    for item in nearby_few:
-        item_text = present_value(args, item)
-        print(item_text)
-    return os.EX_OK
+    return present_results(args, lambda value: find_nearest_few(series_key, value))
 
 
 @dsc.command()
 def handle_gt(precommand, args):
-    """usage: {program} gt <e-series> <value> [--symbol]
+    """usage: {program} gt <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The largest value greater-than the given value.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    nearest = find_greater_than(series_key, value)
-    nearest_text = present_value(args, nearest)
-    print(nearest_text)
-    return os.EX_OK
+    return present_results(args, lambda value: (find_greater_than(series_key, value),))
 
 
 @dsc.command()
 def handle_ge(precommand, args):
-    """usage: {program} ge <e-series> <value> [--symbol]
+    """usage: {program} ge <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The largest value greater-than or equal-to the given value.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    nearest = find_greater_than_or_equal(series_key, value)
-    nearest_text = present_value(args, nearest)
-    print(nearest_text)
-    return os.EX_OK
+    return present_results(args, lambda value: (find_greater_than_or_equal(series_key, value),))
 
 
 @dsc.command()
 def handle_lt(precommand, args):
-    """usage: {program} lt <e-series> <value> [--symbol]
+    """usage: {program} lt <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The largest value less-than the given value.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    nearest = find_less_than(series_key, value)
-    nearest_text = present_value(args, nearest)
-    print(nearest_text)
-    return os.EX_OK
+    return present_results(args, lambda value: (find_less_than(series_key, value),))
 
 
 @dsc.command()
 def handle_le(precommand, args):
-    """usage: {program} le <e-series> <value> [--symbol]
+    """usage: {program} le <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The largest value less-than or equal-to the given value.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    nearest = find_less_than_or_equal(series_key, value)
-    nearest_text = present_value(args, nearest)
-    print(nearest_text)
-    return os.EX_OK
+    return present_results(args, lambda value: (find_less_than_or_equal(series_key, value),))
 
 
 @dsc.command()
@@ -195,60 +183,128 @@ def handle_range(precommand, args):
 
 @dsc.command()
 def handle_lower_tolerance_limit(precommand, args):
-    """usage: {program} lower-tolerance-limit <e-series> <value> [--symbol]
+    """usage: {program} lower-tolerance-limit <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The lower tolerance limit of a nominal value given the tolerance
     of the specified E-Series.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    lower = lower_tolerance_limit(series_key, value)
-    lower_text = present_value(args, lower)
-    print(lower_text)
-    return os.EX_OK
+    return present_results(args, lambda value: (lower_tolerance_limit(series_key, value),))
 
 
 @dsc.command()
 def handle_upper_tolerance_limit(precommand, args):
-    """usage: {program} upper-tolerance-limit <e-series> <value> [--symbol]
+    """usage: {program} upper-tolerance-limit <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The upper tolerance limit of a nominal value given the tolerance
     of the specified E-Series.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
-    value = extract_value(args)
-    upper = upper_tolerance_limit(series_key, value)
-    upper_text = present_value(args, upper)
-    print(upper_text)
-    return os.EX_OK
+    return present_results(args, lambda value: (upper_tolerance_limit(series_key, value),))
 
 
 @dsc.command()
 def handle_tolerance_limits(precommand, args):
-    """usage: {program} tolerance-limits <e-series> <value> [--symbol]
+    """usage: {program} tolerance-limits <e-series> (<value> | --stdin | --file=<path>) [--symbol]
 
     The upper and lower tolerance limits of a nominal value given the
-    tolerance of the specified E-Series.
+    tolerance of the specified E-Series. When reading values from
+    standard input or a file, the limits for each are printed on one
+    line, separated by a tab.
 
     Options:
-      -s --symbol  Use the SI magnitude prefix symbol.
+      -s --symbol    Use the SI magnitude prefix symbol.
+      --stdin        Read values from standard input, one per line.
+      --file=<path>  Read values from a file, one per line.
     """
     series_key = extract_series_key(args)
+    return present_results(args, lambda value: tolerance_limits(series_key, value))
+
+
+@dsc.command()
+def handle_serve(precommand, args):
+    """usage: {program} serve [--host=<host>] [--port=<port>] [--batch-size=<size>] [--latency=<ms>]
+
+    Serve the lookup, range and tolerance functions over HTTP, with
+    arguments and results as JSON. Lookups which arrive concurrently
+    are coalesced into batches.
+
+    Options:
+      --host=<host>        The address on which to listen [default: 127.0.0.1].
+      --port=<port>        The port on which to listen [default: 8024].
+      --batch-size=<size>  The largest number of values looked up at once [default: 1024].
+      --latency=<ms>       The longest time, in milliseconds, for which a value
+                           waits for others to join its batch [default: 2].
+    """
+    # Imported here so that the cost of asyncio is only paid when serving
+    from eseries.server import serve
+    serve(host=args['--host'],
+          port=int(args['--port']),
+          max_batch_size=int(args['--batch-size']),
+          max_latency=float(args['--latency']) / 1000)
+    return os.EX_OK
+
+
+def present_results(args, compute):
+    """Print the results computed for the value argument, or for each value of a batch.
+
+    Args:
+        args: The parsed command-line arguments.
+        compute: A function which accepts a single value and returns a
+            sequence of result values.
+
+    Returns:
+        An exit code.
+    """
+    if args['--stdin']:
+        return present_batch_results(args, compute, sys.stdin)
+    if args['--file'] is not None:
+        with open(args['--file']) as lines:
+            return present_batch_results(args, compute, lines)
     value = extract_value(args)
-    lower, upper = tolerance_limits(series_key, value)
-    lower_text = present_value(args, lower)
-    upper_text = present_value(args, upper)
-    print(lower_text)
-    print(upper_text)
+    for item in compute(value):
+        print(present_value(args, item))
     return os.EX_OK
 
 
+def present_batch_results(args, compute, lines):
+    """Print the results computed for each value in an iterable series of lines.
+
+    The results for each line are printed on a single line, separated by
+    tabs, so output lines correspond to input lines. Blank lines are passed
+    through. A line which cannot be processed produces a blank output line
+    and an error message on stderr, and processing continues. Each output
+    line is flushed once it is written.
+
+    Returns:
+        os.EX_OK if all lines were processed successfully, otherwise os.EX_DATAERR.
+    """
+    exit_code = os.EX_OK
+    for line_number, line in enumerate(lines, start=1):
+        text = line.strip()
+        results = ()
+        if text:
+            try:
+                results = compute(interpret_value(text))
+            except ValueError as exc:
+                print("Line {}: {}".format(line_number, exc), file=sys.stderr)
+                exit_code = os.EX_DATAERR
+        print('\t'.join(present_value(args, item) for item in results))
+        # Stream the results, even when stdout is a pipe and so is block-buffered
+        sys.stdout.flush()
+    return exit_code
+
+
 def present_value(args, nearest):
     return eng_string(nearest, prefix=args['--symbol'])
 
@@ -260,16 +316,43 @@ def extract_series_key(args):
 
 
 def extract_value(args, name='<value>'):
-    text_value = args[name]
+    return interpret_value(args[name], name[1:-1])
+
+
+def interpret_value(text_value, description='value'):
     try:
-        value = float(text_value)
+        value = parse_value(text_value)
     except ValueError:
         raise ValueError("{!r} could not be interpreted as an E-Series {}".format(
-            text_value, name[1:-1]))
+            text_value, description))
     return value
 
 
 def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    profile = profile_requested(argv)
+    if profile:
+        enable_instrumentation()
+    try:
+        return run(argv)
+    finally:
+        if profile:
+            dump_instrumentation(sys.stderr)
+            disable_instrumentation()
+
+
+def profile_requested(argv):
+    """Whether the --profile option precedes the command."""
+    for arg in argv:
+        if not arg.startswith('-'):
+            return False
+        if arg == '--profile':
+            return True
+    return False
+
+
+def run(argv):
     try:
         return dsc.main(
             program='eseries',
@@ -282,6 +365,9 @@ def main(argv=None):
     except ValueError as exc:
         print(exc, file=sys.stderr)
         return os.EX_DATAERR
+    except EnvironmentError as exc:
+        print(exc, file=sys.stderr)
+        return os.EX_NOINPUT
 
 
 if __name__ == '__main__':
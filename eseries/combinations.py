@@ -0,0 +1,218 @@
+"""Pairs of E-series values which, combined in series or in parallel, approximate a target value.
+
+For example, to find the pairs of E96 resistors which best approximate 1234
+ohms:
+
+    >>> from eseries import E96
+    >>> from eseries.combinations import find_combinations
+    >>> find_combinations(E96, 1234)
+    [Combination(topology='series', first=536.0, second=698.0, value=1234.0, error=0.0)]
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+from collections import namedtuple, OrderedDict
+from math import log10, floor
+
+from eseries.eseries import open_erange, series, _UNREGISTER_HOOKS
+
+SERIES = 'series'
+PARALLEL = 'parallel'
+TOPOLOGIES = (SERIES, PARALLEL)
+
+Combination = namedtuple('Combination', ['topology', 'first', 'second', 'value', 'error'])
+Combination.__doc__ = """A pair of series values combined in series or in parallel.
+
+Attributes:
+    topology: Either SERIES or PARALLEL.
+    first: The smaller of the two values.
+    second: The larger of the two values.
+    value: The value of the combination.
+    error: The relative error of the combined value with respect to
+        the target value. Negative if the combined value is too small.
+"""
+
+# Sorted tables of series values, keyed by (series_key, first_decade, last_decade),
+# from the least to the most recently used.
+_TABLES = OrderedDict()
+
+# The maximum number of tables which are retained
+MAX_TABLES = 64
+
+# The largest decade from which values may be drawn, so that the end of
+# the range of values, 10 ** (decade + 1), is a float.
+_MAXIMUM_DECADE = 307
+
+
+def find_combinations(series_key, target, num=1, decades=1, topologies=TOPOLOGIES):
+    """Find the pairs of series values which best approximate a target value.
+
+    Args:
+        series_key: An E-Series key such as E96.
+        target: The target value of the combination.
+        num: The maximum number of combinations to find.
+        decades: The parts are drawn from values within this many decades
+            either side of the target value.
+        topologies: An iterable containing SERIES, PARALLEL or both.
+
+    Returns:
+        A list of up to num Combinations, ordered from the smallest to the
+        largest absolute error.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If target is not finite and positive.
+        ValueError: If the values within decades of target would be out of range.
+        ValueError: If num or decades is less than one.
+        ValueError: If topologies contains an unknown topology.
+    """
+    topologies = _check_arguments(series_key, num, decades, topologies)
+    return _find_combinations(series_key, target, num, decades, topologies)
+
+
+def find_combinations_batch(series_key, targets, num=1, decades=1, topologies=TOPOLOGIES):
+    """Find the pairs of series values which best approximate each of many target values.
+
+    The tables of series values are shared between targets in the same decade.
+
+    Args:
+        series_key: An E-Series key such as E96.
+        targets: An iterable series of target values.
+        num: The maximum number of combinations to find for each target.
+        decades: The parts are drawn from values within this many decades
+            either side of each target value.
+        topologies: An iterable containing SERIES, PARALLEL or both.
+
+    Yields:
+        For each target, in order, a list of up to num Combinations ordered
+        from the smallest to the largest absolute error.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If any target is not finite and positive.
+        ValueError: If the values within decades of any target would be out of range.
+        ValueError: If num or decades is less than one.
+        ValueError: If topologies contains an unknown topology.
+    """
+    topologies = _check_arguments(series_key, num, decades, topologies)
+    for target in targets:
+        yield _find_combinations(series_key, target, num, decades, topologies)
+
+
+def _check_arguments(series_key, num, decades, topologies):
+    series(series_key)
+    if num < 1:
+        raise ValueError("num {} is not at least one".format(num))
+    if decades < 1:
+        raise ValueError("decades {} is not at least one".format(decades))
+    topologies = tuple(topologies)
+    for topology in topologies:
+        if topology not in TOPOLOGIES:
+            raise ValueError("Topology {!r} is not one of {}".format(topology, ', '.join(TOPOLOGIES)))
+    return topologies
+
+
+def _find_combinations(series_key, target, num, decades, topologies):
+    if math.isnan(target) or math.isinf(target) or target <= 0:
+        raise ValueError("Target value {} is not finite and positive".format(target))
+    if int(floor(log10(target))) + decades > _MAXIMUM_DECADE:
+        raise ValueError("Target value {} is out of range for values within {} decades".format(target, decades))
+    values = _table(series_key, target, decades)
+    low = bisect_left(values, target / 10 ** decades)
+    high = bisect_right(values, target * 10 ** decades)
+    candidates = []
+    if SERIES in topologies:
+        candidates.extend(_nearest_pairs(values, low, high, target, num, SERIES))
+    if PARALLEL in topologies:
+        candidates.extend(_nearest_pairs(values, low, high, target, num, PARALLEL))
+    candidates.sort(key=lambda combination: abs(combination.error))
+    return candidates[:num]
+
+
+def _table(series_key, target, decades):
+    target_decade = int(floor(log10(target)))
+    key = (series_key, target_decade - decades, target_decade + decades)
+    try:
+        table = _TABLES.pop(key)
+    except KeyError:
+        _, first_decade, last_decade = key
+        table = tuple(open_erange(series_key, 10.0 ** first_decade, 10.0 ** (last_decade + 1)))
+        while len(_TABLES) >= MAX_TABLES:
+            _TABLES.popitem(last=False)
+    _TABLES[key] = table
+    return table
+
+
+def _nearest_pairs(values, low, high, target, num, topology):
+    """Find the num pairs (values[i], values[j]), low <= i <= j < high, which best combine to target.
+
+    For each first value there is an ideal partner value. Searching outwards
+    from the position of the ideal partner, in either direction, gives
+    combinations of monotonically increasing error, so the best pairs
+    overall are found by merging these sequences with a heap.
+    """
+    combine = _COMBINE[topology]
+    ideal_partner = _IDEAL_PARTNER[topology]
+
+    def entry(i, j, step):
+        value = combine(values[i], values[j])
+        error = (value - target) / target
+        return abs(error), i, j, step, value, error
+
+    heap = []
+    j = high
+    for i in range(low, high):
+        ideal = ideal_partner(values[i], target)
+        # The ideal partner decreases as the first value increases, so the
+        # partner positions can be found by moving a single pointer downwards.
+        while j > i and values[j - 1] >= ideal:
+            j -= 1
+        partner = max(i, j)
+        if partner < high:
+            heap.append(entry(i, partner, +1))
+        if partner - 1 >= i:
+            heap.append(entry(i, partner - 1, -1))
+    heapq.heapify(heap)
+
+    pairs = []
+    while heap and len(pairs) < num:
+        _, i, j, step, value, error = heapq.heappop(heap)
+        pairs.append(Combination(topology, values[i], values[j], value, error))
+        if i <= j + step < high:
+            heapq.heappush(heap, entry(i, j + step, step))
+    return pairs
+
+
+def _series_combination(first, second):
+    return first + second
+
+
+def _parallel_combination(first, second):
+    return first * second / (first + second)
+
+
+def _series_partner(first, target):
+    return target - first
+
+
+def _parallel_partner(first, target):
+    return first * target / (first - target) if first > target else float('inf')
+
+
+_COMBINE = {SERIES: _series_combination, PARALLEL: _parallel_combination}
+
+_IDEAL_PARTNER = {SERIES: _series_partner, PARALLEL: _parallel_partner}
+
+
+def _forget_series(series_key):
+    """Discard the tables of an unregistered series."""
+    for key in [key for key in _TABLES if key[0] is series_key]:
+        _TABLES.pop(key, None)
+
+
+_UNREGISTER_HOOKS.append(_forget_series)
@@ -0,0 +1,195 @@
+"""Pairs of E-series values for resistive dividers with a target ratio.
+
+A divider comprises an upper resistor, R1, and a lower resistor, R2, and is
+characterised here by the ratio R1 / R2. For a divider with an input voltage
+across both resistors and an output voltage across R2, or for the feedback
+divider of a regulator with an output voltage and a reference voltage, use
+divider_ratio() to compute the ratio.
+
+For example, to find E24 resistors for the feedback divider of a regulator
+with a 0.8 V reference and a 3.3 V output:
+
+    >>> from eseries import E24
+    >>> from eseries.dividers import find_dividers, divider_ratio
+    >>> find_dividers(E24, divider_ratio(3.3, 0.8))
+    [Divider(r1=7.5, r2=2.4, ratio=3.125, error=2.842170943040402e-16, worst_case_error=0.10526315789473717)]
+
+The values of R1 and R2 are returned with R2 between 1 and 10. Both may be
+multiplied by the same power of ten to obtain the required impedance.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+from eseries.eseries import series, tolerance, LOG10_MANTISSA_E, _SERIES_DECADE, _scaled_value, _UNREGISTER_HOOKS
+from eseries.tables import cached_tables
+
+Divider = namedtuple('Divider', ['r1', 'r2', 'ratio', 'error', 'worst_case_error'])
+Divider.__doc__ = """A pair of series values for a divider.
+
+Attributes:
+    r1: The upper resistor.
+    r2: The lower resistor, between 1 and 10.
+    ratio: The ratio r1 / r2.
+    error: The relative error of the ratio with respect to the target
+        ratio. Negative if the ratio is too small.
+    worst_case_error: The largest absolute relative error of the ratio
+        with respect to the target ratio, when each resistor may deviate
+        from its nominal value by the tolerance of the series.
+"""
+
+# For each series key, a 2-tuple containing a sorted array of the mantissas
+# of log10(a / b) for every pair of series values a and b, and an array of
+# codes identifying the pairs, as index(a) * len(series) + index(b).
+_RATIO_TABLES = {}
+
+
+def divider_ratio(input_voltage, output_voltage):
+    """The ratio R1 / R2 of a divider.
+
+    Args:
+        input_voltage: The voltage across both R1 and R2. For a regulator
+            feedback divider, this is the regulated output voltage.
+        output_voltage: The voltage across R2. For a regulator feedback
+            divider, this is the reference voltage.
+
+    Returns:
+        The ratio R1 / R2.
+
+    Raises:
+        ValueError: If output_voltage is not between zero and input_voltage.
+    """
+    if not 0 < output_voltage < input_voltage:
+        raise ValueError("Output voltage {} is not between zero and the input voltage {}"
+                         .format(output_voltage, input_voltage))
+    return input_voltage / output_voltage - 1
+
+
+def find_dividers(series_key, ratio, num=1):
+    """Find the pairs of series values with a ratio nearest to the target ratio.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        ratio: The target ratio R1 / R2.
+        num: The maximum number of pairs to find.
+
+    Returns:
+        A list of num Dividers, ordered from the smallest to the largest
+        absolute error.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If ratio is not finite and positive.
+        ValueError: If num is less than one.
+    """
+    _check_arguments(series_key, num)
+    return _find_dividers(series_key, ratio, num)
+
+
+def find_dividers_batch(series_key, ratios, num=1):
+    """Find the pairs of series values with ratios nearest to each of many target ratios.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        ratios: An iterable series of target ratios R1 / R2.
+        num: The maximum number of pairs to find for each ratio.
+
+    Yields:
+        For each target ratio, in order, a list of num Dividers ordered
+        from the smallest to the largest absolute error.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If any ratio is not finite and positive.
+        ValueError: If num is less than one.
+    """
+    _check_arguments(series_key, num)
+    for ratio in ratios:
+        yield _find_dividers(series_key, ratio, num)
+
+
+def _check_arguments(series_key, num):
+    series(series_key)
+    if num < 1:
+        raise ValueError("num {} is not at least one".format(num))
+
+
+def _find_dividers(series_key, ratio, num):
+    if math.isnan(ratio) or math.isinf(ratio) or ratio <= 0:
+        raise ValueError("Ratio {} is not finite and positive".format(ratio))
+    mantissas, codes = _ratio_table(series_key)
+    log_ratio = math.log10(ratio)
+    decade = int(math.floor(log_ratio))
+    # Search outwards from the target mantissa in both directions, taking
+    # whichever candidate has the smaller error. Stepping off either end of
+    # the table continues at the other end, in the adjacent decade, so the
+    # search visits each pair of values once in every decade.
+
+    def candidate(position):
+        table_decade, index = divmod(position, len(mantissas))
+        return _divider(series_key, codes[index], decade + table_decade, ratio)
+
+    above = bisect_left(mantissas, log_ratio - decade)
+    below = above - 1
+    above_candidate = candidate(above)
+    below_candidate = candidate(below)
+    dividers = []
+    while len(dividers) < num:
+        if abs(below_candidate.error) <= abs(above_candidate.error):
+            dividers.append(below_candidate)
+            below -= 1
+            below_candidate = candidate(below)
+        else:
+            dividers.append(above_candidate)
+            above += 1
+            above_candidate = candidate(above)
+    return dividers
+
+
+def _divider(series_key, code, ratio_decade, target_ratio):
+    """The divider for a pair of values with a ratio in the given decade."""
+    series_values = series(series_key)
+    series_decade = _SERIES_DECADE[series_key]
+    upper_index, lower_index = divmod(code, len(series_values))
+    r1_decade = ratio_decade + (1 if upper_index < lower_index else 0)
+    r1 = _scaled_value(series_values, series_decade, r1_decade, upper_index)
+    r2 = _scaled_value(series_values, series_decade, 0, lower_index)
+    ratio = r1 / r2
+    tol = tolerance(series_key)
+    lowest_ratio = ratio * (1 - tol) / (1 + tol)
+    highest_ratio = ratio * (1 + tol) / (1 - tol)
+    worst_case_error = max(target_ratio - lowest_ratio, highest_ratio - target_ratio) / target_ratio
+    return Divider(r1, r2, ratio, (ratio - target_ratio) / target_ratio, worst_case_error)
+
+
+def _ratio_table(series_key):
+    try:
+        return _RATIO_TABLES[series_key]
+    except KeyError:
+        logs = LOG10_MANTISSA_E[series_key]
+        num_values = len(logs)
+
+        def build():
+            entries = sorted(((logs[upper_index] - logs[lower_index]) % 1, upper_index * num_values + lower_index)
+                             for upper_index in range(num_values)
+                             for lower_index in range(num_values))
+            return (array('d', (mantissa for mantissa, _ in entries)),
+                    array('l', (code for _, code in entries)))
+
+        table = cached_tables('ratio-{}'.format(series_key.name), (series(series_key),), build)
+        _RATIO_TABLES[series_key] = table
+        return table
+
+
+def _forget_series(series_key):
+    """Discard the ratio table of an unregistered series."""
+    _RATIO_TABLES.pop(series_key, None)
+
+
+_UNREGISTER_HOOKS.append(_forget_series)
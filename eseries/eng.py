@@ -4,18 +4,22 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from builtins import str
 from builtins import int
-try:
-    from future import standard_library
-    standard_library.install_aliases()
-except ImportError:
-    pass
 from math import floor, log10
 
 from eseries.eseries import _round_sig
+from eseries.instrumentation import instrumented
 
 PREFIXES = 'yzafpnum kMGTPEZY'
 
+# The maximum number of distinct values for which eng_strings() retains the
+# formatted text, so that repeated values are formatted only once.
+ENG_STRINGS_MEMO_SIZE = 4096
 
+# Exponent text, such as ' k' or 'e3', keyed by (exp3, prefix)
+_EXPONENT_TEXTS = {}
+
+
+@instrumented
 def eng_string(x, sig_figs=3, prefix=True):
     """
     Returns float/int value <x> formatted in a simplified engineering format -
@@ -44,13 +48,46 @@ def eng_string(x, sig_figs=3, prefix=True):
         if x3 == int(x3):  # prevent from displaying .0
             x3 = int(x3)
 
-    if prefix and (-24 <= exp3 <= 24) and (exp3 != 0):
-        exp3_text = ' ' + PREFIXES[exp3 // 3 + 8]
-    elif exp3 == 0:
-        exp3_text = ''
-    else:
-        exp3_text = 'e' + str(exp3)
-
     t3 = str(x3)
 
-    return ''.join((sign, t3, exp3_text))
\ No newline at end of file
+    return ''.join((sign, t3, _exponent_text(exp3, prefix)))
+
+
+def eng_strings(values, sig_figs=3, prefix=True):
+    """Format many values in engineering format.
+
+    Repeated values, such as the series values in a bill of materials, are
+    formatted only once.
+
+    Args:
+        values: An iterable series of float/int values.
+        sig_figs: As for eng_string().
+        prefix: As for eng_string().
+
+    Yields:
+        For each value, in order, the same string as eng_string().
+    """
+    memo = {}
+    for value in values:
+        try:
+            text = memo[value]
+        except KeyError:
+            text = eng_string(value, sig_figs, prefix)
+            if len(memo) < ENG_STRINGS_MEMO_SIZE:
+                memo[value] = text
+        yield text
+
+
+def _exponent_text(exp3, prefix):
+    key = (exp3, prefix)
+    try:
+        return _EXPONENT_TEXTS[key]
+    except KeyError:
+        if prefix and (-24 <= exp3 <= 24) and (exp3 != 0):
+            exp3_text = ' ' + PREFIXES[exp3 // 3 + 8]
+        elif exp3 == 0:
+            exp3_text = ''
+        else:
+            exp3_text = 'e' + str(exp3)
+        _EXPONENT_TEXTS[key] = exp3_text
+        return exp3_text
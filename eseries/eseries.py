@@ -8,18 +8,19 @@ from builtins import range
 from builtins import map
 from builtins import zip
 from builtins import str
-try:
-    from future import standard_library
-    standard_library.install_aliases()
-except ImportError:
-    pass
-from bisect import bisect_right, bisect_left
+from array import array
+from bisect import bisect_right
 from collections import OrderedDict
 from enum import IntEnum
 
 import math
 from math import log10, floor
 
+from eseries.cache import memoized, clear_cache
+from eseries.instrumentation import instrumented, instrumented_iteration
+from eseries.tables import cached_tables
+from eseries.exact import ExactValue
+
 
 _MINIMUM_E_VALUE = 1e-200
 
@@ -95,9 +96,10 @@ def series_keys():
     """The available series keys.
 
     Note:
-        The series keys returned will be members of the ESeries enumeration.
-        These are useful for programmatic use. For constant values consider
-        using the module aliases E3, E6, E12, etc.
+        The series keys returned will be members of the ESeries enumeration,
+        followed by the keys of any custom series registered with
+        register_series(). These are useful for programmatic use. For
+        constant values consider using the module aliases E3, E6, E12, etc.
 
     Returns:
         A set-like object containing the series-keys.
@@ -112,11 +114,16 @@ def series_key_from_name(name):
         name: The series name as a string, for example 'E24'
 
     Returns:
-        An ESeries object which can be uses as a series_key.
+        An ESeries object which can be uses as a series_key, or the
+        CustomSeries of a custom series registered with register_series().
 
     Raises:
         ValueError: If not such series exists.
     """
+    try:
+        return _CUSTOM_SERIES[name]
+    except KeyError:
+        pass
     try:
         return ESeries[name]
     except KeyError:
@@ -156,17 +163,146 @@ def tolerance(series_key):
 
 
 
+class CustomSeries(object):
+    """The key of a custom series registered with register_series().
+
+    Keys are distinct for each registration, even of the same name.
+
+    Attributes:
+        name: The name of the series.
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.name)
+
+
+# Custom series keys, keyed by name
+_CUSTOM_SERIES = {}
+
+# Functions which are called with the key of each custom series as it is
+# unregistered, to discard anything which other modules derived from it.
+_UNREGISTER_HOOKS = []
+
+
+def register_series(name, values, tolerance, significant_figures=None):
+    """Register a custom series, such as a subset of a series.
+
+    Every function which accepts a series key accepts the key of a
+    registered series.
+
+    Args:
+        name: The name of the series, which must differ from the names of
+            the ESeries and of other registered series.
+        values: An iterable series of values in any decades, such as the
+            values of the parts in stock. Only their significant digits
+            are used, so 4.7, 470 and 4.7e3 are equivalent, and
+            duplicates are ignored.
+        tolerance: The tolerance of the series as a float from zero up to
+            one. For example 0.1 indicates a 10% tolerance.
+        significant_figures: The number of significant figures, from one to
+            three, with which to represent the values. Defaults to the
+            fewest with which all the values can be represented exactly.
+
+    Returns:
+        A CustomSeries which can be used as a series_key.
+
+    Raises:
+        ValueError: If a series with the same name exists.
+        ValueError: If values is empty, or any value is not finite and positive.
+        ValueError: If any value cannot be represented with the number of
+            significant figures.
+        ValueError: If tolerance is not from zero up to one.
+        ValueError: If significant_figures is not from one to three.
+    """
+    if name in _CUSTOM_SERIES or name in ESeries.__members__:
+        raise ValueError("E-series with name {!r} already exists".format(name))
+    if not 0 <= tolerance < 1:
+        raise ValueError("Tolerance {} is not from zero up to one".format(tolerance))
+    if significant_figures is not None and not 1 <= significant_figures <= 3:
+        raise ValueError("Significant figures {} is not from one to three".format(significant_figures))
+
+    mantissas = set()
+    for value in values:
+        mantissa = _integer_mantissa(value, rel_tol=1e-9)
+        if mantissa is None:
+            raise ValueError("Value {} is not finite and positive, with at most three significant figures"
+                             .format(value))
+        mantissas.add(mantissa)
+    if not mantissas:
+        raise ValueError("A series must have at least one value")
+    if significant_figures is None:
+        significant_figures = next(figures for figures in (1, 2, 3)
+                                   if all(mantissa % 10 ** (3 - figures) == 0 for mantissa in mantissas))
+    divisor = 10 ** (3 - significant_figures)
+    if any(mantissa % divisor != 0 for mantissa in mantissas):
+        raise ValueError("Values cannot be represented with {} significant figures".format(significant_figures))
+
+    series_key = CustomSeries(name)
+    series_values = tuple(sorted(mantissa // divisor for mantissa in mantissas))
+    _E[series_key] = series_values
+    _TOLERANCE[series_key] = tolerance
+    LOG10_MANTISSA_E[series_key] = [log10(x) % 1 for x in series_values]
+    # Unlike the standard series, a custom series may have its widest gap
+    # between its last value and the first value of the next decade.
+    GEOMETRIC_SCALE_E[series_key] = max(b / a for a, b in zip(series_values,
+                                                              series_values[1:] + (series_values[0] * 10,)))
+    _SERIES_DECADE[series_key] = significant_figures - 1
+    _CUSTOM_SERIES[name] = series_key
+    _MEMBERSHIP_INDEX.clear()
+    return series_key
+
+
+def unregister_series(series_key):
+    """Remove a custom series registered with register_series().
+
+    Raises:
+        ValueError: If series_key is not the key of a registered custom series.
+    """
+    if _CUSTOM_SERIES.get(getattr(series_key, 'name', None)) is not series_key:
+        raise ValueError("{!r} is not a registered custom series".format(series_key))
+    del _CUSTOM_SERIES[series_key.name]
+    for table in (_E, _TOLERANCE, LOG10_MANTISSA_E, GEOMETRIC_SCALE_E, _SERIES_DECADE, _DECADE_TABLES,
+                  _EXACT_SERIES):
+        table.pop(series_key, None)
+    _MEMBERSHIP_INDEX.clear()
+    for hook in _UNREGISTER_HOOKS:
+        hook(series_key)
+    clear_cache()
+
+
 LOG10_MANTISSA_E = {num: list(map(lambda x: log10(x) % 1, series)) for num, series in _E.items()}
 
 GEOMETRIC_SCALE_E = {num: max(b/a for a, b in zip(series, series[1:])) for num, series in _E.items()}
 
+_SERIES_DECADE = {num: int(log10(series[0])) for num, series in _E.items()}
+
+# The span of decades, commonly used for components, for which tables of series values are built.
+_TABLE_MIN_DECADE = -15
+_TABLE_MAX_DECADE = 12
+
+_DECADE_TABLES = {}
+
+# Series values as mantissas without trailing zeros, and exponents, keyed by series key
+_EXACT_SERIES = {}
 
-def find_greater_than_or_equal(series_key, value):
+# Series keys, from the coarsest to the finest series, keyed by the three-digit
+# integer mantissas of their values, e.g. 470 for 4.7. See _membership_index().
+_MEMBERSHIP_INDEX = {}
+
+
+@memoized
+def find_greater_than_or_equal(series_key, value, exact=False):
     """Find the smallest value greater-than or equal-to the given value.
 
     Args:
         series_key: An E-Series key such as E24.
         value: The query value.
+        exact: If True, return an ExactValue rather than a float.
 
     Returns:
         The smallest value from the specified series which is greater-than
@@ -177,18 +313,21 @@ def find_greater_than_or_equal(series_key, value):
         ValueError: If value is not finite.
         ValueError: If value is out of range.
     """
-    candidates = find_nearest_few(series_key, value, num=3)
-    for candidate in candidates:
-        if candidate >= value:
-            return candidate
+    _check_query_value(series_key, value)
+    position, lower, upper = _locate(series_key, value)
+    if lower == value:
+        return _result(series_key, position, lower, exact)
+    return _result(series_key, position + 1, upper, exact)
 
 
-def find_greater_than(series_key, value):
+@memoized
+def find_greater_than(series_key, value, exact=False):
     """Find the smallest value greater-than or equal-to the given value.
 
     Args:
         series_key: An E-Series key such as E24.
         value: The query value.
+        exact: If True, return an ExactValue rather than a float.
 
     Returns:
         The smallest value from the specified series which is greater-than
@@ -199,18 +338,19 @@ def find_greater_than(series_key, value):
         ValueError: If value is not finite.
         ValueError: If value is out of range.
     """
-    candidates = find_nearest_few(series_key, value, num=3)
-    for candidate in candidates:
-        if candidate > value:
-            return candidate
+    _check_query_value(series_key, value)
+    position, _, upper = _locate(series_key, value)
+    return _result(series_key, position + 1, upper, exact)
 
 
-def find_less_than_or_equal(series_key, value):
+@memoized
+def find_less_than_or_equal(series_key, value, exact=False):
     """Find the largest value less-than or equal-to the given value.
 
     Args:
         series_key: An E-Series key such as E24.
         value: The query value.
+        exact: If True, return an ExactValue rather than a float.
 
     Returns:
         The largest value from the specified series which is less-than
@@ -221,18 +361,19 @@ def find_less_than_or_equal(series_key, value):
         ValueError: If value is not finite.
         ValueError: If value is out of range.
     """
-    candidates = find_nearest_few(series_key, value, num=3)
-    for candidate in reversed(candidates):
-        if candidate <= value:
-            return candidate
+    _check_query_value(series_key, value)
+    position, lower, _ = _locate(series_key, value)
+    return _result(series_key, position, lower, exact)
 
 
-def find_less_than(series_key, value):
+@memoized
+def find_less_than(series_key, value, exact=False):
     """Find the largest value less-than or equal-to the given value.
 
     Args:
         series_key: An E-Series key such as E24.
         value: The query value.
+        exact: If True, return an ExactValue rather than a float.
 
     Returns:
         The largest value from the specified series which is less-than
@@ -243,18 +384,21 @@ def find_less_than(series_key, value):
         ValueError: If value is not finite.
         ValueError: If value is out of range.
     """
-    candidates = find_nearest_few(series_key, value, num=3)
-    for candidate in reversed(candidates):
-        if candidate < value:
-            return candidate
+    _check_query_value(series_key, value)
+    position, lower, _ = _locate(series_key, value)
+    if lower < value:
+        return _result(series_key, position, lower, exact)
+    return _result(series_key, position - 1, _position_value(series_key, position - 1), exact)
 
 
-def find_nearest(series_key, value):
+@memoized
+def find_nearest(series_key, value, exact=False):
     """Find the nearest value.
 
     Args:
         series_key: The ESeries to use.
         value: The value for which the nearest value is to be found.
+        exact: If True, return an ExactValue rather than a float.
 
     Returns:
         The value in the specified E-series closest to value.
@@ -264,16 +408,24 @@ def find_nearest(series_key, value):
         ValueError: If value is not finite.
         ValueError: If value is out of range.
     """
-    return find_nearest_few(series_key, value, num=1)[0]
+    _check_query_value(series_key, value)
+    position, lower, upper = _locate(series_key, value)
+    # Prefer the lower value when equidistant, as find_nearest_few() does
+    if value - lower <= upper - value:
+        return _result(series_key, position, lower, exact)
+    return _result(series_key, position + 1, upper, exact)
 
 
-def find_nearest_few(series_key, value, num=3):
+@instrumented
+@memoized
+def find_nearest_few(series_key, value, num=3, exact=False):
     """Find the nearest values.
 
     Args:
         series_key: The ESeries to use.
         value: The value for which the nearest values are to be found.
         num: The number of nearby values to find: 1, 2 or 3.
+        exact: If True, return ExactValues rather than floats.
 
     Returns:
         A tuple containing num values. With num == 3 it is guaranteed
@@ -288,102 +440,287 @@ def find_nearest_few(series_key, value, num=3):
     """
     if num not in {1, 2, 3}:
         raise ValueError("num {} is not 1, 2 or 3".format(num))
-    start = value / pow(GEOMETRIC_SCALE_E[series_key], 1.5)
-    stop = value * pow(GEOMETRIC_SCALE_E[series_key], 1.5)
-    candidates = tuple(erange(series_key, start, stop))
+    margin = _check_query_value(series_key, value)
+    start = value / margin
+    stop = value * margin
+    position, lower, upper = _locate(series_key, value)
+    # The num nearest values lie within num positions either side of the query value,
+    # and are chosen from those within a window of the series' geometric scale.
+    below = [_position_value(series_key, p) for p in range(position - num + 1, position)]
+    above = [_bounded_position_value(series_key, p) for p in range(position + 2, position + num + 1)]
+    candidates = tuple(candidate for candidate in below + [lower, upper] + above if start <= candidate <= stop)
     nearest = _nearest_n(candidates, value, num)
+    if exact:
+        positions = {_bounded_position_value(series_key, p): p
+                     for p in range(position - num + 1, position + num + 1)}
+        return tuple(_exact_value(series_key, positions[candidate]) for candidate in nearest)
     return nearest
 
 
-def erange(series_key, start, stop):
+@memoized
+def find_k_nearest(series_key, value, k, exact=False):
+    """Find the k nearest values, in order of their distance from the given value on a logarithmic scale.
+
+    Unlike find_nearest_few(), any number of values may be found. The values
+    are found by stepping outwards from the query value, so the cost is
+    proportional to k.
+
+    The distance between values is their ratio, so that the values found are
+    spread evenly either side of the query value, as the series values are.
+    The nearest value may therefore differ from that of find_nearest(),
+    which compares differences, when the query value lies between the
+    arithmetic and geometric means of two adjacent series values.
+
+    Args:
+        series_key: The ESeries to use.
+        value: The value for which the nearest values are to be found.
+        k: The number of values to find, which must be at least one.
+        exact: If True, return ExactValues rather than floats.
+
+    Returns:
+        A tuple containing k values, nearest first. Where two values are
+        equidistant from the query value, the lower is first. Fewer than k
+        values are only returned if the range of floats is exhausted.
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If k is not a positive integer.
+        ValueError: If value is not finite.
+        ValueError: If value is out of range.
+    """
+    _check_k(k)
+    _check_query_value(series_key, value)
+    return _k_nearest(series_key, value, k, exact)
+
+
+def find_k_nearest_batch(series_key, values, k, exact=False):
+    """Find the k nearest values for each of many values.
+
+    Args:
+        series_key: The ESeries to use.
+        values: An iterable series of values for which the nearest values
+            are to be found.
+        k: The number of values to find for each value, which must be at
+            least one.
+        exact: If True, yield tuples of ExactValues rather than floats.
+
+    Yields:
+        For each value, in order, the same tuple as find_k_nearest().
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If k is not a positive integer.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    series(series_key)
+    _check_k(k)
+    for value in values:
+        _check_query_value(series_key, value)
+        yield _k_nearest(series_key, value, k, exact)
+
+
+def _check_k(k):
+    if not (isinstance(k, int) and k >= 1):
+        raise ValueError("k {} is not a positive integer".format(k))
+
+
+def _k_nearest(series_key, value, k, exact):
+    """The k nearest values, merged from the values below and above the query value in order of their ratio to it."""
+    below_position, below, above = _locate(series_key, value)
+    above_position = below_position + 1
+    nearest = []
+    while len(nearest) < k:
+        below_available = below >= _MINIMUM_E_VALUE
+        above_available = not math.isinf(above)
+        if below_available and (not above_available or value / below <= above / value):
+            nearest.append(_result(series_key, below_position, below, exact))
+            below_position -= 1
+            below = _position_value(series_key, below_position)
+        elif above_available:
+            nearest.append(_result(series_key, above_position, above, exact))
+            above_position += 1
+            above = _bounded_position_value(series_key, above_position)
+        else:
+            break
+    return tuple(nearest)
+
+
+@instrumented_iteration
+def erange(series_key, start, stop, reverse=False, step=1, exact=False):
     """Generate  E values in a range inclusive of the start and stop values.
 
     Args:
         series_key: The ESeries to use.
         start: The beginning of the range. The yielded values may include this value.
         stop: The end of the range. The yielded values may include this value.
+        reverse: If True, yield values from highest to lowest.
+        step: Yield only every step-th value, beginning with the first value
+            yielded, which is the lowest value, or the highest value if
+            reverse is True.
+        exact: If True, yield ExactValues rather than floats.
 
     Yields:
         Values from the specified range which lie between the start and stop
-        values inclusively, and in order from lowest to highest.
+        values inclusively, and in order from lowest to highest, unless
+        reverse is True.
 
     Raises:
         ValueError: If series_key is not known.
         ValueError: If start is not less-than or equal-to stop.
         ValueError: If start or stop are not both finite.
         ValueError: If start or stop are out of range.
+        ValueError: If step is not a positive integer.
     """
-    if math.isinf(start):
-        raise ValueError("Start value {} is not finite".format(start))
-    if math.isinf(stop):
-        raise ValueError("Stop value {} is not finite".format(stop))
-    if start < _MINIMUM_E_VALUE:
-        raise ValueError("{} is too small. The start value must greater than or equal to {}".format(stop, _MINIMUM_E_VALUE))
-    if stop < _MINIMUM_E_VALUE:
-        raise ValueError("{} is too small. The stop value must greater than or equal to {}".format(stop, _MINIMUM_E_VALUE))
-    if not start <= stop:
-        raise ValueError("Start value {} must be less than stop value {}".format(start, stop))
-
-    return _erange(series_key, start, stop)
-
+    _check_range(series_key, start, stop, step)
+    first, lower, _ = _locate(series_key, start)
+    if lower < start:
+        first += 1
+    last, _, _ = _locate(series_key, stop)
+    return _position_range(series_key, first, last, reverse, step, exact)
 
-def _erange(series_key, start, stop):
-    series_values = series(series_key)
-    series_log = LOG10_MANTISSA_E[series_key]
-    epsilon = (series_log[-1] - series_log[-2]) / 2
-    start_log = log10(start) - epsilon
-    start_decade, start_mantissa = _decade_mantissa(start_log)
-    start_index = bisect_left(series_log, start_mantissa)
-    if start_index == len(series_log):
-        # Wrap to next decade
-        start_decade += 1
-        start_index = 0
-    stop_log = log10(stop) + epsilon
-    stop_decade, stop_mantissa = _decade_mantissa(stop_log)
-    stop_index = bisect_right(series_log, stop_mantissa)
-    assert stop_index != 0
-    series_decade = int(log10(series_values[0]))
-    for decade in range(start_decade, stop_decade + 1):
-        index_begin = start_index if decade == start_decade else 0
-        index_end = stop_index if decade == stop_decade else len(series_log)
-        for index in range(index_begin, index_end):
-            found = series_values[index]
-            scale_exponent = decade - series_decade
-            result = found * math.pow(10, scale_exponent)
-            rounded_result = _round_sig(result, figures=series_decade + 1)
-            if start <= rounded_result <= stop:
-                yield rounded_result
 
-
-def open_erange(series_key, start, stop):
+@instrumented_iteration
+def open_erange(series_key, start, stop, reverse=False, step=1, exact=False):
     """Generate E values in a half-open range inclusive of start, but exclusive of stop.
 
     Args:
         series_key: The ESeries to use.
         start: The beginning of the range. The yielded values may include this value.
         stop: The end of the range. The yielded values will not include this value.
+        reverse: If True, yield values from highest to lowest.
+        step: Yield only every step-th value, beginning with the first value
+            yielded, which is the lowest value, or the highest value if
+            reverse is True.
+        exact: If True, yield ExactValues rather than floats.
 
     Yields:
         Values from the specified range which lie in the half-open range defined by
-        the start and stop values, from lowest to highest.
+        the start and stop values, from lowest to highest, unless reverse is True.
 
     Raises:
         ValueError: If series_key is not known.
         ValueError: If start is not less-than or equal-to stop.
         ValueError: If start or stop are not both finite.
         ValueError: If start or stop are out of range.
+        ValueError: If step is not a positive integer.
     """
+    _check_range(series_key, start, stop, step)
+    first, lower, _ = _locate(series_key, start)
+    if lower < start:
+        first += 1
+    last, lower, _ = _locate(series_key, stop)
+    if lower == stop:
+        last -= 1
+    return _position_range(series_key, first, last, reverse, step, exact)
+
+
+def _check_range(series_key, start, stop, step):
+    series(series_key)
     if math.isinf(start):
         raise ValueError("Start value {} is not finite".format(start))
     if math.isinf(stop):
         raise ValueError("Stop value {} is not finite".format(stop))
     if start < _MINIMUM_E_VALUE:
-        raise ValueError("{} is too small. The start value must greater than or equal to {}".format(stop, _MINIMUM_E_VALUE))
+        raise ValueError("{} is too small. The start value must greater than or equal to {}".format(start, _MINIMUM_E_VALUE))
     if stop < _MINIMUM_E_VALUE:
         raise ValueError("{} is too small. The stop value must greater than or equal to {}".format(stop, _MINIMUM_E_VALUE))
     if not start <= stop:
         raise ValueError("Start value {} must be less than stop value {}".format(start, stop))
-    return (item for item in erange(series_key, start, stop) if item != stop)
+    if not (isinstance(step, int) and step >= 1):
+        raise ValueError("Step {} is not a positive integer".format(step))
+
+
+def _position_range(series_key, first, last, reverse, step, exact=False):
+    """An iterator over the series values at positions from first to last inclusive. See _locate()."""
+    if last < first:
+        return iter(())
+    if exact:
+        positions = range(last, first - 1, -step) if reverse else range(first, last + 1, step)
+        return _exact_erange(series_key, positions)
+    table = _decade_table(series_key)
+    table_start = _table_start_position(series_key)
+    if table_start <= first and last < table_start + len(table):
+        # Slicing the compact table of floats is much faster than indexing it per value
+        begin = first - table_start
+        end = last - table_start
+        if reverse:
+            return iter(table[end:begin - 1 if begin > 0 else None:-step])
+        return iter(table[begin:end + 1:step])
+    positions = range(last, first - 1, -step) if reverse else range(first, last + 1, step)
+    return _erange(series_key, positions)
+
+
+@instrumented_iteration
+def _erange(series_key, positions):
+    """Generate the series values at a range of positions, which may lie beyond the decade table.
+
+    Positions are visited decade by decade, so the power of ten for scaling is
+    computed once per decade rather than once per value.
+    """
+    series_values = _E[series_key]
+    series_decade = _SERIES_DECADE[series_key]
+    num_values = len(series_values)
+    scale_decade = None
+    for position in positions:
+        decade, index = divmod(position, num_values)
+        if decade != scale_decade:
+            scale_decade = decade
+            scale_exponent = decade - series_decade
+            scale = 10 ** abs(scale_exponent)
+        found = series_values[index]
+        yield float(found * scale) if scale_exponent >= 0 else found / scale
+
+
+def _exact_erange(series_key, positions):
+    """Generate the series values at a range of positions as ExactValues."""
+    mantissas, shifts = _exact_series(series_key)
+    series_decade = _SERIES_DECADE[series_key]
+    num_values = len(mantissas)
+    from_normalized = ExactValue._from_normalized
+    for position in positions:
+        decade, index = divmod(position, num_values)
+        yield from_normalized(mantissas[index], decade - series_decade + shifts[index])
+
+
+def _exact_value(series_key, position):
+    """The series value at a position as an ExactValue. See _locate()."""
+    mantissas, shifts = _exact_series(series_key)
+    decade, index = divmod(position, len(mantissas))
+    return ExactValue._from_normalized(mantissas[index], decade - _SERIES_DECADE[series_key] + shifts[index])
+
+
+def _exact_series(series_key):
+    """The series values without trailing zeros, and the number of trailing zeros of each.
+
+    Returns:
+        A 2-tuple of a tuple of mantissas and a tuple of exponents.
+    """
+    try:
+        return _EXACT_SERIES[series_key]
+    except KeyError:
+        values = [ExactValue(series_value) for series_value in series(series_key)]
+        exact_series = (tuple(value.mantissa for value in values), tuple(value.exponent for value in values))
+        _EXACT_SERIES[series_key] = exact_series
+        return exact_series
+
+
+def _result(series_key, position, value, exact):
+    """The series value at a position, as an ExactValue if exact is True, otherwise as the float value."""
+    return _exact_value(series_key, position) if exact else value
+
+
+def _scaled_value(series_values, series_decade, decade, index):
+    """The series value at index, scaled into the decade [10**decade, 10**(decade + 1)).
+
+    Integer arithmetic is used, so the result is the float closest to the exact
+    scaled value without any need for rounding to significant figures.
+    """
+    found = series_values[index]
+    scale_exponent = decade - series_decade
+    if scale_exponent >= 0:
+        return float(found * 10 ** scale_exponent)
+    return found / 10 ** -scale_exponent
 
 
 def lower_tolerance_limit(series_key, value):
@@ -422,6 +759,7 @@ def upper_tolerance_limit(series_key, value):
     return value + value * tolerance(series_key)
 
 
+@memoized
 def tolerance_limits(series_key, value):
     """The lower and upper tolerance limits for a nominal value of a series.
 
@@ -441,11 +779,222 @@ def tolerance_limits(series_key, value):
             upper_tolerance_limit(series_key, value))
 
 
+def is_member(series_key, value, rel_tol=1e-9):
+    """Determine whether a value is a member of a series.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        value: The query value.
+        rel_tol: The relative tolerance within which the query value
+            must match a series value, to allow for floating point error.
+
+    Returns:
+        True if the value matches a value from the specified series in
+        any decade, otherwise False. Values which are not finite and
+        positive are not members.
+
+    Raises:
+        ValueError: If series_key is not known.
+    """
+    series(series_key)
+    return series_key in _membership_index().get(_integer_mantissa(value, rel_tol), ())
+
+
+def is_member_batch(series_key, values, rel_tol=1e-9):
+    """Determine whether each of many values is a member of a series.
+
+    Args:
+        series_key: An E-Series key such as E24.
+        values: An iterable series of query values.
+        rel_tol: As for is_member().
+
+    Yields:
+        For each value, in order, True if the value is a member of the
+        specified series, otherwise False.
+
+    Raises:
+        ValueError: If series_key is not known.
+    """
+    series(series_key)
+    index = _membership_index()
+    for value in values:
+        yield series_key in index.get(_integer_mantissa(value, rel_tol), ())
+
+
+def classify(value, rel_tol=1e-9):
+    """Find the coarsest series of which a value is a member.
+
+    Args:
+        value: The query value.
+        rel_tol: As for is_member().
+
+    Returns:
+        The key of the series with the fewest values per decade of which
+        the value is a member, or None if the value is not a member of any
+        series.
+    """
+    containing_keys = _membership_index().get(_integer_mantissa(value, rel_tol))
+    return containing_keys[0] if containing_keys else None
+
+
+def classify_batch(values, rel_tol=1e-9):
+    """Find the coarsest series of which each of many values is a member.
+
+    Args:
+        values: An iterable series of query values.
+        rel_tol: As for is_member().
+
+    Yields:
+        For each value, in order, the key of the coarsest series of which
+        it is a member, or None if it is not a member of any series.
+    """
+    index = _membership_index()
+    for value in values:
+        containing_keys = index.get(_integer_mantissa(value, rel_tol))
+        yield containing_keys[0] if containing_keys else None
+
+
+def _integer_mantissa(value, rel_tol):
+    """The three significant digits of a value, as an integer from 100 to 999.
+
+    Returns:
+        The integer mantissa, or None if the value is not within rel_tol of
+        a value with three significant digits, or if the value is not finite
+        and positive.
+    """
+    if not _MINIMUM_E_VALUE <= value < float('inf'):
+        return None
+    exponent = int(floor(log10(value))) - 2
+    scaled = value / 10 ** exponent if exponent >= 0 else value * 10 ** -exponent
+    mantissa = int(round(scaled))
+    if abs(scaled - mantissa) > rel_tol * scaled:
+        return None
+    # log10 is inexact, so values just below a power of ten may round up
+    return 100 if mantissa == 1000 else mantissa
+
+
+def _membership_index():
+    if not _MEMBERSHIP_INDEX:
+        index = {}
+        for series_key, series_values in _E.items():
+            scale = 10 ** (2 - _SERIES_DECADE[series_key])
+            for series_value in series_values:
+                index.setdefault(series_value * scale, []).append(series_key)
+        # Custom series may be coarser than the standard series
+        for series_keys_for_mantissa in index.values():
+            series_keys_for_mantissa.sort(key=lambda key: len(_E[key]))
+        _MEMBERSHIP_INDEX.update(index)
+    return _MEMBERSHIP_INDEX
+
+
+def _check_query_value(series_key, value):
+    series(series_key)
+    margin = pow(GEOMETRIC_SCALE_E[series_key], 1.5)
+    if math.isnan(value) or math.isinf(value) or math.isinf(value * margin):
+        raise ValueError("Value {} is not finite".format(value))
+    if value / margin < _MINIMUM_E_VALUE:
+        raise ValueError("{} is too small. The value must be greater than or equal to {}"
+                         .format(value, _MINIMUM_E_VALUE * margin))
+    return margin
+
+
+def _locate(series_key, value):
+    """Locate a value between two adjacent series values.
+
+    Series values are identified by their position, an integer which counts
+    through the series values in all decades, so that position // len(series)
+    is the decade and position % len(series) is the index into the series
+    values. Adjacent positions are adjacent series values, even across a
+    decade boundary, so wrapping from one decade to the next needs no special
+    treatment.
+
+    Returns:
+        A 3-tuple containing the position of the largest series value
+        less-than or equal-to value, that series value, and the series
+        value at the next position, which is greater-than value.
+    """
+    series_log = LOG10_MANTISSA_E[series_key]
+    decade, mantissa = _decade_mantissa(log10(value))
+    position = decade * len(series_log) + bisect_right(series_log, mantissa) - 1
+    return _correct_position(series_key, position, value)
+
+
+def _correct_position(series_key, position, value):
+    """Locate a value, given an estimate of its position from its logarithm. See _locate().
+
+    log10 is inexact, so the estimated position may be out by one either way.
+    """
+    lower = _bounded_position_value(series_key, position)
+    if lower > value:
+        upper = lower
+        position -= 1
+        lower = _position_value(series_key, position)
+    else:
+        upper = _bounded_position_value(series_key, position + 1)
+        if upper <= value:
+            position += 1
+            lower = upper
+            upper = _bounded_position_value(series_key, position + 1)
+    return position, lower, upper
+
+
+def _position_value(series_key, position):
+    """The series value at a position. See _locate()."""
+    table = _decade_table(series_key)
+    table_index = position - _table_start_position(series_key)
+    if 0 <= table_index < len(table):
+        return table[table_index]
+    series_values = _E[series_key]
+    decade, index = divmod(position, len(series_values))
+    return _scaled_value(series_values, _SERIES_DECADE[series_key], decade, index)
+
+
+def _bounded_position_value(series_key, position):
+    """The series value at a position, or infinity if it is too large to be a float. See _locate()."""
+    try:
+        return _position_value(series_key, position)
+    except OverflowError:
+        return float('inf')
+
+
+def _decade_table(series_key):
+    """The series values in all decades from 10**_TABLE_MIN_DECADE to 10**(_TABLE_MAX_DECADE + 1).
+
+    The table is built on first use, or loaded from the table cache, and is
+    indexed by position, offset by _table_start_position(). See _locate().
+
+    Returns:
+        An array of floats, or a memoryview of floats in the table cache.
+
+    Raises:
+        ValueError: If series_key is not known.
+    """
+    try:
+        return _DECADE_TABLES[series_key]
+    except KeyError:
+        series_values = series(series_key)
+        series_decade = _SERIES_DECADE[series_key]
+
+        def build():
+            return (array('d', (_scaled_value(series_values, series_decade, decade, index)
+                                for decade in range(_TABLE_MIN_DECADE, _TABLE_MAX_DECADE + 1)
+                                for index in range(len(series_values)))),)
+
+        table, = cached_tables('decade-{}'.format(series_key.name),
+                               (series_values, series_decade, _TABLE_MIN_DECADE, _TABLE_MAX_DECADE),
+                               build)
+        _DECADE_TABLES[series_key] = table
+        return table
+
+
+def _table_start_position(series_key):
+    return _TABLE_MIN_DECADE * len(_E[series_key])
+
+
 def _nearest_n(candidates, value, n):
-    abs_deltas = tuple(abs(c - value) for c in candidates)
-    indexes = [index for index, _ in sorted(enumerate(abs_deltas), key=lambda x: x[1])]
-    nearest_three = tuple(sorted(candidates[i] for i in indexes[:n]))
-    return nearest_three
+    # The sort is stable, so the earlier of equidistant candidates is preferred
+    nearest = sorted(candidates, key=lambda c: abs(c - value))[:n]
+    return tuple(sorted(nearest))
 
 
 def _round_sig(x, figures=6):
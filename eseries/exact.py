@@ -0,0 +1,161 @@
+"""Exact decimal representation of E-series values.
+
+E-series values are decimal numbers, such as 4.7e-7, most of which have no
+exact representation as a float. An ExactValue holds a value as an integer
+mantissa and a decimal exponent, so values can be compared, hashed and used
+as dictionary keys exactly, and converted to a float, a Decimal or a Fraction
+when required:
+
+    >>> from eseries import E24, find_nearest
+    >>> value = find_nearest(E24, 4.6e-7, exact=True)
+    >>> value
+    ExactValue(47, -8)
+    >>> str(value)
+    '0.00000047'
+    >>> float(value)
+    4.7e-07
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numbers
+import sys
+
+# Hashes of numbers are computed modulo this prime, so that equal numbers of
+# different types have equal hashes. Python 2.7 has no such scheme, in which
+# case ExactValues hash the same as Fractions.
+if hasattr(sys, 'hash_info'):
+    _HASH_MODULUS = sys.hash_info.modulus
+    _HASH_INVERSE_OF_TEN = pow(10, _HASH_MODULUS - 2, _HASH_MODULUS)
+else:
+    _HASH_MODULUS = None
+
+
+class ExactValue(object):
+    """An exact decimal value, mantissa * 10**exponent.
+
+    The mantissa has no trailing zeros, so that equal values have equal
+    mantissas and exponents. ExactValues compare equal to, and hash the
+    same as, ints, Decimals and Fractions of the same value, and to floats
+    only where the float is exactly the same value.
+
+    Attributes:
+        mantissa: The integer mantissa.
+        exponent: The integer decimal exponent.
+    """
+
+    __slots__ = ('mantissa', 'exponent')
+
+    def __init__(self, mantissa, exponent=0):
+        """Initialise an exact value.
+
+        Args:
+            mantissa: An integer mantissa.
+            exponent: An integer decimal exponent.
+
+        Raises:
+            TypeError: If mantissa or exponent is not an integer.
+        """
+        if not (type(mantissa) is int and type(exponent) is int):
+            if not isinstance(mantissa, numbers.Integral) or not isinstance(exponent, numbers.Integral):
+                raise TypeError("Mantissa {!r} and exponent {!r} must both be integers".format(mantissa, exponent))
+            mantissa = int(mantissa)
+            exponent = int(exponent)
+        if mantissa == 0:
+            exponent = 0
+        else:
+            while mantissa % 10 == 0:
+                mantissa //= 10
+                exponent += 1
+        self.mantissa = mantissa
+        self.exponent = exponent
+
+    def __float__(self):
+        # Integer arithmetic gives the float closest to the exact value
+        if self.exponent >= 0:
+            return float(self.mantissa * 10 ** self.exponent)
+        return self.mantissa / 10 ** -self.exponent
+
+    def to_decimal(self):
+        """The value as a Decimal, which is exact."""
+        # Imported here so that the cost is only paid when needed
+        from decimal import Decimal
+        return Decimal('{}E{}'.format(self.mantissa, self.exponent))
+
+    def to_fraction(self):
+        """The value as a Fraction, which is exact."""
+        # Imported here so that the cost is only paid when needed
+        from fractions import Fraction
+        if self.exponent >= 0:
+            return Fraction(self.mantissa * 10 ** self.exponent)
+        return Fraction(self.mantissa, 10 ** -self.exponent)
+
+    def __eq__(self, other):
+        if isinstance(other, ExactValue):
+            return self.mantissa == other.mantissa and self.exponent == other.exponent
+        if isinstance(other, numbers.Number):
+            return self.to_fraction() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __lt__(self, other):
+        operands = self._comparable(other)
+        return NotImplemented if operands is None else operands[0] < operands[1]
+
+    def __le__(self, other):
+        operands = self._comparable(other)
+        return NotImplemented if operands is None else operands[0] <= operands[1]
+
+    def __gt__(self, other):
+        operands = self._comparable(other)
+        return NotImplemented if operands is None else operands[0] > operands[1]
+
+    def __ge__(self, other):
+        operands = self._comparable(other)
+        return NotImplemented if operands is None else operands[0] >= operands[1]
+
+    def __hash__(self):
+        # The same as the hash of an equal int, Decimal or Fraction
+        if _HASH_MODULUS is None:
+            return hash(self.to_fraction())
+        if self.exponent >= 0:
+            scale = pow(10, self.exponent, _HASH_MODULUS)
+        else:
+            scale = pow(_HASH_INVERSE_OF_TEN, -self.exponent, _HASH_MODULUS)
+        result = abs(self.mantissa) * scale % _HASH_MODULUS
+        if self.mantissa < 0:
+            result = -result
+        return -2 if result == -1 else result
+
+    def __repr__(self):
+        return "{}({!r}, {!r})".format(type(self).__name__, self.mantissa, self.exponent)
+
+    def __str__(self):
+        return '{:f}'.format(self.to_decimal())
+
+    def __format__(self, format_spec):
+        return format(self.to_decimal(), format_spec)
+
+    @classmethod
+    def _from_normalized(cls, mantissa, exponent):
+        """An ExactValue from a mantissa already without trailing zeros, without validation."""
+        value = object.__new__(cls)
+        value.mantissa = mantissa
+        value.exponent = exponent
+        return value
+
+    def _comparable(self, other):
+        """A pair of numbers which compare as self and other, or None if other is not a number."""
+        if isinstance(other, ExactValue):
+            # Compare integers scaled to a common exponent
+            exponent = min(self.exponent, other.exponent)
+            return (self.mantissa * 10 ** (self.exponent - exponent),
+                    other.mantissa * 10 ** (other.exponent - exponent))
+        if isinstance(other, numbers.Number):
+            return self.to_fraction(), other
+        return None
@@ -0,0 +1,254 @@
+"""Pairs of values from two E-series for RC and LC filters with a target time constant.
+
+The cutoff frequency of an RC filter is 1 / (2 pi R C), and the resonant
+frequency of an LC circuit is 1 / (2 pi sqrt(L C)), so a filter is
+characterised here by either the product of its two values, or the square
+root of that product. Use time_constant() to compute either from a frequency.
+
+For example, to find an E24 resistor between 1 k and 100 k and an E6
+capacitor for an RC filter with a cutoff frequency of 1.5 kHz:
+
+    >>> from eseries import E6, E12, E24
+    >>> from eseries.filters import find_filter_pairs, time_constant
+    >>> find_filter_pairs(E24, E6, time_constant(1.5e3), first_range=(1e3, 100e3))
+    [FilterPair(first=16000.0, second=6.8e-09, value=0.00010879999999999999, error=0.02541584213170835, worst_case_error=0.29202396108595263)]
+
+and to find an E12 inductor between 1 uH and 1 mH and an E12 capacitor for an
+LC circuit with a resonant frequency of 455 kHz, supply sqrt=True:
+
+    >>> find_filter_pairs(E12, E12, time_constant(455e3), first_range=(1e-6, 1e-3), sqrt=True)
+    [FilterPair(first=1.8e-06, second=6.8e-08, value=3.49857113690718e-07, error=0.0001887697409686741, worst_case_error=0.10020764671506575)]
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import heapq
+import math
+from bisect import bisect_left
+from collections import namedtuple, OrderedDict
+
+from eseries.eseries import (series, open_erange, tolerance_limits, LOG10_MANTISSA_E, _SERIES_DECADE, _scaled_value,
+                             _UNREGISTER_HOOKS)
+
+FilterPair = namedtuple('FilterPair', ['first', 'second', 'value', 'error', 'worst_case_error'])
+FilterPair.__doc__ = """A pair of values, one from each of two series, for a filter.
+
+Attributes:
+    first: The value from the first series, such as a resistor or an inductor.
+    second: The value from the second series, such as a capacitor.
+    value: The product of the two values, or its square root.
+    error: The relative error of the value with respect to the target
+        value. Negative if the value is too small.
+    worst_case_error: The largest absolute relative error of the value
+        with respect to the target value, when each part may deviate
+        from its nominal value to the tolerance limits of its series.
+"""
+
+# Tuples of the values of a series in a half-open range, keyed by (series_key, start, stop),
+# from the least to the most recently used.
+_WINDOWS = OrderedDict()
+
+# The maximum number of ranges for which the values are retained
+MAX_WINDOWS = 64
+
+# The largest magnitude of the decimal exponent of a second value
+_MAXIMUM_DECADE = 300
+
+
+def time_constant(frequency):
+    """The time constant 1 / (2 pi f) of a filter.
+
+    This is the target product R C of an RC filter with a cutoff frequency
+    f, or the target square root of the product L C of an LC circuit with a
+    resonant frequency f.
+
+    Args:
+        frequency: The cutoff or resonant frequency in hertz.
+
+    Returns:
+        The time constant in seconds.
+
+    Raises:
+        ValueError: If frequency is not finite and positive.
+    """
+    if math.isnan(frequency) or math.isinf(frequency) or frequency <= 0:
+        raise ValueError("Frequency {} is not finite and positive".format(frequency))
+    return 1 / (2 * math.pi * frequency)
+
+
+def find_filter_pairs(first_series_key, second_series_key, target, num=1, first_range=(1, 10), sqrt=False):
+    """Find the pairs of values with a product, or square root of the product, nearest to a target.
+
+    Args:
+        first_series_key: The E-Series key, such as E24, of the first value.
+        second_series_key: The E-Series key, such as E6, of the second value.
+        target: The target product, or the target square root of the
+            product if sqrt is True.
+        num: The maximum number of pairs to find.
+        first_range: A 2-tuple of the start and stop of the half-open range
+            of the first values, which may span any number of decades. The
+            second values are not constrained.
+        sqrt: If True, the target is the square root of the product, as for
+            the resonant frequency of an LC circuit.
+
+    Returns:
+        A list of num FilterPairs, ordered from the smallest to the largest
+        absolute error.
+
+    Raises:
+        ValueError: If either series key is not known.
+        ValueError: If target is not finite and positive.
+        ValueError: If num is less than one.
+        ValueError: If no values of the first series lie in first_range.
+        ValueError: If the second values would be out of range.
+    """
+    first_values = _check_arguments(first_series_key, second_series_key, num, first_range)
+    return _find_filter_pairs(first_series_key, first_values, second_series_key, target, num, sqrt)
+
+
+def find_filter_pairs_batch(first_series_key, second_series_key, targets, num=1, first_range=(1, 10), sqrt=False):
+    """Find the pairs of values with a product, or square root of the product, nearest to each of many targets.
+
+    The values of the first series in first_range are found once for all
+    the targets.
+
+    Args:
+        first_series_key: The E-Series key, such as E24, of the first value.
+        second_series_key: The E-Series key, such as E6, of the second value.
+        targets: An iterable series of target products, or target square
+            roots of the product if sqrt is True.
+        num: The maximum number of pairs to find for each target.
+        first_range: A 2-tuple of the start and stop of the half-open range
+            of the first values.
+        sqrt: If True, each target is the square root of the product.
+
+    Yields:
+        For each target, in order, a list of num FilterPairs ordered from
+        the smallest to the largest absolute error.
+
+    Raises:
+        ValueError: If either series key is not known.
+        ValueError: If any target is not finite and positive.
+        ValueError: If num is less than one.
+        ValueError: If no values of the first series lie in first_range.
+        ValueError: If the second values would be out of range.
+    """
+    first_values = _check_arguments(first_series_key, second_series_key, num, first_range)
+    for target in targets:
+        yield _find_filter_pairs(first_series_key, first_values, second_series_key, target, num, sqrt)
+
+
+def _check_arguments(first_series_key, second_series_key, num, first_range):
+    """The values of the first series in first_range, after checking the arguments."""
+    series(first_series_key)
+    series(second_series_key)
+    if num < 1:
+        raise ValueError("num {} is not at least one".format(num))
+    return _window(first_series_key, first_range)
+
+
+def _window(series_key, first_range):
+    start, stop = first_range
+    key = (series_key, start, stop)
+    try:
+        values = _WINDOWS.pop(key)
+    except KeyError:
+        values = tuple(open_erange(series_key, start, stop))
+        if not values:
+            raise ValueError("No values of {} lie in the range {} to {}".format(series_key.name, start, stop))
+        while len(_WINDOWS) >= MAX_WINDOWS:
+            _WINDOWS.popitem(last=False)
+    _WINDOWS[key] = values
+    return values
+
+
+def _find_filter_pairs(first_series_key, first_values, second_series_key, target, num, sqrt):
+    if math.isnan(target) or math.isinf(target) or target <= 0:
+        raise ValueError("Target {} is not finite and positive".format(target))
+    product = target * target if sqrt else target
+    if not 0 < product < float('inf'):
+        raise ValueError("Target {} is out of range".format(target))
+    log_product = math.log10(product)
+    for first in (first_values[0], first_values[-1]):
+        if abs(log_product - math.log10(first)) > _MAXIMUM_DECADE:
+            raise ValueError("Target {} is out of range for a first value of {}".format(target, first))
+    second_values = series(second_series_key)
+    second_decade = _SERIES_DECADE[second_series_key]
+    second_logs = LOG10_MANTISSA_E[second_series_key]
+    num_second = len(second_logs)
+
+    # Positions index the second values across all decades, so that the
+    # value at position p is in decade p // num_second. Nearby first values
+    # share partners, so the second values are computed once per position.
+    scaled_second_values = {}
+
+    def second_value(position):
+        try:
+            return scaled_second_values[position]
+        except KeyError:
+            decade, index = divmod(position, num_second)
+            value = _scaled_value(second_values, second_decade, decade, index)
+            scaled_second_values[position] = value
+            return value
+
+    def entry(i, position, step):
+        second = second_value(position)
+        value = first_values[i] * second
+        if sqrt:
+            value = math.sqrt(value)
+        error = (value - target) / target
+        return abs(error), i, position, step, second, value, error
+
+    # For each first value, searching outwards from the position of the
+    # smallest second value with a product not less than the target, in
+    # either direction, gives pairs of monotonically increasing error, so
+    # the best pairs overall are found by merging these sequences with a heap.
+    ideal_log = log_product - math.log10(first_values[0])
+    ideal_decade = int(math.floor(ideal_log))
+    position = ideal_decade * num_second + bisect_left(second_logs, ideal_log - ideal_decade)
+    heap = []
+    for i, first in enumerate(first_values):
+        ideal = product / first
+        # The ideal second value decreases as the first value increases, so
+        # the positions can be found by moving a single pointer downwards.
+        # The pointer is also moved upwards where the logarithm of the
+        # first ideal value was rounded.
+        while second_value(position) < ideal:
+            position += 1
+        while second_value(position - 1) >= ideal:
+            position -= 1
+        heap.append(entry(i, position, +1))
+        heap.append(entry(i, position - 1, -1))
+    heapq.heapify(heap)
+
+    pairs = []
+    while len(pairs) < num:
+        _, i, position, step, second, value, error = heapq.heappop(heap)
+        first = first_values[i]
+        worst_case_error = _worst_case_error(first_series_key, first, second_series_key, second, target, sqrt)
+        pairs.append(FilterPair(first, second, value, error, worst_case_error))
+        heapq.heappush(heap, entry(i, position + step, step))
+    return pairs
+
+
+def _worst_case_error(first_series_key, first, second_series_key, second, target, sqrt):
+    """The largest absolute relative error of a pair when each part is at a tolerance limit."""
+    first_lower, first_upper = tolerance_limits(first_series_key, first)
+    second_lower, second_upper = tolerance_limits(second_series_key, second)
+    lowest = first_lower * second_lower
+    highest = first_upper * second_upper
+    if sqrt:
+        lowest = math.sqrt(lowest)
+        highest = math.sqrt(highest)
+    return max(target - lowest, highest - target) / target
+
+
+def _forget_series(series_key):
+    """Discard the retained ranges of an unregistered series."""
+    for key in [key for key in _WINDOWS if key[0] is series_key]:
+        _WINDOWS.pop(key, None)
+
+
+_UNREGISTER_HOOKS.append(_forget_series)
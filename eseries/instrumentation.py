@@ -0,0 +1,190 @@
+"""Optional instrumentation of the time spent in eseries.
+
+When instrumentation is enabled, the number of calls to, and the cumulative
+time spent in, each of the instrumented functions is recorded:
+
+    >>> from eseries import E24, find_nearest_few, enable_instrumentation, instrumentation_snapshot
+    >>> enable_instrumentation()
+    >>> find_nearest_few(E24, 5000)
+    (4700.0, 5100.0, 5600.0)
+    >>> instrumentation_snapshot()['find_nearest_few'].calls
+    1
+
+A hook may also be supplied, which is called with the name of the function
+and the time taken by each call, to forward timings to a metrics system.
+
+For functions which return iterators, such as erange(), the time taken to
+create the iterator and to iterate over it are both included. It is
+recorded when the iteration finishes, or when the iterator is discarded
+after iteration has begun.
+
+Instrumentation is disabled by default, when the only cost to each
+instrumented function is to check that it is disabled.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from collections import namedtuple
+from functools import wraps
+
+try:
+    from time import perf_counter
+except ImportError:
+    # Python 2.7
+    from time import time as perf_counter
+
+CallStats = namedtuple('CallStats', ['calls', 'seconds'])
+
+
+class _Counters(object):
+    """A thread-safe record of the calls to, and time spent in, each function."""
+
+    def __init__(self, hook):
+        # Imported here so that the cost is only paid when instrumentation is enabled
+        import threading
+        self._hook = hook
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            calls, total_seconds = self._stats.get(name, (0, 0.0))
+            self._stats[name] = CallStats(calls + 1, total_seconds + seconds)
+        if self._hook is not None:
+            self._hook(name, seconds)
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._stats)
+
+
+_counters = None
+
+
+def enable_instrumentation(hook=None):
+    """Record the calls to, and time spent in, the instrumented functions.
+
+    Any existing records are discarded.
+
+    Args:
+        hook: An optional function which is called with the name of the
+            instrumented function and the time taken, in seconds, after
+            each call.
+    """
+    global _counters
+    _counters = _Counters(hook)
+
+
+def disable_instrumentation():
+    """Stop recording calls, and discard the records."""
+    global _counters
+    _counters = None
+
+
+def clear_instrumentation():
+    """Discard all records of calls.
+
+    Has no effect if instrumentation is not enabled.
+    """
+    counters = _counters
+    if counters is not None:
+        counters.clear()
+
+
+def instrumentation_snapshot():
+    """The calls recorded so far.
+
+    Returns:
+        A dictionary mapping the name of each function which has been called
+        to a CallStats named tuple with calls and seconds attributes, or None
+        if instrumentation is not enabled.
+    """
+    counters = _counters
+    if counters is None:
+        return None
+    return counters.snapshot()
+
+
+def dump_instrumentation(file):
+    """Write the calls recorded so far to a file as a JSON object.
+
+    The object maps the name of each function to an object with calls and
+    seconds members.
+
+    Args:
+        file: A text file object.
+
+    Raises:
+        ValueError: If instrumentation is not enabled.
+    """
+    # Imported here so that the cost is only paid when needed
+    import json
+    snapshot = instrumentation_snapshot()
+    if snapshot is None:
+        raise ValueError("Instrumentation is not enabled")
+    json.dump({name: stats._asdict() for name, stats in sorted(snapshot.items())}, file, indent=2, sort_keys=True)
+    file.write('\n')
+
+
+def instrumented(function):
+    """Decorate a function so its calls are recorded, when instrumentation is enabled."""
+    name = function.__name__
+
+    @wraps(function)
+    def instrumented_function(*args, **kwargs):
+        counters = _counters
+        if counters is None:
+            return function(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counters.record(name, perf_counter() - start)
+
+    return instrumented_function
+
+
+def instrumented_iteration(function):
+    """Decorate a function which returns an iterator so its calls, and the iteration, are recorded.
+
+    When instrumentation is not enabled, the iterator returned by the function
+    is returned unchanged, so iteration has no cost.
+    """
+    name = function.__name__
+
+    @wraps(function)
+    def instrumented_function(*args, **kwargs):
+        counters = _counters
+        if counters is None:
+            return function(*args, **kwargs)
+        start = perf_counter()
+        try:
+            iterator = iter(function(*args, **kwargs))
+        except BaseException:
+            counters.record(name, perf_counter() - start)
+            raise
+        return _timed_iteration(counters, name, iterator, perf_counter() - start)
+
+    return instrumented_function
+
+
+def _timed_iteration(counters, name, iterator, seconds):
+    """Generate the items of an iterator, recording the total time taken once the iteration ends."""
+    try:
+        while True:
+            start = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                seconds += perf_counter() - start
+            yield item
+    finally:
+        counters.record(name, seconds)
@@ -0,0 +1,240 @@
+"""Interval arithmetic for worst-case analysis of circuits comprising parts from E-series.
+
+An Interval carries a nominal value together with lower and upper limits.
+Intervals for parts are derived from the tolerance of their series, and
+propagate through the arithmetic operators and parallel combination, so
+that the result of a circuit expression bounds its value in the worst
+case. For example, the ratio of a divider comprising two E24 resistors:
+
+    >>> from eseries import E24
+    >>> from eseries.intervals import Interval
+    >>> r1 = Interval.from_series(E24, 10e3)
+    >>> r2 = Interval.from_series(E24, 4.7e3)
+    >>> r2 / (r1 + r2)
+    Interval(nominal=0.31972789115646255, lower=0.28927761580822803, upper=0.3533834586466165)
+
+Each occurrence of an interval in an expression is treated independently,
+so an expression in which a part occurs more than once, such as the one
+above, may overestimate the variation. Where possible rearrange
+expressions so that each part occurs once, e.g. 1 / (1 + r1 / r2).
+
+For arrays of nominal values see eseries.arrays.IntervalArray.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from functools import reduce
+
+from eseries.eseries import lower_tolerance_limit, upper_tolerance_limit
+
+
+class _IntervalOperators(object):
+    """The arithmetic of intervals, in terms of their nominal, lower and upper values.
+
+    Subclasses provide the storage for nominal, lower and upper, and the
+    _minimum(), _maximum(), _contains_zero() and _interval() methods, so the
+    same arithmetic can be applied to scalars and to arrays.
+    """
+
+    __slots__ = ()
+
+    # Prevent NumPy from applying its operators element-wise to intervals
+    __array_ufunc__ = None
+
+    # Operations between different kinds of intervals are performed by the
+    # kind with the higher priority.
+    _priority = 0
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return self._interval(self.nominal + other.nominal, self.lower + other.lower, self.upper + other.upper)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return self._interval(self.nominal - other.nominal, self.lower - other.upper, self.upper - other.lower)
+
+    def __rsub__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return other - self
+
+    def __mul__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        products = (self.lower * other.lower, self.lower * other.upper,
+                    self.upper * other.lower, self.upper * other.upper)
+        return self._interval(self.nominal * other.nominal, self._minimum(products), self._maximum(products))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return self * other.reciprocal()
+
+    def __rtruediv__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return other * self.reciprocal()
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __neg__(self):
+        return self._interval(-self.nominal, -self.upper, -self.lower)
+
+    def __pos__(self):
+        return self
+
+    def reciprocal(self):
+        """The reciprocal of the interval.
+
+        Raises:
+            ZeroDivisionError: If the interval contains zero.
+        """
+        if self._contains_zero():
+            raise ZeroDivisionError("The reciprocal of an interval containing zero is unbounded")
+        return self._interval(1 / self.nominal, 1 / self.upper, 1 / self.lower)
+
+    def parallel(self, other):
+        """The parallel combination of two intervals, such as of two resistances.
+
+        The combination is the reciprocal of the sum of the reciprocals,
+        in which each interval occurs once, so the limits are not
+        overestimated.
+
+        Raises:
+            ZeroDivisionError: If either interval, or the sum of their
+                reciprocals, contains zero.
+        """
+        coerced = self._coerce(other)
+        if coerced is NotImplemented:
+            return other.parallel(self)
+        return (self.reciprocal() + coerced.reciprocal()).reciprocal()
+
+    @property
+    def worst_case_error(self):
+        """The largest deviation of the limits from the nominal value, relative to the nominal value."""
+        return self._maximum((self.upper - self.nominal, self.nominal - self.lower)) / abs(self.nominal)
+
+    def _coerce(self, other):
+        if isinstance(other, _IntervalOperators):
+            if other._priority > self._priority:
+                return NotImplemented
+            if other._priority < self._priority:
+                return self._interval(other.nominal, other.lower, other.upper)
+            return other
+        return self._interval(other, other, other)
+
+
+class Interval(_IntervalOperators):
+    """A nominal value with lower and upper limits.
+
+    Attributes:
+        nominal: The nominal value.
+        lower: The lower limit.
+        upper: The upper limit.
+    """
+
+    __slots__ = ('nominal', 'lower', 'upper')
+
+    def __init__(self, nominal, lower, upper):
+        """Initialise an interval.
+
+        Raises:
+            ValueError: If nominal is not between lower and upper inclusive.
+        """
+        if not lower <= nominal <= upper:
+            raise ValueError("Nominal value {} is not between the lower limit {} and upper limit {}"
+                             .format(nominal, lower, upper))
+        self.nominal = nominal
+        self.lower = lower
+        self.upper = upper
+
+    @classmethod
+    def from_series(cls, series_key, nominal):
+        """The interval for a nominal value within the tolerance of a series.
+
+        Args:
+            series_key: The ESeries to use.
+            nominal: A nominal value. This value need not be a member of the
+                specified E-series.
+
+        Returns:
+            An Interval with the same limits as lower_tolerance_limit() and
+            upper_tolerance_limit().
+
+        Raises:
+            ValueError: If series_key is not known.
+        """
+        return cls(nominal, lower_tolerance_limit(series_key, nominal), upper_tolerance_limit(series_key, nominal))
+
+    def __contains__(self, value):
+        return self.lower <= value <= self.upper
+
+    def __eq__(self, other):
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return (self.nominal, self.lower, self.upper) == (other.nominal, other.lower, other.upper)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash((self.nominal, self.lower, self.upper))
+
+    def __repr__(self):
+        return "{}(nominal={!r}, lower={!r}, upper={!r})".format(
+            type(self).__name__, self.nominal, self.lower, self.upper)
+
+    def _interval(self, nominal, lower, upper):
+        interval = Interval.__new__(Interval)
+        interval.nominal = nominal
+        interval.lower = lower
+        interval.upper = upper
+        return interval
+
+    @staticmethod
+    def _minimum(values):
+        return min(values)
+
+    @staticmethod
+    def _maximum(values):
+        return max(values)
+
+    def _contains_zero(self):
+        return self.lower <= 0 <= self.upper
+
+
+def parallel(*intervals):
+    """The parallel combination of intervals, such as of resistances.
+
+    Args:
+        *intervals: Two or more intervals, or a mixture of intervals and values.
+
+    Returns:
+        The interval of the reciprocal of the sum of the reciprocals of the
+        intervals.
+
+    Raises:
+        ValueError: If fewer than two intervals are given.
+        ZeroDivisionError: If any interval, or the sum of the reciprocals,
+            contains zero.
+    """
+    if len(intervals) < 2:
+        raise ValueError("At least two intervals are required, but {} were given".format(len(intervals)))
+    intervals = [item if isinstance(item, _IntervalOperators) else Interval(item, item, item) for item in intervals]
+    return reduce(lambda total, interval: total + interval, (interval.reciprocal() for interval in intervals)).reciprocal()
@@ -0,0 +1,275 @@
+"""Finding the nearest values among the parts in stock.
+
+An Inventory is built once from a catalog of parts, each with a value and an
+arbitrary payload such as a stock-keeping unit, and answers the same queries
+as eseries.find_nearest(), eseries.find_greater_than_or_equal() and
+eseries.find_less_than_or_equal(), constrained to the values in stock:
+
+    >>> from eseries.inventory import Inventory
+    >>> inventory = Inventory([(4.7e3, 'RES-4K7-0402'), (10e3, 'RES-10K-0402'), (10e3, 'RES-10K-0603')])
+    >>> inventory.find_nearest(8e3)
+    Stock(value=10000.0, payloads=('RES-10K-0402', 'RES-10K-0603'))
+
+The distinct values are held in a sorted array, so each query is a binary
+search. Large catalogs can be saved to a file, which is memory-mapped when
+loaded, so that loading takes the same time regardless of the size of the
+catalog, and payloads are decoded only when they are returned:
+
+    >>> inventory.save('inventory.bin')
+    >>> inventory = Inventory.load('inventory.bin')
+
+Saving and loading inventories requires Python 3.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+Stock = namedtuple('Stock', ['value', 'payloads'])
+Stock.__doc__ = """The parts in stock with a value.
+
+Attributes:
+    value: The value of the parts.
+    payloads: A tuple of the payloads of the parts with the value, in
+        catalog order.
+"""
+
+# The file header comprises a magic number, the format version, the byte
+# order of the arrays and the number of distinct values. It is followed by the
+# array of values, the array of offsets of the payloads of each value, and the
+# payloads of each value as JSON arrays.
+_MAGIC = b'ESERIINV'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIIQ')
+_LITTLE_ENDIAN = 0
+_BIG_ENDIAN = 1
+_BYTE_ORDER = _LITTLE_ENDIAN if sys.byteorder == 'little' else _BIG_ENDIAN
+
+
+class Inventory(object):
+    """An index of the values of the parts in stock.
+
+    Each distinct value is associated with the payloads of all the parts
+    with that value, in catalog order.
+    """
+
+    __slots__ = ('_values', '_payloads', '_mapping')
+
+    def __init__(self, catalog):
+        """Initialise an inventory from a catalog of parts.
+
+        Args:
+            catalog: An iterable series of (value, payload) pairs, one for
+                each part. The payloads may be any objects, but must be
+                serialisable as JSON for the inventory to be saved.
+
+        Raises:
+            ValueError: If any value is not finite.
+        """
+        values = array('d')
+        payloads = []
+        for value, payload in sorted(catalog, key=_part_value):
+            if math.isnan(value) or math.isinf(value):
+                raise ValueError("Value {} is not finite".format(value))
+            if not values or values[-1] != value:
+                values.append(value)
+                payloads.append([])
+            payloads[-1].append(payload)
+        self._values = values
+        self._payloads = [tuple(value_payloads) for value_payloads in payloads]
+        self._mapping = None
+
+    @classmethod
+    def load(cls, path):
+        """Load an inventory saved with save().
+
+        The file is memory-mapped, so the values are read from the file
+        as they are searched, and the payloads of a value are decoded from
+        JSON only when they are returned.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            An Inventory.
+
+        Raises:
+            ValueError: If the file is not an inventory of a supported version.
+            ValueError: If the version of Python is earlier than 3.
+        """
+        _check_python_version()
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapping) < _HEADER.size:
+            raise ValueError("{} is not an inventory file".format(path))
+        magic, version, byte_order, num_values = _HEADER.unpack_from(mapping)
+        if magic != _MAGIC:
+            raise ValueError("{} is not an inventory file".format(path))
+        if version != _VERSION:
+            raise ValueError("Inventory file {} has version {}, but only version {} is supported"
+                             .format(path, version, _VERSION))
+        view = memoryview(mapping)
+        offset = _HEADER.size
+        values, offset = _mapped_array(view, offset, 'd', num_values, byte_order)
+        payload_offsets, offset = _mapped_array(view, offset, 'q', num_values + 1, byte_order)
+        inventory = cls.__new__(cls)
+        inventory._values = values
+        inventory._payloads = _MappedPayloads(view[offset:], payload_offsets)
+        inventory._mapping = mapping
+        return inventory
+
+    def save(self, path):
+        """Save the inventory to a file, which can be loaded with load().
+
+        Args:
+            path: The path of the file.
+
+        Raises:
+            TypeError: If any payload is not serialisable as JSON.
+            ValueError: If the version of Python is earlier than 3.
+        """
+        _check_python_version()
+        encoded_payloads = [json.dumps(list(value_payloads)).encode('utf-8') for value_payloads in self._payloads]
+        payload_offsets = array('q', [0])
+        for encoded_payload in encoded_payloads:
+            payload_offsets.append(payload_offsets[-1] + len(encoded_payload))
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, _BYTE_ORDER, len(self._values)))
+            file.write(array('d', self._values).tobytes())
+            file.write(payload_offsets.tobytes())
+            for encoded_payload in encoded_payloads:
+                file.write(encoded_payload)
+
+    def __len__(self):
+        """The number of distinct values in stock."""
+        return len(self._values)
+
+    def __iter__(self):
+        """Iterate over the Stock for each distinct value, from lowest to highest."""
+        for index in range(len(self._values)):
+            yield self._stock(index)
+
+    def __contains__(self, value):
+        index = bisect_left(self._values, value)
+        return index < len(self._values) and self._values[index] == value
+
+    def find_greater_than_or_equal(self, value):
+        """Find the smallest value in stock greater-than or equal-to the given value.
+
+        Args:
+            value: The query value.
+
+        Returns:
+            The Stock of the smallest value greater-than or equal-to the query value.
+
+        Raises:
+            ValueError: If value is not finite.
+            ValueError: If no such value is in stock.
+        """
+        _check_query_value(value)
+        index = bisect_left(self._values, value)
+        if index == len(self._values):
+            raise ValueError("No value greater than or equal to {} is in stock".format(value))
+        return self._stock(index)
+
+    def find_less_than_or_equal(self, value):
+        """Find the largest value in stock less-than or equal-to the given value.
+
+        Args:
+            value: The query value.
+
+        Returns:
+            The Stock of the largest value less-than or equal-to the query value.
+
+        Raises:
+            ValueError: If value is not finite.
+            ValueError: If no such value is in stock.
+        """
+        _check_query_value(value)
+        index = bisect_right(self._values, value) - 1
+        if index < 0:
+            raise ValueError("No value less than or equal to {} is in stock".format(value))
+        return self._stock(index)
+
+    def find_nearest(self, value):
+        """Find the nearest value in stock.
+
+        Args:
+            value: The value for which the nearest value is to be found.
+
+        Returns:
+            The Stock of the value closest to value. The lower value is
+            preferred when two values are equidistant, as for
+            eseries.find_nearest().
+
+        Raises:
+            ValueError: If value is not finite.
+            ValueError: If the inventory is empty.
+        """
+        _check_query_value(value)
+        if not self._values:
+            raise ValueError("No value is in stock")
+        upper_index = bisect_right(self._values, value)
+        if upper_index == len(self._values):
+            return self._stock(upper_index - 1)
+        if upper_index == 0:
+            return self._stock(0)
+        lower = self._values[upper_index - 1]
+        upper = self._values[upper_index]
+        return self._stock(upper_index - 1 if value - lower <= upper - value else upper_index)
+
+    def _stock(self, index):
+        return Stock(value=self._values[index], payloads=self._payloads[index])
+
+
+class _MappedPayloads(object):
+    """A read-only sequence of tuples of payloads, decoded on demand from JSON in a memory-mapped file."""
+
+    __slots__ = ('_view', '_offsets')
+
+    def __init__(self, view, offsets):
+        self._view = view
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        encoded = self._view[self._offsets[index]:self._offsets[index + 1]].tobytes()
+        return tuple(json.loads(encoded.decode('utf-8')))
+
+
+def _part_value(part):
+    value, _ = part
+    return value
+
+
+def _check_query_value(value):
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError("Value {} is not finite".format(value))
+
+
+def _check_python_version():
+    if sys.version_info < (3,):
+        raise ValueError("Saving and loading inventories requires Python 3, for memoryview.cast() and arrays "
+                         "of 64-bit integers")
+
+
+def _mapped_array(view, offset, typecode, length, byte_order):
+    """A sequence of numbers of type typecode at offset in a memory-mapped file, and the offset following it."""
+    end = offset + length * array(typecode).itemsize
+    if byte_order == _BYTE_ORDER:
+        # A view of the file, rather than a copy, so the cost is independent of the length
+        return view[offset:end].cast(typecode), end
+    items = array(typecode, view[offset:end].tobytes())
+    items.byteswap()
+    return items, end
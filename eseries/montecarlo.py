@@ -0,0 +1,154 @@
+"""Monte-Carlo analysis of circuits comprising parts from E-series, using NumPy.
+
+Each part is characterised by its series and nominal value, and is sampled
+within the tolerance of its series. A circuit is characterised by an
+expression of the values of its parts, which is evaluated for all samples
+at once, so it must accept NumPy arrays. For example, to analyse the ratio
+of a divider comprising two E24 resistors:
+
+    >>> from eseries import E24
+    >>> from eseries.montecarlo import monte_carlo, Part
+    >>> result = monte_carlo(lambda r1, r2: r2 / (r1 + r2),
+    ...                      [Part(E24, 10e3), Part(E24, 4.7e3)],
+    ...                      spec=(0.31, 0.33), seed=1729)
+    >>> result.nominal
+    0.3197278911564626
+    >>> result.yield_fraction
+    0.708084
+
+NumPy is an optional dependency of eseries, so this module is not imported
+by the top-level eseries package. Install the extra with:
+
+    $ pip install eseries[numpy]
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("eseries.montecarlo requires NumPy. Install it with: pip install eseries[numpy]")
+
+from eseries.eseries import tolerance
+
+UNIFORM = 'uniform'
+NORMAL = 'normal'
+DISTRIBUTIONS = (UNIFORM, NORMAL)
+
+DEFAULT_NUM_SAMPLES = 1000000
+
+DEFAULT_PERCENTILES = (0.135, 2.275, 50, 97.725, 99.865)
+
+Part = namedtuple('Part', ['series_key', 'nominal'])
+Part.__doc__ = """A part with a nominal value from a series.
+
+Attributes:
+    series_key: An E-Series key such as E24. Values of the part are
+        sampled within the tolerance of the series.
+    nominal: The nominal value of the part.
+"""
+
+MonteCarloResult = namedtuple('MonteCarloResult', ['nominal', 'mean', 'std', 'minimum', 'maximum', 'percentiles',
+                                                   'yield_fraction', 'samples'])
+MonteCarloResult.__doc__ = """The distribution of the value of a circuit expression.
+
+Attributes:
+    nominal: The value of the expression for the nominal values of the parts.
+    mean: The mean of the sampled values.
+    std: The standard deviation of the sampled values.
+    minimum: The smallest sampled value.
+    maximum: The largest sampled value.
+    percentiles: A dictionary mapping each requested percentile to the
+        corresponding sampled value.
+    yield_fraction: The fraction of sampled values within the specification,
+        or None if no specification was given.
+    samples: An array of the sampled values.
+"""
+
+
+def monte_carlo(expression, parts, num_samples=DEFAULT_NUM_SAMPLES, seed=None, spec=None, distribution=UNIFORM,
+                percentiles=DEFAULT_PERCENTILES):
+    """Sample the value of a circuit expression as its parts vary within their tolerances.
+
+    Args:
+        expression: A function which accepts one argument for each part, and
+            returns the value of the circuit. The arguments are arrays of
+            sampled part values, so the function must use operations which
+            apply element-wise to NumPy arrays.
+        parts: A sequence of Parts, or of (series_key, nominal) pairs, in the
+            order of the arguments of the expression.
+        num_samples: The number of samples.
+        seed: An optional seed for the random number generator, so that the
+            results can be reproduced.
+        spec: An optional (lower, upper) pair of limits for the value of the
+            expression, either of which may be None, against which the yield
+            is calculated.
+        distribution: UNIFORM, to sample each part uniformly between its
+            tolerance limits, or NORMAL, to sample each part from a normal
+            distribution with the tolerance at three standard deviations,
+            truncated at the tolerance limits.
+        percentiles: The percentiles of the sampled values to report. The
+            defaults correspond to the median, and to two and three standard
+            deviations either side of the mean, of a normal distribution.
+
+    Returns:
+        A MonteCarloResult.
+
+    Raises:
+        ValueError: If any series_key is not known.
+        ValueError: If num_samples is less than one.
+        ValueError: If distribution is not one of DISTRIBUTIONS.
+    """
+    parts = [Part(*part) for part in parts]
+    tolerances = [tolerance(part.series_key) for part in parts]
+    if num_samples < 1:
+        raise ValueError("num_samples {} is not at least one".format(num_samples))
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("Distribution {!r} is not one of {}".format(distribution, ', '.join(DISTRIBUTIONS)))
+
+    generator = np.random.default_rng(seed)
+    sampled_parts = [part.nominal * _deviations(generator, distribution, tol, num_samples)
+                     for part, tol in zip(parts, tolerances)]
+    samples = np.asarray(expression(*sampled_parts), dtype=float)
+    if samples.ndim == 0:
+        # The expression does not depend on the parts
+        samples = np.full(num_samples, samples)
+    nominal = float(expression(*(part.nominal for part in parts)))
+
+    yield_fraction = None
+    if spec is not None:
+        lower, upper = spec
+        within = np.ones(num_samples, dtype=bool)
+        if lower is not None:
+            within &= samples >= lower
+        if upper is not None:
+            within &= samples <= upper
+        yield_fraction = float(np.count_nonzero(within) / num_samples)
+
+    percentiles = tuple(percentiles)
+    return MonteCarloResult(nominal=nominal,
+                            mean=float(samples.mean()),
+                            std=float(samples.std()),
+                            minimum=float(samples.min()),
+                            maximum=float(samples.max()),
+                            percentiles=dict(zip(percentiles, np.percentile(samples, percentiles).tolist())),
+                            yield_fraction=yield_fraction,
+                            samples=samples)
+
+
+def _deviations(generator, distribution, tol, num_samples):
+    """Multipliers of a nominal value, distributed between 1 - tol and 1 + tol."""
+    if distribution == UNIFORM:
+        return generator.uniform(1 - tol, 1 + tol, num_samples)
+    # Samples beyond the tolerance limits, about 0.27% of them, are drawn
+    # again, so that the distribution is truncated rather than clipped.
+    deviations = generator.normal(1, tol / 3, num_samples)
+    rejected = np.flatnonzero(np.abs(deviations - 1) > tol)
+    while rejected.size:
+        deviations[rejected] = generator.normal(1, tol / 3, rejected.size)
+        rejected = rejected[np.abs(deviations[rejected] - 1) > tol]
+    return deviations
@@ -0,0 +1,145 @@
+"""Finding the nearest values in several series at once.
+
+For example, to find the values neighbouring 5000 in each of E6, E12, E24
+and E96:
+
+    >>> from eseries import E6, E12, E24, E96
+    >>> from eseries.multi import find_multi
+    >>> found = find_multi([E6, E12, E24, E96], 5000)
+    >>> found[E24]
+    Neighbours(less_than_or_equal=4700.0, nearest=5100.0, greater_than_or_equal=5100.0)
+
+The series are located within a merged index of the values of all the
+series, so the logarithm of each query value is computed, and the merged
+index searched, once for all the series. Where the series are nested, as
+E3, E6, E12 and E24 are, and E48, E96 and E192 are, the merged index is
+simply the finest of them.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from bisect import bisect_right
+from collections import namedtuple, OrderedDict
+from math import log10
+
+from eseries.eseries import (series, LOG10_MANTISSA_E, GEOMETRIC_SCALE_E, _check_query_value, _correct_position,
+                             _decade_mantissa, _UNREGISTER_HOOKS)
+
+Neighbours = namedtuple('Neighbours', ['less_than_or_equal', 'nearest', 'greater_than_or_equal'])
+Neighbours.__doc__ = """The values of a series neighbouring a query value.
+
+Attributes:
+    less_than_or_equal: The same value as eseries.find_less_than_or_equal().
+    nearest: The same value as eseries.find_nearest().
+    greater_than_or_equal: The same value as eseries.find_greater_than_or_equal().
+"""
+
+MergedIndex = namedtuple('MergedIndex', ['series_keys', 'log_mantissas', 'offsets', 'widest_series_key'])
+MergedIndex.__doc__ = """The logarithmic mantissas of the values of several series, merged.
+
+Attributes:
+    series_keys: A tuple of the series keys.
+    log_mantissas: The sorted union of the logarithmic mantissas of the
+        values of all the series.
+    offsets: For each series key, a list which maps a position in
+        log_mantissas, plus one, to the index of the largest value of the
+        series less-than or equal-to it, which is -1 if there is none.
+    widest_series_key: The series key with the widest gap between values,
+        which determines the range of query values.
+"""
+
+# Merged indexes keyed by tuples of series keys
+_MERGED_INDEXES = {}
+
+
+def find_multi(series_keys, value):
+    """Find the values neighbouring a value in several series at once.
+
+    Args:
+        series_keys: An iterable series of series keys.
+        value: The query value.
+
+    Returns:
+        An OrderedDict mapping each series key, in order, to the Neighbours
+        of the query value in that series.
+
+    Raises:
+        ValueError: If series_keys is empty.
+        ValueError: If any series key is not known.
+        ValueError: If value is not finite.
+        ValueError: If value is out of range.
+    """
+    index = _merged_index(tuple(series_keys))
+    return _find_multi(index, value)
+
+
+def find_multi_batch(series_keys, values):
+    """Find the values neighbouring many values in several series at once.
+
+    Args:
+        series_keys: An iterable series of series keys.
+        values: An iterable series of query values.
+
+    Yields:
+        For each value, in order, the same OrderedDict as find_multi().
+
+    Raises:
+        ValueError: If series_keys is empty.
+        ValueError: If any series key is not known.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    index = _merged_index(tuple(series_keys))
+    for value in values:
+        yield _find_multi(index, value)
+
+
+def _find_multi(index, value):
+    _check_query_value(index.widest_series_key, value)
+    decade, mantissa = _decade_mantissa(log10(value))
+    merged_position = bisect_right(index.log_mantissas, mantissa)
+    found = OrderedDict()
+    for series_key, offsets in zip(index.series_keys, index.offsets):
+        position = decade * len(LOG10_MANTISSA_E[series_key]) + offsets[merged_position]
+        _, lower, upper = _correct_position(series_key, position, value)
+        greater_than_or_equal = lower if lower == value else upper
+        # Prefer the lower value when equidistant, as find_nearest() does
+        nearest = lower if value - lower <= upper - value else upper
+        found[series_key] = Neighbours(lower, nearest, greater_than_or_equal)
+    return found
+
+
+def _merged_index(series_keys):
+    """The MergedIndex of a tuple of series keys, which is built on first use.
+
+    Raises:
+        ValueError: If series_keys is empty.
+        ValueError: If any series key is not known.
+    """
+    if not series_keys:
+        raise ValueError("At least one series key is required")
+    for series_key in series_keys:
+        series(series_key)
+    try:
+        return _MERGED_INDEXES[series_keys]
+    except KeyError:
+        log_mantissas = sorted(set(log_mantissa for series_key in series_keys
+                                   for log_mantissa in LOG10_MANTISSA_E[series_key]))
+        offsets = tuple([-1] + [bisect_right(LOG10_MANTISSA_E[series_key], log_mantissa) - 1
+                                for log_mantissa in log_mantissas]
+                        for series_key in series_keys)
+        widest_series_key = max(series_keys, key=lambda series_key: GEOMETRIC_SCALE_E[series_key])
+        index = MergedIndex(series_keys, log_mantissas, offsets, widest_series_key)
+        _MERGED_INDEXES[series_keys] = index
+        return index
+
+
+def _forget_series(series_key):
+    """Discard the merged indexes of an unregistered series."""
+    for series_keys in [series_keys for series_keys in _MERGED_INDEXES if series_key in series_keys]:
+        _MERGED_INDEXES.pop(series_keys, None)
+
+
+_UNREGISTER_HOOKS.append(_forget_series)
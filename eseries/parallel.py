@@ -0,0 +1,149 @@
+"""Finding the nearest series values for very many values, using a pool of processes.
+
+For example, to snap a large number of candidate values to the E96 series,
+consuming the results as they become available:
+
+    >>> from eseries import E96
+    >>> from eseries.parallel import find_nearest_parallel
+    >>> for nearest in find_nearest_parallel(E96, candidate_values, max_workers=4):
+    ...     process(nearest)
+
+The values are split into chunks, which are processed in worker processes,
+using eseries.arrays if NumPy is installed. Only a bounded number of chunks
+are in progress at any time, so arbitrarily long iterables of values can be
+processed in bounded memory.
+
+This module requires Python 3.7 or later.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+from array import array
+from collections import deque
+from itertools import islice
+
+from eseries.eseries import (series, tolerance, find_nearest, register_series, CustomSeries, _decade_table, _DECADE_TABLES,
+                             _SERIES_DECADE, _CUSTOM_SERIES)
+
+if sys.version_info < (3, 7):
+    raise ImportError("eseries.parallel requires Python 3.7 or later, for concurrent.futures.ProcessPoolExecutor "
+                      "with an initializer")
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# The number of chunks submitted for each worker process before waiting for
+# the earliest chunk to complete.
+_CHUNKS_PER_WORKER = 2
+
+# The series key in a worker process, which for a custom series is the key
+# registered in that process.
+_worker_series_key = None
+
+
+def find_nearest_parallel(series_key, values, max_workers=None, chunk_size=DEFAULT_CHUNK_SIZE, mp_context=None):
+    """Find the nearest values for many values, using a pool of processes.
+
+    Args:
+        series_key: The ESeries to use.
+        values: An iterable series of values, or a NumPy array of values,
+            which is processed in the order of its flattened elements.
+        max_workers: The number of worker processes. Defaults to the number
+            of processors, or one if it cannot be determined.
+        chunk_size: The number of values sent to a worker process at once.
+        mp_context: An optional multiprocessing context with which to start
+            the worker processes.
+
+    Yields:
+        For each value, in order, the value in the specified E-series closest
+        to it, as for eseries.find_nearest().
+
+    Raises:
+        ValueError: If series_key is not known.
+        ValueError: If chunk_size is less than one.
+        ValueError: If any value is not finite.
+        ValueError: If any value is out of range.
+    """
+    # Imported here so that the cost is only paid when a process pool is used
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import cpu_count
+
+    series(series_key)
+    if chunk_size < 1:
+        raise ValueError("chunk_size {} is not at least one".format(chunk_size))
+    try:
+        num_workers = max_workers or cpu_count()
+    except NotImplementedError:
+        num_workers = 1
+    max_pending = _CHUNKS_PER_WORKER * num_workers
+    # The decade table is sent to each worker process once, when it starts,
+    # rather than being rebuilt by each worker. It is copied into an array,
+    # since a table memory-mapped from the table cache can't be pickled.
+    with ProcessPoolExecutor(max_workers=num_workers,
+                             mp_context=mp_context,
+                             initializer=_initialize_worker,
+                             initargs=(series_key, _custom_series_definition(series_key),
+                                       array('d', _decade_table(series_key)))) as executor:
+        pending = deque()
+        try:
+            for chunk in _chunks(values, chunk_size):
+                pending.append(executor.submit(_find_nearest_chunk, chunk))
+                if len(pending) >= max_pending:
+                    for nearest in pending.popleft().result():
+                        yield nearest
+            while pending:
+                for nearest in pending.popleft().result():
+                    yield nearest
+        finally:
+            # If the consumer stops early, or a chunk fails, abandon the remaining chunks
+            for future in pending:
+                future.cancel()
+
+
+def _chunks(values, chunk_size):
+    if hasattr(values, 'shape') and hasattr(values, 'ravel'):
+        flat_values = values.ravel()
+        for begin in range(0, len(flat_values), chunk_size):
+            yield flat_values[begin:begin + chunk_size]
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _custom_series_definition(series_key):
+    """The arguments of register_series() for a custom series, or None for an ESeries.
+
+    Custom series keys are distinct for each registration, so a key sent to a
+    worker process is not registered there, and the series is registered
+    again in each worker process.
+    """
+    if not isinstance(series_key, CustomSeries):
+        return None
+    significant_figures = _SERIES_DECADE[series_key] + 1
+    return series_key.name, series(series_key), tolerance(series_key), significant_figures
+
+
+def _initialize_worker(series_key, definition, table):
+    global _worker_series_key
+    if definition is not None:
+        name, values, tol, significant_figures = definition
+        # A worker process started by forking has inherited the registration
+        series_key = _CUSTOM_SERIES.get(name) or register_series(name, values, tol, significant_figures)
+    _worker_series_key = series_key
+    _DECADE_TABLES[series_key] = table
+
+
+def _find_nearest_chunk(chunk):
+    series_key = _worker_series_key
+    # NumPy is optional, but processes whole chunks much faster when available
+    try:
+        from eseries.arrays import find_nearest_array
+    except ImportError:
+        return [find_nearest(series_key, value) for value in chunk]
+    return find_nearest_array(series_key, chunk).tolist()
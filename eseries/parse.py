@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Parsing of values written with SI prefixes or IEC 60062 RKM codes.
+
+This is the inverse of eseries.eng.eng_string(). The following are all
+accepted:
+
+    Plain numbers:        4700, 4.7e3, 0.0022
+    SI prefixes:          4.7k, 4.7 k, 2.2u, 2.2 µ, 1M
+    IEC 60062 RKM codes:  4k7, 4K7, 470R, R47, 2u2, 4n7, 1M0
+
+The prefix and RKM code letters are case-sensitive, so that m (milli) and
+M (mega), and p (pico) and P (peta), can be distinguished. In addition to
+the SI prefixes K is accepted for kilo, u for micro, and R and F, which
+stand for the decimal point in resistor and capacitor RKM codes, are
+accepted as a multiplier of one. Text which can be interpreted by float()
+is always interpreted that way, so 4E7 is 4e7, not 4.7 exa.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import re
+
+from eseries.eng import PREFIXES
+
+# The maximum number of distinct texts for which parse_values() retains the
+# parsed value, so that repeated texts are parsed only once.
+PARSE_VALUES_MEMO_SIZE = 4096
+
+# Decimal exponents keyed by prefix or RKM code letter
+MULTIPLIER_EXPONENTS = {letter: 3 * (index - PREFIXES.index(' '))
+                        for index, letter in enumerate(PREFIXES) if letter != ' '}
+MULTIPLIER_EXPONENTS.update({
+    'µ': -6,  # MICRO SIGN
+    'μ': -6,  # GREEK SMALL LETTER MU
+    'K': 3,
+    'R': 0,
+    'F': 0,
+})
+
+# Exponent suffixes for float(), keyed by prefix or RKM code letter
+_EXPONENT_SUFFIXES = {letter: 'e{}'.format(exponent) for letter, exponent in MULTIPLIER_EXPONENTS.items()}
+
+_MULTIPLIERS = ''.join(sorted(MULTIPLIER_EXPONENTS))
+
+_VALUE_PATTERN = re.compile(r"""
+    \s*
+    (?P<sign>[+-]?)
+    (?:
+        # A number with an optional prefix, e.g. 4.7k, 4.7 k, 470R
+        (?P<mantissa>\d+\.?\d*|\.\d+)(?:[eE](?P<exponent>[+-]?\d+))?\s*(?P<prefix>[{multipliers}])?
+    |
+        # An RKM code, e.g. 4k7, R47
+        (?P<integer>\d*)(?P<code>[{multipliers}])(?P<fraction>\d+)
+    )
+    \s*$
+""".format(multipliers=re.escape(_MULTIPLIERS)), re.VERBOSE)
+
+
+def parse_value(text):
+    """Parse a value written as a number, with an SI prefix, or as an RKM code.
+
+    Args:
+        text: The text to parse, such as '4.7k', '4k7' or '4700'.
+
+    Returns:
+        The value as a float.
+
+    Raises:
+        ValueError: If text could not be interpreted as a value.
+    """
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    # Fast path for a number followed by a prefix, e.g. 4.7k
+    text = text.strip()
+    suffix = _EXPONENT_SUFFIXES.get(text[-1:])
+    if suffix is not None:
+        try:
+            return float(text[:-1].rstrip() + suffix)
+        except ValueError:
+            pass
+    match = _VALUE_PATTERN.match(text)
+    if match is None:
+        raise ValueError("{!r} could not be interpreted as a value".format(text))
+    sign, mantissa, exponent, prefix, integer, code, fraction = match.group(
+        'sign', 'mantissa', 'exponent', 'prefix', 'integer', 'code', 'fraction')
+    if code is not None:
+        mantissa = '{}.{}'.format(integer, fraction)
+        exponent = MULTIPLIER_EXPONENTS[code]
+    else:
+        exponent = int(exponent or 0) + MULTIPLIER_EXPONENTS.get(prefix, 0)
+    # Formatting the decimal exponent into the text avoids the rounding error
+    # of multiplying by a power of ten, e.g. 2.2 * 1e-6 != 2.2e-6
+    return float('{}{}e{}'.format(sign, mantissa, exponent))
+
+
+def parse_values(texts):
+    """Parse many values written as numbers, with SI prefixes, or as RKM codes.
+
+    Repeated texts, such as the values in a bill of materials, are parsed only
+    once.
+
+    Args:
+        texts: An iterable series of texts, such as the lines of a file.
+            Leading and trailing whitespace is ignored.
+
+    Yields:
+        For each text, in order, the same value as parse_value().
+
+    Raises:
+        ValueError: If any text could not be interpreted as a value.
+    """
+    memo = {}
+    for text in texts:
+        value = memo.get(text)
+        if value is None:
+            value = parse_value(text)
+            if len(memo) < PARSE_VALUES_MEMO_SIZE:
+                memo[text] = value
+        yield value
@@ -0,0 +1,354 @@
+"""An HTTP service for looking up E-series values, using asyncio.
+
+Start the service from the command line with:
+
+    $ python -m eseries serve --port=8024
+
+Each function is exposed at a path of the same name, and is called with a
+POST request, the body of which is a JSON object of the arguments:
+
+    $ curl -d '{"series": "E24", "value": 319}' http://127.0.0.1:8024/find_nearest
+    {"result": 330.0}
+
+The find functions and the tolerance limit functions accept either a value
+or a list of values, and values may be numbers, or text such as "4k7" which
+is parsed with eseries.parse.parse_value(). The erange and open_erange
+functions accept start, stop, and optionally reverse and step arguments.
+Errors are reported with a 400 status and a JSON object with an error member.
+
+Lookups of single values which arrive concurrently, from any number of
+connections, are coalesced into a batch for each function and series, which
+is looked up at once using eseries.arrays when NumPy is installed. A batch is
+looked up as soon as it contains max_batch_size values, or when its first
+value has waited for max_latency seconds.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import json
+import math
+
+from eseries.eseries import (series_key_from_name, tolerance, erange, open_erange, find_nearest, find_nearest_few,
+                             find_greater_than_or_equal, find_greater_than, find_less_than_or_equal, find_less_than,
+                             lower_tolerance_limit, upper_tolerance_limit, tolerance_limits)
+from eseries.parse import parse_value
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8024
+DEFAULT_MAX_BATCH_SIZE = 1024
+DEFAULT_MAX_LATENCY = 0.002
+
+# The largest request body accepted, in bytes
+MAX_REQUEST_BODY_SIZE = 1 << 20
+
+# Functions of a series key and a value, keyed by name
+VALUE_FUNCTIONS = {function.__name__: function for function in (
+    find_nearest,
+    find_nearest_few,
+    find_greater_than_or_equal,
+    find_greater_than,
+    find_less_than_or_equal,
+    find_less_than,
+    lower_tolerance_limit,
+    upper_tolerance_limit,
+    tolerance_limits,
+)}
+
+# Functions of a series key and a range, keyed by name
+RANGE_FUNCTIONS = {function.__name__: function for function in (erange, open_erange)}
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+}
+
+
+class LookupBatcher(object):
+    """Coalesces concurrent lookups of single values into batches.
+
+    Attributes:
+        num_lookups: The number of values looked up.
+        num_batches: The number of batches in which they were looked up.
+    """
+
+    def __init__(self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_latency=DEFAULT_MAX_LATENCY):
+        """Initialise a batcher.
+
+        Args:
+            max_batch_size: The largest number of values looked up at once.
+            max_latency: The longest time, in seconds, for which a value
+                waits for others to join its batch.
+
+        Raises:
+            ValueError: If max_batch_size is less than one.
+            ValueError: If max_latency is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size {} is not at least one".format(max_batch_size))
+        if max_latency < 0:
+            raise ValueError("max_latency {} is negative".format(max_latency))
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency
+        self._pending = {}
+        self._timers = {}
+        self.num_lookups = 0
+        self.num_batches = 0
+
+    def lookup(self, function_name, series_key, value):
+        """Look up a value as part of a batch.
+
+        Must be called from a coroutine or callback running in the event loop.
+
+        Args:
+            function_name: The name of one of the VALUE_FUNCTIONS.
+            series_key: The series to use.
+            value: The value to look up.
+
+        Returns:
+            A future of the result of the function, or of the ValueError
+            it raises.
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        key = (function_name, series_key)
+        batch = self._pending.setdefault(key, [])
+        batch.append((value, future))
+        if len(batch) >= self._max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self._max_latency, self._flush, key)
+        return future
+
+    def _flush(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, ())
+        if not batch:
+            return
+        function_name, series_key = key
+        results = ()
+        try:
+            results = lookup_batch(function_name, series_key, [value for value, _ in batch])
+        finally:
+            # Every future is resolved, even if the lookup failed unexpectedly,
+            # so that no request in the batch waits forever.
+            for index, (_, future) in enumerate(batch):
+                if future.done():
+                    # The request was abandoned
+                    continue
+                result = results[index] if index < len(results) else RuntimeError("Lookup failed")
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+            self.num_lookups += len(batch)
+            self.num_batches += 1
+
+
+def lookup_batch(function_name, series_key, values):
+    """Look up many values at once.
+
+    Args:
+        function_name: The name of one of the VALUE_FUNCTIONS.
+        series_key: The series to use.
+        values: A sequence of values.
+
+    Returns:
+        A list containing, for each value, the result of the function, or
+        the exception it raised.
+    """
+    array_function = _array_function(function_name)
+    if array_function is not None:
+        try:
+            return array_function(series_key, values).tolist()
+        except Exception:
+            # Look up the values individually, to attribute the error to the
+            # values which caused it.
+            pass
+    function = VALUE_FUNCTIONS[function_name]
+    results = []
+    for value in values:
+        try:
+            results.append(function(series_key, value))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+def _array_function(function_name):
+    """The function of eseries.arrays equivalent to a function, or None."""
+    try:
+        # NumPy is optional, but looks up whole batches much faster when available
+        from eseries import arrays
+    except ImportError:
+        return None
+    return getattr(arrays, '{}_array'.format(function_name), None)
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, batcher=None):
+    """Start the service.
+
+    Args:
+        host: The address on which to listen.
+        port: The port on which to listen, or zero to choose a free port.
+        batcher: The LookupBatcher with which to look up values. Defaults
+            to a LookupBatcher with the default batch size and latency.
+
+    Returns:
+        An asyncio Server.
+    """
+    batcher = batcher or LookupBatcher()
+    return await asyncio.start_server(lambda reader, writer: _handle_connection(reader, writer, batcher),
+                                      host, port)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+          max_latency=DEFAULT_MAX_LATENCY):
+    """Run the service until interrupted.
+
+    Args:
+        host: The address on which to listen.
+        port: The port on which to listen.
+        max_batch_size: The largest number of values looked up at once.
+        max_latency: The longest time, in seconds, for which a value waits
+            for others to join its batch.
+
+    Raises:
+        ValueError: If max_batch_size is less than one.
+        ValueError: If max_latency is negative.
+    """
+    batcher = LookupBatcher(max_batch_size, max_latency)
+
+    async def run():
+        server = await start_server(host, port, batcher)
+        for socket in server.sockets:
+            print("Serving on http://{}:{}".format(*socket.getsockname()[:2]))
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+class _HttpError(Exception):
+
+    def __init__(self, status, message):
+        super(_HttpError, self).__init__(message)
+        self.status = status
+
+
+async def _handle_connection(reader, writer, batcher):
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except _HttpError as exc:
+                _write_response(writer, exc.status, {'error': str(exc)}, keep_alive=False)
+                break
+            if request is None:
+                break
+            method, path, keep_alive, body = request
+            status, response = await _respond(method, path, body, batcher)
+            _write_response(writer, status, response, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _read_request(reader):
+    """The method, path, whether to keep the connection alive, and body of a request, or None at the end."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode('latin-1').split()
+    except ValueError:
+        raise _HttpError(400, "Malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if not line.strip():
+            break
+        name, _, header_value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = header_value.strip()
+    try:
+        content_length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise _HttpError(400, "Malformed Content-Length")
+    if content_length > MAX_REQUEST_BODY_SIZE:
+        raise _HttpError(413, "Request body exceeds {} bytes".format(MAX_REQUEST_BODY_SIZE))
+    body = await reader.readexactly(content_length)
+    connection = headers.get('connection', '').lower()
+    keep_alive = connection == 'keep-alive' or (version == 'HTTP/1.1' and connection != 'close')
+    return method, target.partition('?')[0], keep_alive, body
+
+
+async def _respond(method, path, body, batcher):
+    """The status and JSON response for a request."""
+    function_name = path.strip('/')
+    if function_name not in VALUE_FUNCTIONS and function_name not in RANGE_FUNCTIONS and function_name != 'tolerance':
+        return 404, {'error': "No function at {}".format(path)}
+    if method != 'POST':
+        return 405, {'error': "Use POST to call {}".format(function_name)}
+    try:
+        arguments = json.loads(body.decode('utf-8'))
+        if not isinstance(arguments, dict):
+            raise ValueError("The request body must be a JSON object of arguments")
+        series_key = series_key_from_name(arguments['series'])
+        if function_name in VALUE_FUNCTIONS:
+            if 'values' in arguments:
+                result = await asyncio.gather(*(batcher.lookup(function_name, series_key, _value(value))
+                                                for value in arguments['values']))
+            else:
+                result = await batcher.lookup(function_name, series_key, _value(arguments['value']))
+        elif function_name in RANGE_FUNCTIONS:
+            result = list(RANGE_FUNCTIONS[function_name](series_key,
+                                                         _value(arguments['start']),
+                                                         _value(arguments['stop']),
+                                                         reverse=bool(arguments.get('reverse', False)),
+                                                         step=arguments.get('step', 1)))
+        else:
+            result = tolerance(series_key)
+    except KeyError as exc:
+        return 400, {'error': "Missing argument {}".format(exc)}
+    except (ValueError, TypeError, ArithmeticError) as exc:
+        return 400, {'error': str(exc)}
+    return 200, {'result': result}
+
+
+def _value(value):
+    """A finite float from a JSON number, or from text parsed with parse_value()."""
+    if isinstance(value, str):
+        value = parse_value(value)
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError("{!r} is not a number".format(value))
+    try:
+        value = float(value)
+    except OverflowError:
+        raise ValueError("{} is too large".format(value))
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError("{} is not finite".format(value))
+    return value
+
+
+def _write_response(writer, status, response, keep_alive):
+    body = json.dumps(response).encode('utf-8')
+    head = ("HTTP/1.1 {} {}\r\n"
+            "Content-Type: application/json\r\n"
+            "Content-Length: {}\r\n"
+            "Connection: {}\r\n"
+            "\r\n").format(status, _REASONS[status], len(body), 'keep-alive' if keep_alive else 'close')
+    writer.write(head.encode('latin-1') + body)
@@ -0,0 +1,238 @@
+"""An optional, persistent cache of the precomputed tables used by eseries.
+
+Tables such as the decade tables of series values, and the ratio tables used
+by eseries.dividers, are built on first use. When the table cache is enabled
+each table is also saved to a file in the cache directory, and subsequent
+processes memory-map the file instead of building the table again, so the
+time taken to start using a table does not grow with its size.
+
+Each file records a checksum of the version of the file format and of the
+inputs from which the table was built, such as the series values, and a
+digest of the tables themselves, so a file which is stale, for example
+because a custom series has been registered with different values, or which
+is damaged, is rebuilt automatically.
+
+The table cache is disabled by default. Enable it with enable_table_cache(),
+or by setting the ESERIES_TABLE_CACHE environment variable to the path of
+the cache directory, and optionally build all the tables in advance with
+build_table_cache().
+
+The table cache requires Python 3. On earlier versions the tables are
+always built on first use.
+"""
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import struct
+import sys
+from array import array
+
+TABLE_CACHE_VERSION = 2
+
+TABLE_CACHE_ENVIRONMENT_VARIABLE = 'ESERIES_TABLE_CACHE'
+
+# The file header comprises a magic number, the format version, the checksum
+# of the inputs, the digest of the arrays and the number of arrays. It is
+# followed by the typecode and length of each array, and then the items of
+# each array, each aligned to _ALIGNMENT bytes.
+_MAGIC = b'ESERITBL'
+_HEADER = struct.Struct('<8sI32s32sI')
+_ARRAY_HEADER = struct.Struct('<4sQ')
+_ALIGNMENT = 8
+
+_directory = None
+
+
+def enable_table_cache(directory=None):
+    """Save the precomputed tables to files, and memory-map them when they are next used.
+
+    Tables which have already been built in this process are not saved.
+
+    Args:
+        directory: The path of the cache directory, which is created if
+            necessary. Defaults to an eseries directory in the user's cache
+            directory.
+
+    Raises:
+        ValueError: If the version of Python is earlier than 3, which
+            cannot memory-map the tables as arrays.
+    """
+    global _directory
+    if sys.version_info < (3,):
+        raise ValueError("The table cache requires Python 3, for memoryview.cast() and os.replace()")
+    if directory is None:
+        directory = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                 'eseries')
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    _directory = directory
+
+
+def disable_table_cache():
+    """Stop saving and memory-mapping the precomputed tables.
+
+    Tables which have already been memory-mapped remain in use.
+    """
+    global _directory
+    _directory = None
+
+
+def table_cache_directory():
+    """The path of the cache directory, or None if the table cache is not enabled."""
+    return _directory
+
+
+def build_table_cache(series_keys=None):
+    """Build and save the precomputed tables for series, so later processes need not build them.
+
+    Args:
+        series_keys: An iterable series of series keys. Defaults to all
+            series.
+
+    Raises:
+        ValueError: If the table cache is not enabled.
+        ValueError: If any series_key is not known.
+    """
+    # Imported here to avoid circular imports
+    from eseries.eseries import series_keys as all_series_keys, _decade_table, _DECADE_TABLES
+    from eseries.dividers import _ratio_table, _RATIO_TABLES
+
+    if _directory is None:
+        raise ValueError("The table cache is not enabled")
+    for series_key in list(all_series_keys()) if series_keys is None else series_keys:
+        # Discard tables already built in this process, so that they are saved
+        _DECADE_TABLES.pop(series_key, None)
+        _RATIO_TABLES.pop(series_key, None)
+        _decade_table(series_key)
+        _ratio_table(series_key)
+
+
+def cached_tables(name, inputs, build):
+    """Memory-map tables from the cache, or build them and save them to the cache.
+
+    Args:
+        name: A name, unique to the tables, from which the file name is formed.
+        inputs: The inputs from which the tables are built, the repr() of
+            which is included in the checksum.
+        build: A function of no arguments which builds the tables, and
+            returns a tuple of arrays.
+
+    Returns:
+        A tuple of arrays, or of memoryviews of the cache file with the
+        same typecodes and items.
+    """
+    directory = _directory
+    if directory is None:
+        return build()
+    # Imported here so that the cost is only paid when the table cache is enabled
+    import hashlib
+    # The cache directory may be shared by other versions of Python or other
+    # machines, so anything which affects the layout of the arrays is included.
+    checksum = hashlib.sha256(repr((TABLE_CACHE_VERSION, sys.byteorder, name, inputs)).encode('utf-8')).digest()
+    path = os.path.join(directory, '{}.bin'.format(_file_name(name)))
+    tables = _load(path, checksum)
+    if tables is None:
+        tables = build()
+        _save(path, checksum, tables)
+    return tables
+
+
+def _file_name(name):
+    """A name safe to use as a file name, such as for the name of a custom series.
+
+    Names which contain other characters than letters, digits, hyphens and
+    underscores are made safe by replacing those characters, and are kept
+    distinct by appending a digest of the name.
+    """
+    import hashlib
+    import re
+    safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', name)
+    if safe_name == name:
+        return name
+    return '{}-{}'.format(safe_name, hashlib.sha256(name.encode('utf-8')).hexdigest()[:16])
+
+
+def _digest(chunks):
+    """The digest of an iterable series of byte strings or memoryviews."""
+    import hashlib
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.digest()
+
+
+def _load(path, checksum):
+    """The tables in a cache file, or None if the file is missing, stale or damaged."""
+    import mmap
+    try:
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):
+        return None
+    try:
+        magic, version, file_checksum, digest, num_tables = _HEADER.unpack_from(mapping)
+        if (magic, version, file_checksum) != (_MAGIC, TABLE_CACHE_VERSION, checksum):
+            return None
+        descriptors = [_ARRAY_HEADER.unpack_from(mapping, _HEADER.size + index * _ARRAY_HEADER.size)
+                       for index in range(num_tables)]
+        view = memoryview(mapping)
+        offset = _aligned(_HEADER.size + num_tables * _ARRAY_HEADER.size)
+        tables = []
+        for typecode, length in descriptors:
+            typecode = typecode.rstrip(b'\0').decode('ascii')
+            end = offset + length * array(typecode).itemsize
+            if end > len(mapping):
+                return None
+            tables.append(view[offset:end].cast(typecode))
+            offset = _aligned(end)
+        # Reading the whole file is much faster than building the tables
+        if _digest(table.cast('B') for table in tables) != digest:
+            return None
+        return tuple(tables)
+    except (struct.error, ValueError, TypeError):
+        return None
+
+
+def _save(path, checksum, tables):
+    """Save tables to a cache file, replacing any existing file atomically."""
+    import tempfile
+    digest = _digest(table.tobytes() for table in tables)
+    chunks = [_HEADER.pack(_MAGIC, TABLE_CACHE_VERSION, checksum, digest, len(tables))]
+    chunks.extend(_ARRAY_HEADER.pack(table.typecode.encode('ascii'), len(table)) for table in tables)
+    offset = sum(len(chunk) for chunk in chunks)
+    for table in tables:
+        chunks.append(b'\0' * (_aligned(offset) - offset))
+        data = table.tobytes()
+        chunks.append(data)
+        offset = _aligned(offset) + len(data)
+    # The cache is an optimisation, so a read-only or full cache directory
+    # is not an error.
+    try:
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    except (IOError, OSError):
+        return
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temporary_path, path)
+    except (IOError, OSError):
+        try:
+            os.remove(temporary_path)
+        except (IOError, OSError):
+            pass
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+if os.environ.get(TABLE_CACHE_ENVIRONMENT_VARIABLE):
+    try:
+        enable_table_cache(os.environ[TABLE_CACHE_ENVIRONMENT_VARIABLE])
+    except (IOError, OSError, ValueError):
+        # An unusable cache directory, or version of Python, must not prevent eseries being imported
+        pass
@@ -93,7 +93,7 @@ setup(
     # project is installed. For an analysis of "install_requires" vs pip's
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
-    install_requires=['docopt_subcommands>=4.0', 'future'],
+    install_requires=['docopt_subcommands>=4.0', 'future; python_version < "3"'],
 
     # List additional groups of dependencies here (e.g. development dependencies).
     # You can install these using the following syntax, for example:
@@ -102,6 +102,8 @@ setup(
         'dev': ['check-manifest', 'wheel', 'bumpversion', 'twine'],
         'doc': ['sphinx', 'cartouche'],
         'test': ['coverage', 'hypothesis', 'pytest'],
+        'numpy': ['numpy'],
+        'benchmark': ['pytest', 'pytest-benchmark'],
     },
 
     # If there are data files included in your packages that need to be
@@ -0,0 +1,6 @@
+import sys
+
+# Modules of tests for parts of eseries which require a later version of Python
+collect_ignore = []
+if sys.version_info < (3, 7):
+    collect_ignore.extend(['test_server.py', 'test_parallel.py'])
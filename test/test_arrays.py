@@ -0,0 +1,172 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import sampled_from, floats, lists, data, sets
+from pytest import raises
+
+np = pytest.importorskip("numpy")
+
+from eseries import (ESeries, series, E12, E24, find_nearest, find_less_than_or_equal, find_greater_than_or_equal,
+                     find_less_than)
+from eseries.arrays import (find_nearest_array, find_greater_than_or_equal_array, find_greater_than_array,
+                            find_less_than_or_equal_array, find_less_than_array, eng_string_array, IntervalArray,
+                            evaluate_intervals_array, find_multi_array)
+from eseries.multi import find_multi
+from eseries.intervals import Interval, parallel
+from eseries.eng import eng_string
+
+values_strategy = lists(floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False),
+                        min_size=1, max_size=50)
+
+
+@given(series_key=sampled_from(ESeries), values=values_strategy)
+def test_find_nearest_array_matches_scalar(series_key, values):
+    result = find_nearest_array(series_key, values)
+    assert result.tolist() == [find_nearest(series_key, value) for value in values]
+
+
+@given(series_key=sampled_from(ESeries), values=values_strategy)
+def test_find_less_than_or_equal_array_matches_scalar(series_key, values):
+    result = find_less_than_or_equal_array(series_key, values)
+    assert result.tolist() == [find_less_than_or_equal(series_key, value) for value in values]
+
+
+@given(series_key=sampled_from(ESeries), values=values_strategy)
+def test_find_greater_than_or_equal_array_matches_scalar(series_key, values):
+    result = find_greater_than_or_equal_array(series_key, values)
+    assert result.tolist() == [find_greater_than_or_equal(series_key, value) for value in values]
+
+
+@given(series_key=sampled_from(ESeries), values=values_strategy)
+def test_find_less_than_array_matches_scalar(series_key, values):
+    result = find_less_than_array(series_key, values)
+    assert result.tolist() == [find_less_than(series_key, value) for value in values]
+
+
+@given(series_key=sampled_from(ESeries), values=values_strategy)
+def test_find_greater_than_array(series_key, values):
+    values = np.array(values)
+    result = find_greater_than_array(series_key, values)
+    assert np.all(result > values)
+    assert np.array_equal(result, find_greater_than_or_equal_array(series_key, np.nextafter(values, np.inf)))
+
+
+@given(data())
+def test_array_results_for_series_members(data):
+    series_key = data.draw(sampled_from(ESeries))
+    values = np.array(series(series_key), dtype=float)
+    assert np.array_equal(find_nearest_array(series_key, values), values)
+    assert np.array_equal(find_less_than_or_equal_array(series_key, values), values)
+    assert np.array_equal(find_greater_than_or_equal_array(series_key, values), values)
+    assert np.all(find_less_than_array(series_key, values) < values)
+    assert np.all(find_greater_than_array(series_key, values) > values)
+
+
+def test_find_nearest_array_preserves_shape():
+    result = find_nearest_array(E12, [[21, 21000], [0.021, 3.3e-9]])
+    assert result.shape == (2, 2)
+    assert result.tolist() == [[22, 22000], [0.022, 3.3e-9]]
+
+
+def test_find_nearest_array_scalar_argument():
+    assert find_nearest_array(E24, 319) == 330
+
+
+def test_find_nearest_array_empty():
+    assert find_nearest_array(E24, []).shape == (0,)
+
+
+def test_find_nearest_array_too_small_raises_value_error():
+    with raises(ValueError):
+        find_nearest_array(E12, [10, 0])
+
+
+def test_find_nearest_array_infinite_raises_value_error():
+    with raises(ValueError):
+        find_nearest_array(E12, [10, float("inf")])
+
+
+def test_find_nearest_array_nan_raises_value_error():
+    with raises(ValueError):
+        find_nearest_array(E12, [float("nan")])
+
+
+def test_find_nearest_array_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        find_nearest_array(13, [10])
+
+
+@given(values=lists(floats(allow_nan=False, allow_infinity=False, allow_subnormal=False), max_size=50))
+def test_eng_string_array_matches_scalar(values):
+    for prefix in (False, True):
+        result = eng_string_array(values, prefix=prefix)
+        assert result.tolist() == [eng_string(value, prefix=prefix) for value in values]
+
+
+def test_eng_string_array_preserves_shape():
+    result = eng_string_array([[1000, 4700], [0.0047, 1000]])
+    assert result.tolist() == [['1 k', '4.7 k'], ['4.7 m', '1 k']]
+
+
+@given(series_key=sampled_from(ESeries), nominals=values_strategy)
+def test_interval_array_from_series_matches_scalar(series_key, nominals):
+    intervals = IntervalArray.from_series(series_key, nominals)
+    assert [intervals[i] for i in range(len(nominals))] == [Interval.from_series(series_key, nominal)
+                                                             for nominal in nominals]
+
+
+def rc_low_pass(r1, r2, c):
+    return 1 / (parallel(r1, r2) * c)
+
+
+def test_evaluate_intervals_array_matches_scalar():
+    r1 = [1e3, 2.2e3, 4.7e3, 10e3]
+    r2 = [4.7e3, 4.7e3, 4.7e3, 4.7e3]
+    c = 100e-9
+    result = evaluate_intervals_array(rc_low_pass, [(E24, r1), (E24, r2), (E12, c)])
+    expected = [rc_low_pass(Interval.from_series(E24, a), Interval.from_series(E24, b), Interval.from_series(E12, c))
+                for a, b in zip(r1, r2)]
+    assert [result[i] for i in range(len(r1))] == expected
+
+
+def test_interval_array_with_intervals_and_arrays():
+    intervals = IntervalArray.from_series(E12, [1.0, 2.2])
+    interval = Interval.from_series(E12, 1.0)
+    assert (interval + intervals)[1] == interval + intervals[1]
+    assert (interval - intervals)[1] == interval - intervals[1]
+    assert (np.array([2.0, 3.0]) * intervals)[1] == 3.0 * intervals[1]
+    assert interval.parallel(intervals)[0] == interval.parallel(intervals[0])
+
+
+def test_interval_array_slice():
+    intervals = IntervalArray.from_series(E12, [1.0, 2.2, 4.7])
+    assert isinstance(intervals[1:], IntervalArray)
+    assert intervals[1:].nominal.tolist() == [2.2, 4.7]
+
+
+def test_interval_array_reciprocal_containing_zero_raises_zero_division_error():
+    with raises(ZeroDivisionError):
+        IntervalArray([1.0, 0.0], [0.5, -1.0], [1.5, 1.0]).reciprocal()
+
+
+def test_interval_array_nominal_outside_limits_raises_value_error():
+    with raises(ValueError):
+        IntervalArray([1.0, 3.0], [0.5, 0.0], [1.5, 2.0])
+
+
+@given(series_keys=sets(sampled_from(ESeries), min_size=1), values=values_strategy)
+def test_find_multi_array_matches_find_multi(series_keys, values):
+    found = find_multi_array(series_keys, values)
+    expected = [find_multi(series_keys, value) for value in values]
+    for series_key, neighbours in found.items():
+        assert [tuple(items) for items in zip(*(array.tolist() for array in neighbours))] == \
+            [tuple(found_for_value[series_key]) for found_for_value in expected]
+
+
+def test_find_multi_array_preserves_shape():
+    found = find_multi_array([E12, E24], np.array([[1.1, 2.1], [3.1, 4.1]]))
+    assert found[E12].nearest.shape == (2, 2)
+
+
+def test_find_multi_array_out_of_range_raises_value_error():
+    with raises(ValueError):
+        find_multi_array([E12, E24], [1.0, float('inf')])
@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import sampled_from, floats
+from pytest import raises
+
+from eseries import (ESeries, E12, E24, find_nearest, find_nearest_few, find_greater_than_or_equal, enable_cache,
+                     disable_cache, clear_cache, cache_info)
+from eseries.eseries import tolerance_limits
+
+
+@pytest.fixture(autouse=True)
+def cache_disabled_afterwards():
+    yield
+    disable_cache()
+
+
+def test_cache_is_disabled_by_default():
+    assert cache_info() is None
+
+
+def test_cache_records_misses_then_hits():
+    enable_cache(maxsize=10)
+    assert find_nearest(E24, 319) == 330
+    assert find_nearest(E24, 319) == 330
+    info = cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_cache_is_keyed_on_series_and_value():
+    enable_cache(maxsize=10)
+    assert find_nearest(E12, 21) == 22
+    assert find_nearest(E24, 21) == 20
+    assert find_nearest(E12, 26) == 27
+    assert cache_info().misses == 3
+
+
+def test_cache_is_keyed_on_function():
+    enable_cache(maxsize=10)
+    assert find_nearest(E24, 21) == 20
+    assert find_greater_than_or_equal(E24, 21) == 22
+    assert find_nearest_few(E24, 21) == (18, 20, 22)
+    assert cache_info().misses == 3
+
+
+def test_cache_evicts_least_recently_used():
+    enable_cache(maxsize=2)
+    find_nearest(E24, 1)
+    find_nearest(E24, 2)
+    find_nearest(E24, 1)
+    find_nearest(E24, 3)
+    info = cache_info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+    find_nearest(E24, 1)
+    assert cache_info().hits == 2
+
+
+def test_cache_tolerance_limits():
+    enable_cache(maxsize=10)
+    assert tolerance_limits(E12, 100) == tolerance_limits(E12, 100)
+    assert cache_info().hits == 1
+
+
+def test_clear_cache_resets_statistics():
+    enable_cache(maxsize=10)
+    find_nearest(E24, 319)
+    find_nearest(E24, 319)
+    clear_cache()
+    assert cache_info() == (0, 0, 0, 10, 0)
+
+
+def test_clear_cache_when_disabled_has_no_effect():
+    clear_cache()
+    assert cache_info() is None
+
+
+def test_errors_are_not_cached():
+    enable_cache(maxsize=10)
+    for _ in range(2):
+        with raises(ValueError):
+            find_nearest(E12, float("inf"))
+    assert cache_info().currsize == 0
+
+
+def test_enable_cache_with_zero_size_raises_value_error():
+    with raises(ValueError):
+        enable_cache(maxsize=0)
+
+
+@given(series_key=sampled_from(ESeries),
+       value=floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False))
+def test_cached_results_match_uncached_results(series_key, value):
+    disable_cache()
+    expected = find_nearest_few(series_key, value)
+    enable_cache(maxsize=4)
+    assert find_nearest_few(series_key, value) == expected
+    assert find_nearest_few(series_key, value) == expected
+
+
+def test_cache_is_thread_safe():
+    enable_cache(maxsize=50)
+    values = [1.0 + i / 100 for i in range(100)]
+    expected = [find_nearest(E24, value) for value in values]
+    clear_cache()
+    errors = []
+
+    def worker():
+        for _ in range(20):
+            if [find_nearest(E24, value) for value in values] != expected:
+                errors.append(True)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    info = cache_info()
+    assert info.hits + info.misses == 8 * 20 * 100
+    assert info.currsize == 50
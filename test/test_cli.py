@@ -1,6 +1,15 @@
+import io
+import json
 import os
+import sys
+
+import pytest
 
 from eseries.cli import main
+from eseries.instrumentation import instrumentation_snapshot
+
+# The server uses async syntax and asyncio.run()
+requires_server = pytest.mark.skipif(sys.version_info < (3, 7), reason="The server requires Python 3.7 or later")
 
 
 def test_nearest(capfd):
@@ -17,6 +26,20 @@ def test_nearest_with_symbol(capfd):
     assert out == "22 k\n"
 
 
+def test_nearest_rkm_code(capfd):
+    code = main("nearest E12 4k5 -s".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "4.7 k\n"
+
+
+def test_range_si_prefixes(capfd):
+    code = main("range E6 1k 3.3k -s".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "1 k\n1.5 k\n2.2 k\n3.3 k\n"
+
+
 def test_nearby(capfd):
     code = main("nearby E24 21".split())
     out, err = capfd.readouterr()
@@ -134,4 +157,135 @@ def test_bogus_value_gives_exit_code_ex_dataerr():
 
 def test_malformed_command_gives_code_ex_usage():
     code = main("foo E13 316".split())
-    assert code == os.EX_USAGE
\ No newline at end of file
+    assert code == os.EX_USAGE
+
+def test_nearest_stdin(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("21\n21000\n330\n"))
+    code = main("nearest E12 --stdin".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "22\n22e3\n330\n"
+
+
+def test_nearest_stdin_with_symbol(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("21000\n"))
+    code = main("nearest E12 --stdin -s".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "22 k\n"
+
+
+def test_nearest_stdin_rkm_codes(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("4k5\nR33\n2.1 M\n"))
+    code = main("nearest E12 --stdin -s".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "4.7 k\n330 m\n2.2 M\n"
+
+
+def test_nearby_stdin_prints_one_line_per_value(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("21\n5000\n"))
+    code = main("nearby E24 --stdin".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "18\t20\t22\n4.7e3\t5.1e3\t5.6e3\n"
+
+
+def test_nearby_stdin_in_highest_decade_of_floats(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("1.7e308\n21\n"))
+    code = main("nearby E96 --stdin".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "165e306\t169e306\t174e306\n20.5\t21\t21.5\n"
+
+
+def test_tolerance_limits_stdin(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("316\n"))
+    code = main("tolerance-limits E48 --stdin".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "310\t322\n"
+
+
+def test_stdin_passes_through_blank_lines(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("21\n\n 26 \n"))
+    code = main("ge E24 --stdin".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "22\n\n27\n"
+
+
+def test_stdin_reports_errors_without_aborting(capfd, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO("21\nFOO\n0\n26\n"))
+    code = main("le E24 --stdin".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_DATAERR
+    assert out == "20\n\n\n24\n"
+    assert "Line 2" in err
+    assert "Line 3" in err
+
+
+class FlushRecordingStream(io.StringIO):
+    """A text stream which records its contents each time it is flushed."""
+
+    def __init__(self):
+        super(FlushRecordingStream, self).__init__()
+        self.flushed = []
+
+    def flush(self):
+        self.flushed.append(self.getvalue())
+
+
+def test_stdin_results_are_flushed_line_by_line(monkeypatch):
+    stdout = FlushRecordingStream()
+    monkeypatch.setattr('sys.stdin', io.StringIO("21\n26\n"))
+    monkeypatch.setattr('sys.stdout', stdout)
+    code = main("ge E24 --stdin".split())
+    assert code == os.EX_OK
+    assert stdout.flushed[:2] == ["22\n", "22\n27\n"]
+
+
+def test_file(capfd, tmp_path):
+    path = tmp_path / "values.txt"
+    path.write_text(u"21\n21000\n")
+    code = main(["lt", "E24", "--file", str(path)])
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "20\n20e3\n"
+
+
+def test_missing_file_gives_exit_code_ex_noinput(tmp_path):
+    code = main(["lt", "E24", "--file", str(tmp_path / "missing.txt")])
+    assert code == os.EX_NOINPUT
+
+
+@requires_server
+def test_serve(monkeypatch):
+    import eseries.server
+    calls = []
+    monkeypatch.setattr(eseries.server, 'serve', lambda **kwargs: calls.append(kwargs))
+    code = main("serve --port=8080 --batch-size=100 --latency=5".split())
+    assert code == os.EX_OK
+    assert calls == [dict(host='127.0.0.1', port=8080, max_batch_size=100, max_latency=0.005)]
+
+
+@requires_server
+def test_serve_invalid_port_gives_exit_code_ex_dataerr():
+    code = main("serve --port=http".split())
+    assert code == os.EX_DATAERR
+
+
+def test_profile(capfd):
+    code = main("--profile range E12 1k 3k -s".split())
+    out, err = capfd.readouterr()
+    assert code == os.EX_OK
+    assert out == "1 k\n1.2 k\n1.5 k\n1.8 k\n2.2 k\n2.7 k\n"
+    profile = json.loads(err)
+    assert profile['erange']['calls'] == 1
+    assert profile['eng_string']['calls'] == 6
+    assert instrumentation_snapshot() is None
+
+
+def test_profile_after_command_is_not_profiling(capfd):
+    code = main("tolerance E12 --profile".split())
+    assert code == os.EX_USAGE
@@ -0,0 +1,120 @@
+from itertools import combinations_with_replacement
+
+from hypothesis import given, settings
+from hypothesis.strategies import sampled_from, floats, integers
+from pytest import raises
+
+from eseries import ESeries, E6, E12, E24, E96, erange, register_series, unregister_series
+from eseries.combinations import (find_combinations, find_combinations_batch, Combination, SERIES, PARALLEL, MAX_TABLES,
+                                  _TABLES)
+
+
+def brute_force_errors(series_key, target, decades, topologies):
+    values = list(erange(series_key, target / 10 ** decades, target * 10 ** decades))
+    errors = []
+    for first, second in combinations_with_replacement(values, 2):
+        if SERIES in topologies:
+            errors.append(abs((first + second - target) / target))
+        if PARALLEL in topologies:
+            errors.append(abs((first * second / (first + second) - target) / target))
+    return sorted(errors)
+
+
+@settings(deadline=None, max_examples=50)
+@given(series_key=sampled_from([ESeries.E3, ESeries.E6, ESeries.E12, ESeries.E24]),
+       target=floats(min_value=1e-6, max_value=1e9),
+       num=integers(min_value=1, max_value=20),
+       topologies=sampled_from([(SERIES,), (PARALLEL,), (SERIES, PARALLEL)]))
+def test_find_combinations_matches_brute_force(series_key, target, num, topologies):
+    combinations = find_combinations(series_key, target, num=num, topologies=topologies)
+    expected = brute_force_errors(series_key, target, 1, topologies)[:num]
+    assert [abs(combination.error) for combination in combinations] == expected
+
+
+@given(series_key=sampled_from(ESeries),
+       target=floats(min_value=1e-6, max_value=1e9))
+def test_combination_attributes_are_consistent(series_key, target):
+    for combination in find_combinations(series_key, target, num=5):
+        assert combination.first <= combination.second
+        if combination.topology == SERIES:
+            assert combination.value == combination.first + combination.second
+        else:
+            assert combination.value < combination.first
+        assert combination.error == (combination.value - target) / target
+
+
+def test_find_combinations_exact_series():
+    assert find_combinations(E96, 1234) == [Combination(SERIES, 536, 698, 1234, 0.0)]
+
+
+def test_find_combinations_exact_parallel():
+    assert find_combinations(E12, 1100, topologies=[PARALLEL]) == [Combination(PARALLEL, 2200, 2200, 1100, 0.0)]
+
+
+def test_find_combinations_ordered_by_absolute_error():
+    errors = [abs(combination.error) for combination in find_combinations(E24, 4321, num=100)]
+    assert len(errors) == 100
+    assert errors == sorted(errors)
+
+
+def test_find_combinations_batch():
+    targets = [1234, 5.6e-9, 3.3e6, 1234]
+    results = list(find_combinations_batch(E96, targets, num=3))
+    assert results == [find_combinations(E96, target, num=3) for target in targets]
+
+
+def test_find_combinations_with_wider_window_is_no_worse():
+    narrow = find_combinations(E6, 1234, decades=1)[0]
+    wide = find_combinations(E6, 1234, decades=2)[0]
+    assert abs(wide.error) <= abs(narrow.error)
+
+
+def test_find_combinations_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        find_combinations(13, 1234)
+
+
+def test_find_combinations_non_positive_target_raises_value_error():
+    with raises(ValueError):
+        find_combinations(E24, 0)
+
+
+def test_find_combinations_infinite_target_raises_value_error():
+    with raises(ValueError):
+        find_combinations(E24, float('inf'))
+
+
+def test_find_combinations_zero_num_raises_value_error():
+    with raises(ValueError):
+        find_combinations(E24, 1234, num=0)
+
+
+def test_find_combinations_zero_decades_raises_value_error():
+    with raises(ValueError):
+        find_combinations(E24, 1234, decades=0)
+
+
+def test_find_combinations_unknown_topology_raises_value_error():
+    with raises(ValueError):
+        find_combinations(E24, 1234, topologies=['bridge'])
+
+
+def test_find_combinations_target_out_of_range_raises_value_error():
+    with raises(ValueError):
+        find_combinations(E24, 1e307)
+
+
+def test_retained_tables_are_bounded():
+    for decade in range(MAX_TABLES + 12):
+        find_combinations(E24, 10.0 ** decade)
+    assert len(_TABLES) == MAX_TABLES
+    assert (E24, -1, 1) not in _TABLES
+
+
+def test_find_combinations_with_unregistered_series_raises_value_error():
+    series_key = register_series('REELS', [1.0, 2.2, 4.7], tolerance=0.05)
+    find_combinations(series_key, 1234)
+    unregister_series(series_key)
+    assert not any(key[0] is series_key for key in _TABLES)
+    with raises(ValueError):
+        find_combinations(series_key, 1234)
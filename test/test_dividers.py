@@ -0,0 +1,102 @@
+from hypothesis import given, settings
+from hypothesis.strategies import sampled_from, floats, integers
+from pytest import raises, approx
+
+from eseries import ESeries, E3, E12, E24, open_erange, tolerance, register_series, unregister_series
+from eseries.dividers import find_dividers, find_dividers_batch, divider_ratio, Divider, _RATIO_TABLES
+
+
+def brute_force_errors(series_key, ratio):
+    upper_values = list(open_erange(series_key, 1e-5, 1e6))
+    lower_values = list(open_erange(series_key, 1, 10))
+    return sorted(abs((upper / lower - ratio) / ratio) for upper in upper_values for lower in lower_values)
+
+
+@settings(deadline=None, max_examples=50)
+@given(series_key=sampled_from([ESeries.E3, ESeries.E6, ESeries.E12, ESeries.E24]),
+       ratio=floats(min_value=0.01, max_value=100),
+       num=integers(min_value=1, max_value=20))
+def test_find_dividers_matches_brute_force(series_key, ratio, num):
+    dividers = find_dividers(series_key, ratio, num=num)
+    expected = brute_force_errors(series_key, ratio)[:num]
+    assert [abs(divider.error) for divider in dividers] == approx(expected, rel=1e-9, abs=1e-15)
+
+
+@given(series_key=sampled_from(ESeries),
+       ratio=floats(min_value=1e-6, max_value=1e6))
+def test_divider_attributes_are_consistent(series_key, ratio):
+    tol = tolerance(series_key)
+    for divider in find_dividers(series_key, ratio, num=5):
+        assert 1 <= divider.r2 < 10
+        assert divider.ratio == divider.r1 / divider.r2
+        assert divider.error == (divider.ratio - ratio) / ratio
+        assert divider.worst_case_error >= abs(divider.error)
+        assert divider.worst_case_error == approx(max(
+            abs(divider.ratio * (1 - tol) / (1 + tol) - ratio) / ratio,
+            abs(divider.ratio * (1 + tol) / (1 - tol) - ratio) / ratio))
+
+
+def test_find_dividers_exact_ratio():
+    assert find_dividers(E24, divider_ratio(3.3, 0.8)) == [
+        Divider(7.5, 2.4, 3.125, approx(0.0, abs=1e-15), approx(0.105263157894737))]
+
+
+def test_find_dividers_ordered_by_absolute_error():
+    errors = [abs(divider.error) for divider in find_dividers(E24, 0.4321, num=100)]
+    assert len(errors) == 100
+    assert errors == approx(sorted(errors), rel=1e-12)
+
+
+def test_find_dividers_continues_into_adjacent_decades():
+    dividers = find_dividers(E3, 2, num=100)
+    assert len(dividers) == 100
+    assert len(set(dividers)) == 100
+
+
+def test_find_dividers_batch():
+    ratios = [0.4321, 3.125, 1e-4, 0.4321]
+    results = list(find_dividers_batch(E12, ratios, num=3))
+    assert results == [find_dividers(E12, ratio, num=3) for ratio in ratios]
+
+
+def test_divider_ratio():
+    assert divider_ratio(5.0, 1.25) == 3.0
+
+
+def test_divider_ratio_output_above_input_raises_value_error():
+    with raises(ValueError):
+        divider_ratio(1.25, 5.0)
+
+
+def test_divider_ratio_non_positive_output_raises_value_error():
+    with raises(ValueError):
+        divider_ratio(5.0, 0.0)
+
+
+def test_find_dividers_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        find_dividers(13, 0.5)
+
+
+def test_find_dividers_non_positive_ratio_raises_value_error():
+    with raises(ValueError):
+        find_dividers(E24, 0)
+
+
+def test_find_dividers_nan_ratio_raises_value_error():
+    with raises(ValueError):
+        find_dividers(E24, float('nan'))
+
+
+def test_find_dividers_zero_num_raises_value_error():
+    with raises(ValueError):
+        find_dividers(E24, 0.5, num=0)
+
+
+def test_find_dividers_with_unregistered_series_raises_value_error():
+    series_key = register_series('REELS', [1.0, 2.2, 4.7], tolerance=0.05)
+    find_dividers(series_key, 0.5)
+    unregister_series(series_key)
+    assert series_key not in _RATIO_TABLES
+    with raises(ValueError):
+        find_dividers(series_key, 0.5)
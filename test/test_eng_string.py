@@ -1,7 +1,10 @@
+import pytest
 from hypothesis import given
-from hypothesis.strategies import integers, floats
+from hypothesis.strategies import integers, floats, lists, booleans, one_of
 
-from eseries.eng import eng_string
+from eseries import ESeries, erange
+from eseries.eng import eng_string, eng_strings
+from eseries import eng
 
 
 def test_eng_string_zero():
@@ -35,4 +38,29 @@ def test_eng_string_kilo(x):
 
 @given(x=floats(min_value=1000000, max_value=999999999))
 def test_eng_string_mega(x):
-    assert eng_string(x, prefix=True).endswith(' M')
\ No newline at end of file
+    assert eng_string(x, prefix=True).endswith(' M')
+
+
+@given(values=lists(one_of(floats(allow_nan=False, allow_infinity=False, allow_subnormal=False), integers())),
+       sig_figs=integers(min_value=1, max_value=6),
+       prefix=booleans())
+def test_eng_strings_matches_eng_string(values, sig_figs, prefix):
+    assert list(eng_strings(values, sig_figs, prefix)) == [eng_string(value, sig_figs, prefix) for value in values]
+
+
+@pytest.mark.parametrize("prefix", [False, True])
+@pytest.mark.parametrize("series_key", list(ESeries), ids=lambda series_key: series_key.name)
+def test_eng_strings_matches_eng_string_for_series_values(series_key, prefix):
+    values = list(erange(series_key, 1e-30, 1e30)) * 2
+    assert list(eng_strings(values, prefix=prefix)) == [eng_string(value, prefix=prefix) for value in values]
+
+
+def test_eng_strings_beyond_memo_size(monkeypatch):
+    monkeypatch.setattr(eng, 'ENG_STRINGS_MEMO_SIZE', 2)
+    values = [1000, 2200, 4700, 1000, 4700, 6800, 4700]
+    assert list(eng_strings(values)) == [eng_string(value) for value in values]
+
+
+def test_eng_strings_is_lazy():
+    texts = eng_strings(iter([1000, 'not a number']))
+    assert next(texts) == '1 k'
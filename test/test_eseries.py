@@ -1,11 +1,15 @@
 import math
+
+import pytest
 from hypothesis import given, assume
-from hypothesis.strategies import sampled_from, floats, data, integers
+from hypothesis.strategies import sampled_from, floats, data, integers, lists
 from pytest import raises
 
 from eseries import (ESeries, series, erange, find_less_than_or_equal, find_greater_than_or_equal, find_nearest,
-                     find_less_than, find_greater_than, find_nearest_few, open_erange)
-from eseries.eseries import lower_tolerance_limit, upper_tolerance_limit, tolerance_limits, E12, tolerance
+                     find_less_than, find_greater_than, find_nearest_few, open_erange, is_member, is_member_batch,
+                     classify, classify_batch, find_k_nearest, find_k_nearest_batch, ExactValue)
+from eseries.eseries import (lower_tolerance_limit, upper_tolerance_limit, tolerance_limits, E12, tolerance,
+                             GEOMETRIC_SCALE_E)
 
 
 @given(series_key=sampled_from(ESeries))
@@ -34,6 +38,57 @@ def test_open_erange_cardinality_over_one_order_of_magnitude(series_key, low):
     assert len(values) == cardinality
 
 
+@given(series_key=sampled_from(ESeries),
+       low=floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False),
+       decades=integers(min_value=0, max_value=3),
+       step=integers(min_value=1, max_value=50))
+def test_erange_reverse_and_step(series_key, low, decades, step):
+    high = low * 10.0 ** decades
+    values = list(erange(series_key, low, high))
+    assert list(erange(series_key, low, high, step=step)) == values[::step]
+    assert list(erange(series_key, low, high, reverse=True)) == values[::-1]
+    assert list(erange(series_key, low, high, reverse=True, step=step)) == values[::-1][::step]
+
+
+@given(series_key=sampled_from(ESeries),
+       low=floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False),
+       decades=integers(min_value=0, max_value=3),
+       step=integers(min_value=1, max_value=50))
+def test_open_erange_reverse_and_step(series_key, low, decades, step):
+    high = low * 10.0 ** decades
+    values = list(open_erange(series_key, low, high))
+    assert list(open_erange(series_key, low, high, step=step)) == values[::step]
+    assert list(open_erange(series_key, low, high, reverse=True)) == values[::-1]
+    assert list(open_erange(series_key, low, high, reverse=True, step=step)) == values[::-1][::step]
+
+
+def test_erange_reverse_includes_lowest_table_value():
+    assert list(erange(E12, 1e-15, 1.5e-15, reverse=True)) == [1.5e-15, 1.2e-15, 1e-15]
+
+
+def test_erange_reverse_includes_highest_table_value():
+    assert list(erange(E12, 5.6e12, 8.2e12, reverse=True)) == [8.2e12, 6.8e12, 5.6e12]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("start, stop", [(9e-16, 9.5e-16), (1.01e-15, 1.1e-15), (8.3e12, 9.5e12)])
+def test_erange_empty_at_table_boundaries(start, stop, reverse):
+    assert list(erange(E12, start, stop, reverse=reverse)) == []
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("start, stop", [(1e-15, 1e-15), (9e-16, 1e-15), (8.2e12, 8.2e12), (8.3e12, 1e13)])
+def test_open_erange_empty_at_table_boundaries(start, stop, reverse):
+    assert list(open_erange(E12, start, stop, reverse=reverse)) == []
+
+
+@pytest.mark.parametrize("series_key", list(ESeries))
+def test_erange_stop_in_highest_decade_of_floats(series_key):
+    values = list(erange(series_key, 1e300, 1.79e308))
+    assert values[-1] <= 1.79e308 < values[-1] * GEOMETRIC_SCALE_E[series_key] ** 1.5
+    assert list(open_erange(series_key, 1e300, 1.79e308)) == values
+
+
 @given(series_key=sampled_from(ESeries),
        value=floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False))
 def test_less_than_or_equal(series_key, value):
@@ -170,6 +225,21 @@ def test_erange_start_stop_in_wrong_order_raises_value_error():
         erange(E12, 10, 8)
 
 
+def test_erange_zero_step_raises_value_error():
+    with raises(ValueError):
+        erange(E12, 1, 10, step=0)
+
+
+def test_erange_non_integer_step_raises_value_error():
+    with raises(ValueError):
+        erange(E12, 1, 10, step=1.5)
+
+
+def test_erange_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        erange(13, 1, 10)
+
+
 def test_open_erange_start_infinite_raises_value_error():
     with raises(ValueError):
         inf = float("inf")
@@ -196,6 +266,11 @@ def test_open_erange_start_stop_in_wrong_order_raises_value_error():
         open_erange(E12, 10, 8)
 
 
+def test_open_erange_zero_step_raises_value_error():
+    with raises(ValueError):
+        open_erange(E12, 1, 10, step=0)
+
+
 def test_illegal_series_key_raises_value_error():
     with raises(ValueError):
         series(13)
@@ -203,4 +278,119 @@ def test_illegal_series_key_raises_value_error():
 
 def test_illegal_series_key_for_tolerance_raises_value_error():
     with raises(ValueError):
-        tolerance(13)
\ No newline at end of file
+        tolerance(13)
+
+def test_greater_than_series_member_with_equidistant_neighbours():
+    assert find_greater_than(ESeries.E24, 1.3) == 1.5
+
+
+def test_less_than_series_member_with_equidistant_neighbours():
+    assert find_less_than(ESeries.E192, 1.13) == 1.11
+
+
+def test_find_nearest_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        find_nearest(13, 10)
+
+
+@given(series_key=sampled_from(ESeries),
+       low=floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False))
+def test_series_values_are_members(series_key, low):
+    for value in erange(series_key, low, low * 10):
+        assert is_member(series_key, value)
+        assert not is_member(series_key, value * 1.000001)
+
+
+@given(value=floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False))
+def test_classify_matches_find_nearest(value):
+    value = find_nearest(ESeries.E192, value)
+    expected = next((series_key for series_key in ESeries
+                     if math.isclose(find_nearest(series_key, value), value, rel_tol=1e-9)), None)
+    assert classify(value) == expected
+
+
+def test_classify_coarsest_series():
+    assert classify(4700) == ESeries.E3
+    assert classify(5100) == ESeries.E24
+    assert classify(1.13) == ESeries.E96
+    assert classify(1.01) == ESeries.E192
+    assert classify(1e-12) == ESeries.E3
+
+
+def test_classify_non_member_is_none():
+    assert classify(4701) is None
+
+
+def test_classify_allows_floating_point_error():
+    assert classify(1.1 * 3) == ESeries.E6
+    assert classify(9.999999999999e5) == ESeries.E3
+
+
+def test_classify_with_tolerance():
+    assert classify(4701, rel_tol=1e-3) == ESeries.E3
+
+
+def test_not_finite_and_positive_values_are_not_members():
+    for value in (0, -4.7, float("nan"), float("inf")):
+        assert not is_member(ESeries.E3, value)
+        assert classify(value) is None
+
+
+def test_is_member_batch():
+    assert list(is_member_batch(ESeries.E24, [1, 1.1, 1.05, 0])) == [True, True, False, False]
+
+
+def test_classify_batch():
+    assert list(classify_batch([1e-12, 1.05, 3.3e6, 3.5e6])) == [ESeries.E3, ESeries.E48, ESeries.E6, None]
+
+
+def test_is_member_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        is_member(13, 4.7)
+
+
+@given(series_key=sampled_from(ESeries),
+       value=floats(min_value=1e-30, max_value=1e30),
+       k=integers(min_value=1, max_value=200))
+def test_find_k_nearest_matches_brute_force(series_key, value, k):
+    decades = k // series_key + 2
+    candidates = erange(series_key, value / 10 ** decades, value * 10 ** decades)
+    expected = tuple(sorted(candidates, key=lambda candidate: (max(candidate / value, value / candidate),
+                                                               candidate))[:k])
+    assert find_k_nearest(series_key, value, k) == expected
+
+
+@given(series_key=sampled_from(ESeries), value=floats(min_value=1e-30, max_value=1e30))
+def test_find_k_nearest_first_is_neighbour(series_key, value):
+    nearest, = find_k_nearest(series_key, value, 1)
+    assert nearest in (find_less_than_or_equal(series_key, value), find_greater_than(series_key, value))
+
+
+def test_find_k_nearest_is_spread_evenly():
+    assert find_k_nearest(E12, 1.0, 5) == (1.0, 1.2, 0.82, 0.68, 1.5)
+
+
+@given(series_key=sampled_from(ESeries), values=lists(floats(min_value=1e-30, max_value=1e30)))
+def test_find_k_nearest_batch_matches_find_k_nearest(series_key, values):
+    assert list(find_k_nearest_batch(series_key, values, 5)) == [find_k_nearest(series_key, value, 5)
+                                                                 for value in values]
+
+
+def test_find_k_nearest_exact():
+    assert find_k_nearest(E12, 4.7, 3, exact=True) == (ExactValue(47, -1), ExactValue(56, -1), ExactValue(39, -1))
+
+
+def test_find_k_nearest_at_largest_values():
+    nearest = find_k_nearest(E12, 1e307, 20)
+    assert all(not math.isinf(value) for value in nearest)
+    assert len(nearest) == 20
+
+
+def test_find_k_nearest_zero_k_raises_value_error():
+    with raises(ValueError):
+        find_k_nearest(E12, 1.0, 0)
+
+
+def test_find_k_nearest_batch_zero_k_raises_value_error():
+    with raises(ValueError):
+        list(find_k_nearest_batch(E12, [1.0], 0))
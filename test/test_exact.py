@@ -0,0 +1,129 @@
+from decimal import Decimal
+from fractions import Fraction
+
+from hypothesis import given
+from hypothesis.strategies import sampled_from, floats, integers, booleans
+from pytest import raises
+
+import eseries.exact
+from eseries import (ESeries, E12, erange, open_erange, find_nearest, find_nearest_few, find_greater_than_or_equal,
+                     find_greater_than, find_less_than_or_equal, find_less_than, ExactValue)
+
+FIND_FUNCTIONS = [find_nearest, find_greater_than_or_equal, find_greater_than, find_less_than_or_equal,
+                  find_less_than]
+
+mantissas = integers(min_value=-10 ** 6, max_value=10 ** 6)
+exponents = integers(min_value=-40, max_value=40)
+
+
+@given(series_key=sampled_from(ESeries), function=sampled_from(FIND_FUNCTIONS),
+       value=floats(min_value=1e-30, max_value=1e30))
+def test_exact_find_equals_float_find(series_key, function, value):
+    exact = function(series_key, value, exact=True)
+    assert isinstance(exact, ExactValue)
+    assert float(exact) == function(series_key, value)
+
+
+@given(series_key=sampled_from(ESeries), value=floats(min_value=1e-30, max_value=1e30),
+       num=integers(min_value=1, max_value=3))
+def test_exact_find_nearest_few_equals_float_find_nearest_few(series_key, value, num):
+    exact = find_nearest_few(series_key, value, num, exact=True)
+    assert tuple(float(item) for item in exact) == find_nearest_few(series_key, value, num)
+
+
+@given(series_key=sampled_from(ESeries), low=floats(min_value=1e-30, max_value=1e28),
+       reverse=booleans(), step=integers(min_value=1, max_value=5))
+def test_exact_erange_equals_float_erange(series_key, low, reverse, step):
+    for function in (erange, open_erange):
+        exact = list(function(series_key, low, low * 100, reverse=reverse, step=step, exact=True))
+        assert [float(item) for item in exact] == list(function(series_key, low, low * 100, reverse=reverse,
+                                                                 step=step))
+
+
+def test_exact_erange_values_are_exact():
+    assert list(erange(E12, 3e-7, 6e-7, exact=True)) == [ExactValue(33, -8), ExactValue(39, -8),
+                                                         ExactValue(47, -8), ExactValue(56, -8)]
+
+
+def test_mantissa_is_normalised():
+    value = ExactValue(4700, -3)
+    assert (value.mantissa, value.exponent) == (47, -1)
+
+
+def test_zero_is_normalised():
+    assert ExactValue(0, 5) == ExactValue(0, -3)
+
+
+@given(mantissa=mantissas, exponent=exponents)
+def test_equal_to_fraction_and_decimal(mantissa, exponent):
+    value = ExactValue(mantissa, exponent)
+    fraction = Fraction(mantissa) * Fraction(10) ** exponent
+    assert value == fraction
+    assert value == value.to_decimal()
+    assert value.to_fraction() == fraction
+
+
+@given(mantissa=mantissas, exponent=exponents)
+def test_hash_equals_hash_of_equal_fraction(mantissa, exponent):
+    value = ExactValue(mantissa, exponent)
+    assert hash(value) == hash(value.to_fraction())
+
+
+@given(mantissa=mantissas, exponent=exponents)
+def test_hash_equals_hash_of_equal_exact_value(mantissa, exponent):
+    assert hash(ExactValue(mantissa, exponent)) == hash(ExactValue(mantissa * 100, exponent - 2))
+
+
+def test_hash_without_hash_info_equals_hash_of_equal_fraction(monkeypatch):
+    monkeypatch.setattr(eseries.exact, '_HASH_MODULUS', None)
+    value = ExactValue(47, -8)
+    assert hash(value) == hash(value.to_fraction())
+    assert hash(value) == hash(ExactValue(4700, -10))
+
+
+@given(a_mantissa=mantissas, a_exponent=exponents, b_mantissa=mantissas, b_exponent=exponents)
+def test_ordering_equals_ordering_of_fractions(a_mantissa, a_exponent, b_mantissa, b_exponent):
+    a = ExactValue(a_mantissa, a_exponent)
+    b = ExactValue(b_mantissa, b_exponent)
+    fa = a.to_fraction()
+    fb = b.to_fraction()
+    assert (a < b, a <= b, a > b, a >= b, a == b, a != b) == (fa < fb, fa <= fb, fa > fb, fa >= fb, fa == fb, fa != fb)
+
+
+@given(mantissa=mantissas, exponent=exponents)
+def test_float_is_nearest_float(mantissa, exponent):
+    assert float(ExactValue(mantissa, exponent)) == float(Decimal(mantissa).scaleb(exponent))
+
+
+def test_equal_to_float_only_when_exact():
+    assert ExactValue(47, 2) == 4700.0
+    assert ExactValue(47, -1) != 4.7
+    assert ExactValue(5, -1) == 0.5
+
+
+def test_compare_with_float():
+    assert ExactValue(47, -1) < 4.8
+    assert ExactValue(47, -1) > 4.6
+
+
+def test_str():
+    assert str(ExactValue(47, -8)) == '0.00000047'
+    assert str(ExactValue(47, 2)) == '4700'
+
+
+def test_format():
+    assert '{:.2e}'.format(ExactValue(47, -8)) == '4.70e-7'
+
+
+def test_repr():
+    assert repr(ExactValue(470, -2)) == 'ExactValue(47, -1)'
+
+
+def test_non_integer_mantissa_raises_type_error():
+    with raises(TypeError):
+        ExactValue(4.7, -1)
+
+
+def test_non_integer_exponent_raises_type_error():
+    with raises(TypeError):
+        ExactValue(47, -1.0)
@@ -0,0 +1,136 @@
+import math
+
+from hypothesis import given, settings
+from hypothesis.strategies import sampled_from, floats, integers, booleans
+from pytest import raises, approx
+
+from eseries import ESeries, E6, E12, E24, open_erange, register_series, unregister_series
+from eseries.eseries import tolerance_limits
+from eseries.filters import find_filter_pairs, find_filter_pairs_batch, time_constant, FilterPair, MAX_WINDOWS, _WINDOWS
+
+
+def brute_force_errors(first_series_key, second_series_key, target, first_range, sqrt):
+    first_values = list(open_erange(first_series_key, *first_range))
+    product = target * target if sqrt else target
+    second_values = list(open_erange(second_series_key, product / first_range[1] / 1e3, product / first_range[0] * 1e3))
+    errors = []
+    for first in first_values:
+        for second in second_values:
+            value = math.sqrt(first * second) if sqrt else first * second
+            errors.append(abs((value - target) / target))
+    return sorted(errors)
+
+
+@settings(deadline=None, max_examples=50)
+@given(first_series_key=sampled_from([ESeries.E3, ESeries.E12, ESeries.E24]),
+       second_series_key=sampled_from([ESeries.E3, ESeries.E6, ESeries.E12]),
+       target=floats(min_value=1e-12, max_value=1e3),
+       sqrt=booleans(),
+       num=integers(min_value=1, max_value=20))
+def test_find_filter_pairs_matches_brute_force(first_series_key, second_series_key, target, sqrt, num):
+    first_range = (1e3, 1e5)
+    pairs = find_filter_pairs(first_series_key, second_series_key, target, num=num, first_range=first_range,
+                              sqrt=sqrt)
+    expected = brute_force_errors(first_series_key, second_series_key, target, first_range, sqrt)[:num]
+    assert [abs(pair.error) for pair in pairs] == approx(expected, rel=1e-9, abs=1e-15)
+
+
+@given(first_series_key=sampled_from(ESeries),
+       second_series_key=sampled_from(ESeries),
+       target=floats(min_value=1e-15, max_value=1e15),
+       sqrt=booleans())
+def test_filter_pair_attributes_are_consistent(first_series_key, second_series_key, target, sqrt):
+    for pair in find_filter_pairs(first_series_key, second_series_key, target, num=5, sqrt=sqrt):
+        assert 1 <= pair.first < 10
+        product = pair.first * pair.second
+        assert pair.value == (math.sqrt(product) if sqrt else product)
+        assert pair.error == (pair.value - target) / target
+        assert pair.worst_case_error >= abs(pair.error)
+        first_lower, first_upper = tolerance_limits(first_series_key, pair.first)
+        second_lower, second_upper = tolerance_limits(second_series_key, pair.second)
+        lowest = first_lower * second_lower
+        highest = first_upper * second_upper
+        if sqrt:
+            lowest, highest = math.sqrt(lowest), math.sqrt(highest)
+        assert pair.worst_case_error == approx(max(target - lowest, highest - target) / target)
+
+
+def test_find_filter_pairs_exact_product():
+    assert find_filter_pairs(E24, E6, 1e-3, num=2) == [
+        FilterPair(first=1.0, second=0.001, value=0.001, error=0.0, worst_case_error=approx(0.26)),
+        FilterPair(first=3.0, second=0.00033, value=0.00099, error=approx(-0.01), worst_case_error=approx(0.2476)),
+    ]
+
+
+def test_find_filter_pairs_are_ordered_by_absolute_error():
+    pairs = find_filter_pairs(E24, E12, time_constant(1e3), num=30, first_range=(1e3, 1e6))
+    errors = [abs(pair.error) for pair in pairs]
+    assert errors == sorted(errors)
+    assert all(1e3 <= pair.first < 1e6 for pair in pairs)
+
+
+def test_find_filter_pairs_batch_matches_find_filter_pairs():
+    targets = [time_constant(frequency) for frequency in (50, 1e3, 455e3)]
+    batch = list(find_filter_pairs_batch(E12, E12, targets, num=3, first_range=(1e-6, 1e-3), sqrt=True))
+    assert batch == [find_filter_pairs(E12, E12, target, num=3, first_range=(1e-6, 1e-3), sqrt=True)
+                     for target in targets]
+
+
+def test_time_constant():
+    assert time_constant(1 / (2 * math.pi)) == approx(1.0)
+
+
+def test_time_constant_zero_raises_value_error():
+    with raises(ValueError):
+        time_constant(0)
+
+
+def test_find_filter_pairs_nan_target_raises_value_error():
+    with raises(ValueError):
+        find_filter_pairs(E24, E6, float('nan'))
+
+
+def test_find_filter_pairs_negative_target_raises_value_error():
+    with raises(ValueError):
+        find_filter_pairs(E24, E6, -1e-3)
+
+
+def test_find_filter_pairs_out_of_range_target_raises_value_error():
+    with raises(ValueError):
+        find_filter_pairs(E24, E6, 1e200, sqrt=True)
+
+
+def test_find_filter_pairs_zero_num_raises_value_error():
+    with raises(ValueError):
+        find_filter_pairs(E24, E6, 1e-3, num=0)
+
+
+def test_find_filter_pairs_empty_range_raises_value_error():
+    with raises(ValueError):
+        find_filter_pairs(E24, E6, 1e-3, first_range=(1.01, 1.05))
+
+
+def test_find_filter_pairs_unknown_series_raises_value_error():
+    with raises(ValueError):
+        find_filter_pairs(E24, 13, 1e-3)
+
+
+def test_find_filter_pairs_batch_invalid_target_raises_value_error():
+    with raises(ValueError):
+        list(find_filter_pairs_batch(E24, E6, [1e-3, float('inf')]))
+
+
+def test_retained_ranges_are_bounded():
+    for stop in range(2, MAX_WINDOWS + 12):
+        find_filter_pairs(E24, E6, 1e-3, first_range=(1, stop))
+    assert len(_WINDOWS) == MAX_WINDOWS
+    assert (E24, 1, 2) not in _WINDOWS
+
+
+def test_find_filter_pairs_with_unregistered_series_raises_value_error():
+    series_key = register_series('REELS', [1.0, 2.2, 4.7], tolerance=0.05)
+    find_filter_pairs(series_key, E6, 1e-3)
+    unregister_series(series_key)
+    assert not any(key[0] is series_key for key in _WINDOWS)
+    with raises(ValueError):
+        find_filter_pairs(series_key, E6, 1e-3)
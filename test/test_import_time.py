@@ -0,0 +1,56 @@
+"""Guard against regressions in the time taken to import eseries."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import eseries
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime requires Python 3.7 or later")
+
+# Wall-clock times vary with the load on the machine, so regressions are
+# caught by checking which modules are imported, and the budget only guards
+# against gross regressions. It is generous, to tolerate loaded machines, and
+# may be set in the ESERIES_IMPORT_TIME_BUDGET_MICROSECONDS environment variable.
+IMPORT_TIME_BUDGET_MICROSECONDS = int(os.environ.get('ESERIES_IMPORT_TIME_BUDGET_MICROSECONDS', 250000))
+
+# Modules which must not be imported as a side-effect of 'import eseries'
+EXCLUDED_MODULES = ('future', 'numpy', 'docopt', 'docopt_subcommands', 'eseries.cli', 'eseries.arrays',
+                    'eseries.parallel', 'eseries.server', 'asyncio', 'multiprocessing', 'threading', 'json',
+                    'hashlib')
+
+
+def import_times(module_name):
+    """The cumulative time, in microseconds, to import each module imported by importing module_name.
+
+    The import is performed in a fresh interpreter.
+    """
+    environment = dict(os.environ)
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    environment['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.abspath(eseries.__file__)))
+    command = [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module_name)]
+    # Import once to populate the bytecode cache, so that compilation isn't measured.
+    subprocess.check_output(command, stderr=subprocess.STDOUT, env=environment)
+    output = subprocess.check_output(command, stderr=subprocess.STDOUT, env=environment, universal_newlines=True)
+    times = {}
+    for line in output.splitlines():
+        if line.startswith('import time:'):
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_eseries_is_within_budget():
+    assert import_times('eseries')['eseries'] < IMPORT_TIME_BUDGET_MICROSECONDS
+
+
+@pytest.mark.parametrize("module_name", EXCLUDED_MODULES)
+def test_import_eseries_does_not_import(module_name):
+    assert module_name not in import_times('eseries')
+
+
+@pytest.mark.parametrize("module_name", ['future', 'numpy', 'eseries.arrays'])
+def test_import_eseries_cli_does_not_import(module_name):
+    assert module_name not in import_times('eseries.cli')
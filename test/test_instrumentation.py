@@ -0,0 +1,130 @@
+import io
+import json
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import sampled_from, floats
+from pytest import raises
+
+from eseries import (ESeries, E12, E24, erange, open_erange, find_nearest_few, enable_cache, disable_cache,
+                     enable_instrumentation, disable_instrumentation, clear_instrumentation, instrumentation_snapshot,
+                     dump_instrumentation)
+from eseries.eng import eng_string
+from eseries.eseries import _erange
+
+
+@pytest.fixture(autouse=True)
+def instrumentation_disabled_afterwards():
+    yield
+    disable_instrumentation()
+
+
+def test_instrumentation_is_disabled_by_default():
+    assert instrumentation_snapshot() is None
+
+
+def test_disabled_instrumentation_returns_iterators_unchanged():
+    assert _erange(E12, range(3)).gi_code is _erange.__wrapped__.__code__
+
+
+def test_calls_are_counted():
+    enable_instrumentation()
+    find_nearest_few(E24, 5000)
+    find_nearest_few(E24, 6000)
+    eng_string(4700)
+    snapshot = instrumentation_snapshot()
+    assert snapshot['find_nearest_few'].calls == 2
+    assert snapshot['eng_string'].calls == 1
+    assert snapshot['find_nearest_few'].seconds > 0
+
+
+def test_cached_calls_are_counted():
+    enable_cache()
+    try:
+        enable_instrumentation()
+        find_nearest_few(E24, 5000)
+        find_nearest_few(E24, 5000)
+        assert instrumentation_snapshot()['find_nearest_few'].calls == 2
+    finally:
+        disable_cache()
+
+
+def test_calls_which_raise_are_counted():
+    enable_instrumentation()
+    with raises(ValueError):
+        find_nearest_few(E24, float('nan'))
+    assert instrumentation_snapshot()['find_nearest_few'].calls == 1
+
+
+@given(series_key=sampled_from(ESeries),
+       start=floats(min_value=1e-30, max_value=1e30),
+       factor=floats(min_value=1, max_value=1e6))
+def test_instrumented_erange_yields_the_same_values(series_key, start, factor):
+    expected = list(erange(series_key, start, start * factor))
+    enable_instrumentation()
+    try:
+        assert list(erange(series_key, start, start * factor)) == expected
+    finally:
+        disable_instrumentation()
+
+
+def test_iteration_is_recorded_when_finished():
+    enable_instrumentation()
+    values = erange(E12, 1, 1e30)
+    next(values)
+    assert 'erange' not in instrumentation_snapshot()
+    list(values)
+    snapshot = instrumentation_snapshot()
+    assert snapshot['erange'].calls == 1
+    assert snapshot['_erange'].calls == 1
+
+
+def test_iteration_is_recorded_when_discarded():
+    enable_instrumentation()
+    values = open_erange(E12, 1, 1e30)
+    next(values)
+    values.close()
+    assert instrumentation_snapshot()['open_erange'].calls == 1
+
+
+def test_hook_is_called_for_each_call():
+    calls = []
+    enable_instrumentation(hook=lambda name, seconds: calls.append((name, seconds)))
+    eng_string(4700)
+    eng_string(4700)
+    assert [name for name, _ in calls] == ['eng_string', 'eng_string']
+    assert all(seconds >= 0 for _, seconds in calls)
+
+
+def test_enable_discards_records():
+    enable_instrumentation()
+    eng_string(4700)
+    enable_instrumentation()
+    assert instrumentation_snapshot() == {}
+
+
+def test_clear_instrumentation():
+    enable_instrumentation()
+    eng_string(4700)
+    clear_instrumentation()
+    assert instrumentation_snapshot() == {}
+
+
+def test_clear_instrumentation_when_disabled_has_no_effect():
+    clear_instrumentation()
+    assert instrumentation_snapshot() is None
+
+
+def test_dump_instrumentation():
+    enable_instrumentation()
+    eng_string(4700)
+    file = io.StringIO()
+    dump_instrumentation(file)
+    dumped = json.loads(file.getvalue())
+    assert dumped['eng_string']['calls'] == 1
+    assert dumped['eng_string']['seconds'] == instrumentation_snapshot()['eng_string'].seconds
+
+
+def test_dump_instrumentation_when_disabled_raises_value_error():
+    with raises(ValueError):
+        dump_instrumentation(io.StringIO())
@@ -0,0 +1,118 @@
+import operator
+
+from hypothesis import given
+from hypothesis.strategies import sampled_from, floats, tuples, composite
+from pytest import raises, approx
+
+from eseries import ESeries, E12, E24
+from eseries.eseries import lower_tolerance_limit, upper_tolerance_limit
+from eseries.intervals import Interval, parallel
+
+values = floats(min_value=-1e6, max_value=1e6)
+positive_values = floats(min_value=1e-6, max_value=1e6)
+fractions = floats(min_value=0, max_value=1)
+
+
+@composite
+def intervals(draw, elements=values):
+    lower, nominal, upper = sorted(draw(tuples(elements, elements, elements)))
+    return Interval(nominal, lower, upper)
+
+
+def point(interval, fraction):
+    return interval.lower + fraction * (interval.upper - interval.lower)
+
+
+@given(series_key=sampled_from(ESeries), nominal=positive_values)
+def test_from_series_agrees_with_tolerance_limits(series_key, nominal):
+    interval = Interval.from_series(series_key, nominal)
+    assert interval.nominal == nominal
+    assert interval.lower == lower_tolerance_limit(series_key, nominal)
+    assert interval.upper == upper_tolerance_limit(series_key, nominal)
+
+
+@given(operation=sampled_from([operator.add, operator.sub, operator.mul]),
+       a=intervals(), b=intervals(), fa=fractions, fb=fractions)
+def test_operation_bounds_values_within_intervals(operation, a, b, fa, fb):
+    result = operation(a, b)
+    value = operation(point(a, fa), point(b, fb))
+    assert result.lower <= result.nominal <= result.upper
+    assert result.lower - 1e-9 * abs(value) <= value <= result.upper + 1e-9 * abs(value)
+
+
+@given(a=intervals(positive_values), b=intervals(positive_values), fa=fractions, fb=fractions)
+def test_division_bounds_values_within_intervals(a, b, fa, fb):
+    result = a / b
+    value = point(a, fa) / point(b, fb)
+    assert result.lower <= result.nominal <= result.upper
+    assert result.lower * (1 - 1e-9) <= value <= result.upper * (1 + 1e-9)
+
+
+@given(a=intervals(positive_values), b=intervals(positive_values))
+def test_parallel_limits_are_parallel_combinations_of_limits(a, b):
+    result = a.parallel(b)
+    assert result.lower == approx(a.lower * b.lower / (a.lower + b.lower))
+    assert result.nominal == approx(a.nominal * b.nominal / (a.nominal + b.nominal))
+    assert result.upper == approx(a.upper * b.upper / (a.upper + b.upper))
+
+
+def test_operations_with_values():
+    r = Interval.from_series(E12, 1000)
+    assert r + 1 == Interval(1001, 901, 1101)
+    assert 1 + r == Interval(1001, 901, 1101)
+    assert 2000 - r == Interval(1000, 900, 1100)
+    assert r * -2 == Interval(-2000, -2200, -1800)
+    assert -r == Interval(-1000, -1100, -900)
+    assert 1 / Interval(2, 1, 4) == Interval(0.5, 0.25, 1.0)
+
+
+def test_parallel_function():
+    r = Interval.from_series(E24, 10e3)
+    assert parallel(r, r) == r.parallel(r)
+    assert parallel(r, r, r).nominal == approx(10e3 / 3)
+
+
+def test_parallel_function_with_one_interval_raises_value_error():
+    with raises(ValueError):
+        parallel(Interval(1, 1, 1))
+
+
+def test_reciprocal_of_interval_containing_zero_raises_zero_division_error():
+    with raises(ZeroDivisionError):
+        Interval(1, -1, 2).reciprocal()
+
+
+def test_worst_case_error():
+    assert Interval.from_series(E24, 10e3).worst_case_error == approx(0.05)
+    assert Interval(1.0, 0.5, 1.1).worst_case_error == 0.5
+
+
+def test_contains():
+    interval = Interval.from_series(E12, 1000)
+    assert 950 in interval
+    assert 1200 not in interval
+
+
+def test_equality_and_hash():
+    assert Interval(1, 0, 2) == Interval(1, 0, 2)
+    assert Interval(1, 0, 2) != Interval(1, 0, 3)
+    assert hash(Interval(1, 0, 2)) == hash(Interval(1, 0, 2))
+
+
+def test_repr():
+    assert repr(Interval(1, 0, 2)) == "Interval(nominal=1, lower=0, upper=2)"
+
+
+def test_intervals_have_no_dict():
+    with raises(AttributeError):
+        Interval(1, 0, 2).tolerance = 0.1
+
+
+def test_nominal_outside_limits_raises_value_error():
+    with raises(ValueError):
+        Interval(3, 0, 2)
+
+
+def test_from_series_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        Interval.from_series(13, 1000)
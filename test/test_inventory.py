@@ -0,0 +1,122 @@
+import os
+import tempfile
+
+from hypothesis import given, settings
+from hypothesis.strategies import floats, lists, tuples, text, sampled_from
+from pytest import raises, fixture
+
+from eseries import ESeries, E24, erange, find_nearest, find_greater_than_or_equal, find_less_than_or_equal
+from eseries.inventory import Inventory, Stock
+
+CATALOG = [(10e3, 'RES-10K-0603'), (4.7e3, 'RES-4K7-0402'), (10e3, 'RES-10K-0402'), (100.0, 'RES-100R-0402')]
+
+finite_floats = floats(min_value=1e-10, max_value=1e10)
+
+
+@fixture
+def inventory():
+    return Inventory(CATALOG)
+
+
+@fixture
+def loaded_inventory(tmp_path):
+    path = str(tmp_path / 'inventory.bin')
+    Inventory(CATALOG).save(path)
+    return Inventory.load(path)
+
+
+def test_payloads_of_equal_values_are_in_catalog_order(inventory):
+    assert inventory.find_nearest(9e3) == Stock(value=10e3, payloads=('RES-10K-0603', 'RES-10K-0402'))
+
+
+def test_len_is_number_of_distinct_values(inventory):
+    assert len(inventory) == 3
+
+
+def test_iteration_is_in_order_of_value(inventory):
+    assert [stock.value for stock in inventory] == [100.0, 4.7e3, 10e3]
+
+
+def test_contains(inventory):
+    assert 4.7e3 in inventory
+    assert 4.8e3 not in inventory
+
+
+def test_loaded_inventory_equals_saved_inventory(inventory, loaded_inventory):
+    assert list(loaded_inventory) == list(inventory)
+
+
+@settings(deadline=None)
+@given(value=finite_floats)
+def test_loaded_inventory_queries_equal_saved_inventory_queries(value):
+    inventory = Inventory(CATALOG)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'inventory.bin')
+        inventory.save(path)
+        loaded_inventory = Inventory.load(path)
+        assert loaded_inventory.find_nearest(value) == inventory.find_nearest(value)
+
+
+@given(series_key=sampled_from(ESeries), value=floats(min_value=1e-2, max_value=1e5))
+def test_complete_inventory_matches_series(series_key, value):
+    inventory = Inventory((v, None) for v in erange(series_key, 1e-3, 1e6))
+    assert inventory.find_nearest(value).value == find_nearest(series_key, value)
+    assert inventory.find_greater_than_or_equal(value).value == find_greater_than_or_equal(series_key, value)
+    assert inventory.find_less_than_or_equal(value).value == find_less_than_or_equal(series_key, value)
+
+
+@given(values=lists(finite_floats, min_size=1), value=finite_floats)
+def test_queries_match_brute_force(values, value):
+    inventory = Inventory((v, None) for v in values)
+    nearest = min(sorted(set(values)), key=lambda v: abs(v - value))
+    assert inventory.find_nearest(value).value == nearest
+    greater = [v for v in values if v >= value]
+    if greater:
+        assert inventory.find_greater_than_or_equal(value).value == min(greater)
+    else:
+        with raises(ValueError):
+            inventory.find_greater_than_or_equal(value)
+    less = [v for v in values if v <= value]
+    if less:
+        assert inventory.find_less_than_or_equal(value).value == max(less)
+    else:
+        with raises(ValueError):
+            inventory.find_less_than_or_equal(value)
+
+
+@given(parts=lists(tuples(sampled_from(list(erange(E24, 1, 100))), text())))
+def test_all_payloads_are_retained(parts):
+    inventory = Inventory(parts)
+    assert sorted(payload for stock in inventory for payload in stock.payloads) == sorted(p for _, p in parts)
+
+
+def test_empty_inventory_find_nearest_raises_value_error():
+    with raises(ValueError):
+        Inventory([]).find_nearest(1.0)
+
+
+def test_non_finite_catalog_value_raises_value_error():
+    with raises(ValueError):
+        Inventory([(float('nan'), None)])
+
+
+def test_non_finite_query_value_raises_value_error(inventory):
+    with raises(ValueError):
+        inventory.find_nearest(float('inf'))
+
+
+def test_load_non_inventory_file_raises_value_error(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not an inventory file at all, but long enough')
+    with raises(ValueError):
+        Inventory.load(str(path))
+
+
+def test_save_and_load_before_python_3_raise_value_error(inventory, tmp_path, monkeypatch):
+    path = str(tmp_path / 'inventory.bin')
+    inventory.save(path)
+    monkeypatch.setattr('sys.version_info', (2, 7, 18, 'final', 0))
+    with raises(ValueError):
+        inventory.save(path)
+    with raises(ValueError):
+        Inventory.load(path)
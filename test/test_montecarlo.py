@@ -0,0 +1,105 @@
+import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import sampled_from, floats
+from pytest import raises, approx
+
+np = pytest.importorskip("numpy")
+
+from eseries import ESeries, E12, E24, E96, tolerance
+from eseries.montecarlo import monte_carlo, Part, UNIFORM, NORMAL
+
+
+def divider(r1, r2):
+    return r2 / (r1 + r2)
+
+
+@settings(deadline=None, max_examples=20)
+@given(series_key=sampled_from(ESeries),
+       nominal=floats(min_value=1e-12, max_value=1e9),
+       distribution=sampled_from([UNIFORM, NORMAL]))
+def test_samples_are_within_tolerance_limits(series_key, nominal, distribution):
+    result = monte_carlo(lambda x: x, [Part(series_key, nominal)], num_samples=1000, seed=1,
+                         distribution=distribution)
+    tol = tolerance(series_key)
+    assert result.nominal == nominal
+    assert result.minimum >= nominal * (1 - tol) * (1 - 1e-12)
+    assert result.maximum <= nominal * (1 + tol) * (1 + 1e-12)
+
+
+def test_results_are_reproducible_with_seed():
+    first = monte_carlo(divider, [Part(E24, 10e3), Part(E24, 4.7e3)], num_samples=1000, seed=1729)
+    second = monte_carlo(divider, [Part(E24, 10e3), Part(E24, 4.7e3)], num_samples=1000, seed=1729)
+    assert np.array_equal(first.samples, second.samples)
+    assert first[:-1] == second[:-1]
+
+
+def test_parts_vary_independently():
+    result = monte_carlo(lambda a, b: a - b, [Part(E96, 1.0), Part(E96, 1.0)], num_samples=1000, seed=1)
+    assert result.std > 0
+
+
+def test_statistics():
+    result = monte_carlo(divider, [Part(E24, 10e3), Part(E24, 4.7e3)], num_samples=100000, seed=1)
+    assert result.nominal == approx(4.7 / 14.7)
+    assert result.mean == approx(np.mean(result.samples))
+    assert result.std == approx(np.std(result.samples))
+    assert result.minimum <= result.percentiles[0.135] <= result.percentiles[50] <= result.maximum
+    assert result.percentiles[50] == approx(result.nominal, rel=1e-2)
+    assert result.yield_fraction is None
+
+
+def test_uniform_distribution_standard_deviation():
+    result = monte_carlo(lambda x: x, [Part(E12, 1.0)], num_samples=100000, seed=1)
+    assert result.std == approx(0.1 / 3 ** 0.5, rel=1e-2)
+
+
+def test_normal_distribution_standard_deviation():
+    result = monte_carlo(lambda x: x, [Part(E12, 1.0)], num_samples=100000, seed=1, distribution=NORMAL)
+    assert result.std == approx(0.1 / 3, rel=2e-2)
+
+
+def test_normal_distribution_is_truncated_rather_than_clipped():
+    result = monte_carlo(lambda x: x, [Part(E12, 1.0)], num_samples=100000, seed=1, distribution=NORMAL)
+    assert np.all((0.9 <= result.samples) & (result.samples <= 1.1))
+    assert np.count_nonzero((result.samples == 0.9) | (result.samples == 1.1)) == 0
+
+
+def test_yield():
+    parts = [Part(E24, 10e3), Part(E24, 4.7e3)]
+    assert monte_carlo(divider, parts, num_samples=1000, seed=1, spec=(0.2, 0.4)).yield_fraction == 1.0
+    assert monte_carlo(divider, parts, num_samples=1000, seed=1, spec=(0.4, None)).yield_fraction == 0.0
+    result = monte_carlo(divider, parts, num_samples=1000, seed=1, spec=(None, 4.7 / 14.7))
+    assert result.yield_fraction == np.count_nonzero(result.samples <= 4.7 / 14.7) / 1000
+
+
+def test_statistics_are_floats():
+    result = monte_carlo(divider, [Part(E24, 10e3), Part(E24, 4.7e3)], num_samples=1000, seed=1, spec=(0.3, 0.33))
+    for statistic in (result.nominal, result.mean, result.std, result.minimum, result.maximum, result.yield_fraction):
+        assert type(statistic) is float
+
+
+def test_parts_may_be_pairs():
+    result = monte_carlo(divider, [(E24, 10e3), (E24, 4.7e3)], num_samples=10, seed=1)
+    expected = monte_carlo(divider, [Part(E24, 10e3), Part(E24, 4.7e3)], num_samples=10, seed=1)
+    assert result[:-1] == expected[:-1]
+    assert np.array_equal(result.samples, expected.samples)
+
+
+def test_constant_expression():
+    result = monte_carlo(lambda x: 5.0, [Part(E24, 1.0)], num_samples=10)
+    assert result.samples.tolist() == [5.0] * 10
+
+
+def test_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        monte_carlo(divider, [Part(13, 10e3), Part(E24, 4.7e3)])
+
+
+def test_zero_num_samples_raises_value_error():
+    with raises(ValueError):
+        monte_carlo(divider, [Part(E24, 10e3), Part(E24, 4.7e3)], num_samples=0)
+
+
+def test_unknown_distribution_raises_value_error():
+    with raises(ValueError):
+        monte_carlo(divider, [Part(E24, 10e3), Part(E24, 4.7e3)], distribution='triangular')
@@ -0,0 +1,66 @@
+from hypothesis import given
+from hypothesis.strategies import sampled_from, floats, lists, sets
+from pytest import raises
+
+from eseries import (ESeries, E6, E12, E24, E96, find_nearest, find_less_than_or_equal, find_greater_than_or_equal,
+                     register_series, unregister_series)
+from eseries.multi import find_multi, find_multi_batch, Neighbours, _MERGED_INDEXES
+
+values_strategy = floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False)
+
+
+@given(series_keys=lists(sampled_from(ESeries), min_size=1, unique=True), value=values_strategy)
+def test_find_multi_matches_scalar_functions(series_keys, value):
+    found = find_multi(series_keys, value)
+    assert list(found) == series_keys
+    for series_key, neighbours in found.items():
+        assert neighbours == Neighbours(find_less_than_or_equal(series_key, value),
+                                        find_nearest(series_key, value),
+                                        find_greater_than_or_equal(series_key, value))
+
+
+@given(series_keys=sets(sampled_from(ESeries), min_size=1), values=lists(values_strategy))
+def test_find_multi_batch_matches_find_multi(series_keys, values):
+    assert list(find_multi_batch(series_keys, values)) == [find_multi(series_keys, value) for value in values]
+
+
+@given(value=floats(min_value=1e-10, max_value=1e10))
+def test_find_multi_with_custom_series(value):
+    series_key = register_series('REELS', [1.0, 2.2, 4.7], tolerance=0.05)
+    try:
+        found = find_multi([E24, series_key], value)
+        assert found[series_key].nearest == find_nearest(series_key, value)
+        assert found[E24].nearest == find_nearest(E24, value)
+    finally:
+        unregister_series(series_key)
+
+
+def test_find_multi_with_unregistered_series_raises_value_error():
+    series_key = register_series('REELS', [1.0, 2.2, 4.7], tolerance=0.05)
+    find_multi([E24, series_key], 3.0)
+    unregister_series(series_key)
+    assert not any(series_key in series_keys for series_keys in _MERGED_INDEXES)
+    with raises(ValueError):
+        find_multi([E24, series_key], 3.0)
+
+
+def test_find_multi_series_member():
+    found = find_multi([E6, E12, E24, E96], 5100)
+    assert found[E6] == Neighbours(4700, 4700, 6800)
+    assert found[E24] == Neighbours(5100, 5100, 5100)
+    assert found[E96] == Neighbours(4990, 5110, 5110)
+
+
+def test_find_multi_no_series_raises_value_error():
+    with raises(ValueError):
+        find_multi([], 1.0)
+
+
+def test_find_multi_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        find_multi([E12, 13], 1.0)
+
+
+def test_find_multi_non_finite_value_raises_value_error():
+    with raises(ValueError):
+        find_multi([E12, E24], float('nan'))
@@ -0,0 +1,70 @@
+import multiprocessing
+
+import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import sampled_from, floats, lists, integers
+from pytest import raises
+
+from eseries import ESeries, E12, E24, find_nearest, register_series, unregister_series
+from eseries.parallel import find_nearest_parallel
+
+values_strategy = lists(floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False),
+                        max_size=50)
+
+
+@settings(deadline=None, max_examples=10)
+@given(series_key=sampled_from(ESeries), values=values_strategy, chunk_size=integers(min_value=1, max_value=20))
+def test_find_nearest_parallel_matches_find_nearest(series_key, values, chunk_size):
+    results = list(find_nearest_parallel(series_key, values, max_workers=2, chunk_size=chunk_size))
+    assert results == [find_nearest(series_key, value) for value in values]
+
+
+def test_find_nearest_parallel_accepts_iterator():
+    values = (1.0 + i / 1000 for i in range(5000))
+    results = list(find_nearest_parallel(E24, values, max_workers=2, chunk_size=300))
+    assert results == [find_nearest(E24, 1.0 + i / 1000) for i in range(5000)]
+
+
+def test_find_nearest_parallel_accepts_array():
+    np = pytest.importorskip("numpy")
+    values = np.geomspace(1e-3, 1e6, 1000).reshape(10, 100)
+    results = list(find_nearest_parallel(E12, values, max_workers=2, chunk_size=64))
+    assert results == [find_nearest(E12, value) for value in values.ravel().tolist()]
+
+
+def test_find_nearest_parallel_empty():
+    assert list(find_nearest_parallel(E12, [], max_workers=2)) == []
+
+
+def test_find_nearest_parallel_can_be_abandoned():
+    values = (1.0 + i / 1000 for i in range(100000))
+    results = find_nearest_parallel(E24, values, max_workers=2, chunk_size=100)
+    assert next(results) == 1.0
+    results.close()
+
+
+def test_find_nearest_parallel_value_out_of_range_raises_value_error():
+    with raises(ValueError):
+        list(find_nearest_parallel(E12, [1.0, float("inf"), 2.0], max_workers=2, chunk_size=1))
+
+
+def test_find_nearest_parallel_illegal_series_key_raises_value_error():
+    with raises(ValueError):
+        list(find_nearest_parallel(13, [1.0]))
+
+
+def test_find_nearest_parallel_zero_chunk_size_raises_value_error():
+    with raises(ValueError):
+        list(find_nearest_parallel(E12, [1.0], chunk_size=0))
+
+
+@pytest.mark.parametrize("start_method", [None, "spawn"])
+def test_find_nearest_parallel_accepts_custom_series(start_method):
+    mp_context = None if start_method is None else multiprocessing.get_context(start_method)
+    series_key = register_series("PARALLEL-REELS", [100, 220, 470], tolerance=0.05)
+    try:
+        values = [1.0 + i / 10 for i in range(100)]
+        results = list(find_nearest_parallel(series_key, values, max_workers=2, chunk_size=10, mp_context=mp_context))
+        assert results == [find_nearest(series_key, value) for value in values]
+    finally:
+        unregister_series(series_key)
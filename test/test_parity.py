@@ -0,0 +1,150 @@
+"""Parity of the lookup functions with the original window-based implementation.
+
+The reference implementation below is the original implementation of
+find_nearest_few() and erange(), which located values by generating every
+series value within a window around the query value, and sorting them.
+"""
+import math
+import sys
+from bisect import bisect_left, bisect_right
+from math import log10
+
+import pytest
+
+from eseries import (ESeries, erange, open_erange, find_nearest_few, find_nearest, find_greater_than_or_equal,
+                     find_greater_than, find_less_than_or_equal, find_less_than)
+from eseries.eseries import series, GEOMETRIC_SCALE_E, LOG10_MANTISSA_E, _round_sig, _decade_mantissa
+
+
+def reference_erange(series_key, start, stop):
+    series_values = series(series_key)
+    series_log = LOG10_MANTISSA_E[series_key]
+    epsilon = (series_log[-1] - series_log[-2]) / 2
+    start_log = log10(start) - epsilon
+    start_decade, start_mantissa = _decade_mantissa(start_log)
+    start_index = bisect_left(series_log, start_mantissa)
+    if start_index == len(series_log):
+        start_decade += 1
+        start_index = 0
+    stop_log = log10(stop) + epsilon
+    stop_decade, stop_mantissa = _decade_mantissa(stop_log)
+    stop_index = bisect_right(series_log, stop_mantissa)
+    series_decade = int(log10(series_values[0]))
+    for decade in range(start_decade, stop_decade + 1):
+        index_begin = start_index if decade == start_decade else 0
+        index_end = stop_index if decade == stop_decade else len(series_log)
+        for index in range(index_begin, index_end):
+            found = series_values[index]
+            scale_exponent = decade - series_decade
+            result = found * math.pow(10, scale_exponent)
+            rounded_result = _round_sig(result, figures=series_decade + 1)
+            if start <= rounded_result <= stop:
+                yield rounded_result
+
+
+def reference_nearest_n(candidates, value, n):
+    abs_deltas = tuple(abs(c - value) for c in candidates)
+    indexes = [index for index, _ in sorted(enumerate(abs_deltas), key=lambda x: x[1])]
+    return tuple(sorted(candidates[i] for i in indexes[:n]))
+
+
+def reference_find_nearest_few(series_key, value, num=3):
+    start = value / pow(GEOMETRIC_SCALE_E[series_key], 1.5)
+    stop = value * pow(GEOMETRIC_SCALE_E[series_key], 1.5)
+    candidates = tuple(reference_erange(series_key, start, stop))
+    return reference_nearest_n(candidates, value, num)
+
+
+def reference_find_greater_than_or_equal(series_key, value):
+    return next(c for c in reference_find_nearest_few(series_key, value) if c >= value)
+
+
+def reference_find_greater_than(series_key, value):
+    return next(c for c in reference_find_nearest_few(series_key, value) if c > value)
+
+
+def reference_find_less_than_or_equal(series_key, value):
+    return next(c for c in reversed(reference_find_nearest_few(series_key, value)) if c <= value)
+
+
+def reference_find_less_than(series_key, value):
+    return next(c for c in reversed(reference_find_nearest_few(series_key, value)) if c < value)
+
+
+DECADES = list(range(-15, 16)) + [-195, -100, -35, 35, 100, 300, 307, 308]
+
+
+def query_values(series_key, decade):
+    """Series members, values either side of them, and midpoints between them.
+
+    In the highest decade of floats, only values for which the nearby values
+    are all floats, and for which the reference implementation does not
+    overflow, are included.
+    """
+    margin = pow(GEOMETRIC_SCALE_E[series_key], 1.5)
+    start = 10.0 ** decade
+    members = list(reference_erange(series_key, start, min(start * 10, sys.float_info.max / margin)))
+    nudged = [member * factor for member in members for factor in (0.999, 1.001)]
+    midpoints = [(a + b) / 2 for a, b in zip(members, members[1:])]
+    return [value for value in members + nudged + midpoints
+            if not math.isinf(value * margin) and not reference_overflows(series_key, value)]
+
+
+def reference_overflows(series_key, value):
+    try:
+        reference_find_nearest_few(series_key, value)
+    except OverflowError:
+        return True
+    return False
+
+
+@pytest.mark.parametrize("series_key", list(ESeries))
+def test_find_nearest_few_parity(series_key):
+    for decade in DECADES:
+        for value in query_values(series_key, decade):
+            for num in (1, 2, 3):
+                assert find_nearest_few(series_key, value, num) == reference_find_nearest_few(series_key, value, num)
+
+
+@pytest.mark.parametrize("series_key", list(ESeries))
+def test_find_nearest_parity(series_key):
+    for decade in DECADES:
+        for value in query_values(series_key, decade):
+            assert find_nearest(series_key, value) == reference_find_nearest_few(series_key, value, 1)[0]
+
+
+@pytest.mark.parametrize("function, reference_function", [
+    (find_greater_than_or_equal, reference_find_greater_than_or_equal),
+    (find_greater_than, reference_find_greater_than),
+    (find_less_than_or_equal, reference_find_less_than_or_equal),
+    (find_less_than, reference_find_less_than),
+])
+@pytest.mark.parametrize("series_key", list(ESeries))
+def test_find_bound_parity(series_key, function, reference_function):
+    for decade in DECADES:
+        for value in query_values(series_key, decade):
+            try:
+                expected = reference_function(series_key, value)
+            except StopIteration:
+                # The reference implementation sometimes failed to find a result for
+                # series members with two equidistant neighbours. E.g. E24 1.3
+                expected = None
+            if expected is not None:
+                assert function(series_key, value) == expected
+
+
+ERANGE_LIMITS = [(1.0, 10.0), (1e-15, 1e12), (1.7e-16, 3.3e-14), (4.7e11, 2.2e13), (1e-40, 1e-38), (123.0, 123.0),
+                 (1.0, 1.0), (9.9e11, 9.9e11), (1e300, 1e308), (1e300, 1.5e308), (9e307, 1.2e308)]
+
+
+@pytest.mark.parametrize("series_key", list(ESeries))
+def test_erange_parity(series_key):
+    for start, stop in ERANGE_LIMITS:
+        assert list(erange(series_key, start, stop)) == list(reference_erange(series_key, start, stop))
+
+
+@pytest.mark.parametrize("series_key", list(ESeries))
+def test_open_erange_parity(series_key):
+    for start, stop in ERANGE_LIMITS:
+        expected = [item for item in reference_erange(series_key, start, stop) if item != stop]
+        assert list(open_erange(series_key, start, stop)) == expected
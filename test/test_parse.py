@@ -0,0 +1,77 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import sampled_from, booleans, floats
+from pytest import raises, approx
+
+from eseries import ESeries, erange
+from eseries.eng import eng_string
+from eseries.parse import parse_value, parse_values
+from eseries import parse
+
+
+@pytest.mark.parametrize("text, value", [
+    ("4700", 4700.0),
+    ("4.7e3", 4700.0),
+    ("4.7k", 4700.0),
+    ("4.7 k", 4700.0),
+    ("2.2u", 2.2e-6),
+    ("2.2 µ", 2.2e-6),
+    ("2.2μ", 2.2e-6),
+    ("1M", 1e6),
+    ("1m", 1e-3),
+    ("1P", 1e15),
+    ("1p", 1e-12),
+    ("1e3k", 1e6),
+    (".5m", 5e-4),
+    ("4k7", 4700.0),
+    ("4K7", 4700.0),
+    ("470R", 470.0),
+    ("R47", 0.47),
+    ("2u2", 2.2e-6),
+    ("4n7", 4.7e-9),
+    ("1M0", 1e6),
+    ("4F7", 4.7),
+    (" -4k7\n", -4700.0),
+])
+def test_parse_value(text, value):
+    assert parse_value(text) == value
+
+
+def test_parse_value_prefers_float():
+    assert parse_value("4E7") == 4e7
+
+
+@pytest.mark.parametrize("text", ["", "k", "R", "4k7k", "4 k 7", "1..2k", "abc", "4.7 kilo", "4.7x"])
+def test_parse_value_malformed_raises_value_error(text):
+    with raises(ValueError):
+        parse_value(text)
+
+
+@given(series_key=sampled_from(ESeries), prefix=booleans())
+def test_parse_value_inverts_eng_string_for_series_values(series_key, prefix):
+    for value in erange(series_key, 1e-24, 1e27):
+        assert parse_value(eng_string(value, prefix=prefix)) == value
+
+
+@given(value=floats(min_value=1e-30, max_value=1e30))
+def test_parse_value_inverts_eng_string(value):
+    # eng_string() rounds to three significant figures
+    assert parse_value(eng_string(value)) == approx(value, rel=5e-3)
+
+
+def test_parse_values():
+    texts = ["4k7", "470R", "4k7", "2.2 u", "4700"]
+    assert list(parse_values(texts)) == [parse_value(text) for text in texts]
+
+
+def test_parse_values_beyond_memo_size(monkeypatch):
+    monkeypatch.setattr(parse, 'PARSE_VALUES_MEMO_SIZE', 2)
+    texts = ["1k", "2k2", "4k7", "1k", "4k7", "6k8", "4k7"]
+    assert list(parse_values(texts)) == [parse_value(text) for text in texts]
+
+
+def test_parse_values_is_lazy():
+    values = parse_values(iter(["4k7", "not a number"]))
+    assert next(values) == 4700.0
+    with raises(ValueError):
+        next(values)
@@ -0,0 +1,129 @@
+from hypothesis import given
+from hypothesis.strategies import floats
+from pytest import fixture, raises
+
+from eseries import (E24, series, series_keys, series_key_from_name, tolerance, erange, open_erange, find_nearest,
+                     find_nearest_few, find_greater_than_or_equal, find_less_than_or_equal, classify, is_member,
+                     register_series, unregister_series)
+
+REEL_VALUES = [1.0, 220, 4.7e3, 10e3, 47e3, 1e6, 3.3, 2.2]
+
+
+@fixture(scope='module')
+def reels():
+    series_key = register_series('REELS', REEL_VALUES, tolerance=0.05)
+    yield series_key
+    unregister_series(series_key)
+
+
+def test_registered_series_values(reels):
+    assert series(reels) == (10, 22, 33, 47)
+
+
+def test_registered_series_tolerance(reels):
+    assert tolerance(reels) == 0.05
+
+
+def test_registered_series_key_from_name(reels):
+    assert series_key_from_name('REELS') is reels
+
+
+def test_registered_series_in_series_keys(reels):
+    assert reels in series_keys()
+
+
+def test_registered_series_erange(reels):
+    assert list(erange(reels, 1, 100)) == [1.0, 2.2, 3.3, 4.7, 10.0, 22.0, 33.0, 47.0, 100.0]
+
+
+def test_registered_series_open_erange(reels):
+    assert list(open_erange(reels, 1, 10)) == [1.0, 2.2, 3.3, 4.7]
+
+
+@given(value=floats(min_value=1e-10, max_value=1e10))
+def test_registered_series_matches_parent_series(reels, value):
+    subset = [v for v in erange(E24, value / 100, value * 100) if is_member(reels, v)]
+    greater = find_greater_than_or_equal(reels, value)
+    less = find_less_than_or_equal(reels, value)
+    assert greater == min(v for v in subset if v >= value)
+    assert less == max(v for v in subset if v <= value)
+    assert find_nearest(reels, value) in (less, greater)
+    assert find_nearest(reels, value) in find_nearest_few(reels, value)
+
+
+def test_registered_series_is_member(reels):
+    assert is_member(reels, 33e3)
+    assert not is_member(reels, 15e3)
+
+
+def test_classify_prefers_coarser_registered_series():
+    series_key = register_series('COARSE', [2.2], tolerance=0.2)
+    try:
+        assert classify(2.2) is series_key
+    finally:
+        unregister_series(series_key)
+
+
+def test_inferred_significant_figures():
+    series_key = register_series('PRECISE', [1.0, 1.02, 1.5], tolerance=0.01)
+    try:
+        assert series(series_key) == (100, 102, 150)
+    finally:
+        unregister_series(series_key)
+
+
+def test_explicit_significant_figures():
+    series_key = register_series('PADDED', [1.0, 1.5], tolerance=0.1, significant_figures=3)
+    try:
+        assert series(series_key) == (100, 150)
+    finally:
+        unregister_series(series_key)
+
+
+def test_too_few_significant_figures_raises_value_error():
+    with raises(ValueError):
+        register_series('PRECISE', [1.0, 1.02], tolerance=0.01, significant_figures=2)
+
+
+def test_too_many_significant_figures_raises_value_error():
+    with raises(ValueError):
+        register_series('PRECISE', [1.024], tolerance=0.01)
+
+
+def test_empty_series_raises_value_error():
+    with raises(ValueError):
+        register_series('EMPTY', [], tolerance=0.01)
+
+
+def test_non_positive_value_raises_value_error():
+    with raises(ValueError):
+        register_series('NEGATIVE', [-1.0], tolerance=0.01)
+
+
+def test_illegal_tolerance_raises_value_error():
+    with raises(ValueError):
+        register_series('LOOSE', [1.0], tolerance=1.0)
+
+
+def test_standard_series_name_raises_value_error():
+    with raises(ValueError):
+        register_series('E24', [1.0], tolerance=0.05)
+
+
+def test_duplicate_name_raises_value_error(reels):
+    with raises(ValueError):
+        register_series('REELS', [1.0], tolerance=0.05)
+
+
+def test_unregistered_series_key_raises_value_error():
+    series_key = register_series('TEMPORARY', [1.0], tolerance=0.05)
+    unregister_series(series_key)
+    with raises(ValueError):
+        series(series_key)
+    with raises(ValueError):
+        series_key_from_name('TEMPORARY')
+
+
+def test_unregister_standard_series_raises_value_error():
+    with raises(ValueError):
+        unregister_series(E24)
@@ -0,0 +1,193 @@
+import asyncio
+import json
+
+from hypothesis import given, settings
+from hypothesis.strategies import sampled_from, floats, lists
+from pytest import raises
+
+from eseries import ESeries, E12, E24, erange, find_nearest, find_greater_than, tolerance
+from eseries.eseries import tolerance_limits
+import eseries.server
+from eseries.server import start_server, LookupBatcher, lookup_batch, VALUE_FUNCTIONS
+
+
+async def post(port, path, arguments, body=None):
+    """The status and decoded JSON response of a POST request to a local server."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        body = json.dumps(arguments).encode('utf-8') if body is None else body
+        writer.write("POST {} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {}\r\nConnection: close\r\n\r\n"
+                     .format(path, len(body)).encode('latin-1') + body)
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    head, _, response_body = response.partition(b'\r\n\r\n')
+    status = int(head.split()[1])
+    return status, json.loads(response_body.decode('utf-8'))
+
+
+async def with_server(client, batcher):
+    server = await start_server('127.0.0.1', 0, batcher)
+    try:
+        return await client(server.sockets[0].getsockname()[1])
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def run_with_server(client, batcher=None):
+    """Run a coroutine function of a port with a server listening on that port."""
+    return asyncio.run(asyncio.wait_for(with_server(client, batcher), timeout=10))
+
+
+def test_find_nearest():
+    assert run_with_server(lambda port: post(port, '/find_nearest', {'series': 'E24', 'value': 319})) == \
+        (200, {'result': 330.0})
+
+
+def test_find_nearest_few():
+    assert run_with_server(lambda port: post(port, '/find_nearest_few', {'series': 'E24', 'value': 5000})) == \
+        (200, {'result': [4700.0, 5100.0, 5600.0]})
+
+
+def test_values():
+    status, response = run_with_server(
+        lambda port: post(port, '/find_greater_than', {'series': 'E12', 'values': [1000, '4k7', 5e-3]}))
+    assert status == 200
+    assert response['result'] == [find_greater_than(E12, value) for value in (1000, 4.7e3, 5e-3)]
+
+
+def test_tolerance_limits():
+    status, response = run_with_server(lambda port: post(port, '/tolerance_limits', {'series': 'E24', 'value': 1e3}))
+    assert status == 200
+    assert response['result'] == list(tolerance_limits(E24, 1e3))
+
+
+def test_erange():
+    status, response = run_with_server(
+        lambda port: post(port, '/erange', {'series': 'E12', 'start': 1, 'stop': 10, 'reverse': True, 'step': 4}))
+    assert status == 200
+    assert response['result'] == list(erange(E12, 1, 10, reverse=True, step=4))
+
+
+def test_tolerance():
+    assert run_with_server(lambda port: post(port, '/tolerance', {'series': 'E96'})) == \
+        (200, {'result': tolerance(ESeries.E96)})
+
+
+def test_concurrent_lookups_are_batched():
+    batcher = LookupBatcher(max_batch_size=1000, max_latency=0.05)
+    values = [1.0 + i for i in range(50)]
+
+    async def client(port):
+        return await asyncio.gather(*(post(port, '/find_nearest', {'series': 'E24', 'value': value})
+                                      for value in values))
+
+    responses = run_with_server(client, batcher)
+    assert [response['result'] for _, response in responses] == [find_nearest(E24, value) for value in values]
+    assert batcher.num_lookups == len(values)
+    assert batcher.num_batches < len(values)
+
+
+def test_full_batch_is_looked_up_immediately():
+    batcher = LookupBatcher(max_batch_size=2, max_latency=60)
+
+    async def client(port):
+        return await asyncio.gather(post(port, '/find_nearest', {'series': 'E24', 'value': 319}),
+                                    post(port, '/find_nearest', {'series': 'E24', 'value': 5000}))
+
+    responses = run_with_server(client, batcher)
+    assert [response for _, response in responses] == [{'result': 330.0}, {'result': 5100.0}]
+    assert batcher.num_batches == 1
+
+
+def test_invalid_value_in_batch_is_reported_separately():
+    async def client(port):
+        return await asyncio.gather(post(port, '/find_nearest', {'series': 'E24', 'value': 319}),
+                                    post(port, '/find_nearest', {'series': 'E24', 'value': 1e-300}))
+
+    (good_status, good), (bad_status, bad) = run_with_server(client, LookupBatcher(max_latency=0.05))
+    assert (good_status, good) == (200, {'result': 330.0})
+    assert bad_status == 400
+    assert 'error' in bad
+
+
+def test_huge_value_in_batch_does_not_delay_other_values():
+    async def client(port):
+        return await asyncio.gather(post(port, '/find_nearest', {'series': 'E24', 'value': 319}),
+                                    post(port, '/find_nearest', None, body=b'{"series": "E24", "value": 1' +
+                                         b'0' * 400 + b'}'))
+
+    (good_status, good), (bad_status, bad) = run_with_server(client, LookupBatcher(max_latency=0.05))
+    assert (good_status, good) == (200, {'result': 330.0})
+    assert bad_status == 400
+    assert 'error' in bad
+
+
+def test_non_finite_value_is_bad_request():
+    status, response = run_with_server(
+        lambda port: post(port, '/find_nearest', None, body=b'{"series": "E24", "value": Infinity}'))
+    assert status == 400
+
+
+def test_unexpected_error_in_batch_resolves_every_lookup(monkeypatch):
+    def fail(function_name, series_key, values):
+        raise RuntimeError("Unexpected")
+
+    monkeypatch.setattr(eseries.server, 'lookup_batch', fail)
+
+    async def client(port):
+        return await asyncio.gather(post(port, '/find_nearest', {'series': 'E24', 'value': 319}),
+                                    post(port, '/find_nearest', {'series': 'E24', 'value': 5000}),
+                                    return_exceptions=True)
+
+    results = run_with_server(client, LookupBatcher(max_latency=0.05))
+    assert len(results) == 2
+
+
+def test_lookup_batch_reports_overflow_for_each_value():
+    results = lookup_batch('find_nearest', E24, [319, 10 ** 400])
+    assert results[0] == 330.0
+    assert isinstance(results[1], Exception)
+
+
+def test_unknown_series_is_bad_request():
+    status, response = run_with_server(lambda port: post(port, '/find_nearest', {'series': 'E7', 'value': 1}))
+    assert status == 400
+
+
+def test_missing_argument_is_bad_request():
+    status, response = run_with_server(lambda port: post(port, '/find_nearest', {'series': 'E24'}))
+    assert status == 400
+
+
+def test_malformed_json_is_bad_request():
+    status, response = run_with_server(lambda port: post(port, '/find_nearest', None, body=b'{'))
+    assert status == 400
+
+
+def test_unknown_function_is_not_found():
+    status, response = run_with_server(lambda port: post(port, '/find_furthest', {'series': 'E24', 'value': 1}))
+    assert status == 404
+
+
+@settings(deadline=None, max_examples=20)
+@given(function_name=sampled_from(sorted(VALUE_FUNCTIONS)),
+       series_key=sampled_from(ESeries),
+       values=lists(floats(min_value=1e-10, max_value=1e10), min_size=1, max_size=20))
+def test_lookup_batch_matches_scalar_functions(function_name, series_key, values):
+    function = VALUE_FUNCTIONS[function_name]
+    results = lookup_batch(function_name, series_key, values)
+    assert [tuple(result) if isinstance(result, list) else result for result in results] == \
+        [function(series_key, value) for value in values]
+
+
+def test_illegal_max_batch_size_raises_value_error():
+    with raises(ValueError):
+        LookupBatcher(max_batch_size=0)
+
+
+def test_negative_max_latency_raises_value_error():
+    with raises(ValueError):
+        LookupBatcher(max_latency=-1)
@@ -0,0 +1,144 @@
+import os
+from array import array
+
+from pytest import fixture, raises
+
+from eseries import E24, E192, erange, find_nearest, register_series, unregister_series
+from eseries.dividers import find_dividers, _ratio_table, _RATIO_TABLES
+from eseries.eseries import _decade_table, _DECADE_TABLES
+from eseries.tables import (enable_table_cache, disable_table_cache, table_cache_directory, build_table_cache,
+                            cached_tables)
+
+
+def clear_tables():
+    _DECADE_TABLES.clear()
+    _RATIO_TABLES.clear()
+
+
+@fixture
+def cache_directory(tmp_path):
+    directory = str(tmp_path / 'tables')
+    clear_tables()
+    enable_table_cache(directory)
+    yield directory
+    disable_table_cache()
+    clear_tables()
+
+
+def test_enable_table_cache_creates_directory(cache_directory):
+    assert os.path.isdir(cache_directory)
+    assert table_cache_directory() == cache_directory
+
+
+def test_table_cache_disabled_by_default():
+    assert table_cache_directory() is None
+
+
+def test_tables_are_saved(cache_directory):
+    _decade_table(E24)
+    _ratio_table(E24)
+    assert sorted(os.listdir(cache_directory)) == ['decade-E24.bin', 'ratio-E24.bin']
+
+
+def test_saved_tables_are_memory_mapped(cache_directory):
+    built = _decade_table(E192)
+    clear_tables()
+    loaded = _decade_table(E192)
+    assert isinstance(loaded, memoryview)
+    assert list(loaded) == list(built)
+
+
+def test_results_from_saved_tables_equal_results_from_built_tables(cache_directory):
+    built = (list(erange(E192, 1e-3, 1e6)), list(erange(E192, 1e-3, 1e6, reverse=True, step=3)),
+             find_nearest(E192, 319), find_dividers(E192, 3.125, num=10))
+    clear_tables()
+    loaded = (list(erange(E192, 1e-3, 1e6)), list(erange(E192, 1e-3, 1e6, reverse=True, step=3)),
+              find_nearest(E192, 319), find_dividers(E192, 3.125, num=10))
+    assert isinstance(_decade_table(E192), memoryview)
+    assert isinstance(_ratio_table(E192)[0], memoryview)
+    assert loaded == built
+
+
+def test_build_table_cache(cache_directory):
+    build_table_cache([E24, E192])
+    assert sorted(os.listdir(cache_directory)) == ['decade-E192.bin', 'decade-E24.bin',
+                                                   'ratio-E192.bin', 'ratio-E24.bin']
+
+
+def test_build_table_cache_when_disabled_raises_value_error():
+    with raises(ValueError):
+        build_table_cache()
+
+
+def test_enable_table_cache_before_python_3_raises_value_error(tmp_path, monkeypatch):
+    monkeypatch.setattr('sys.version_info', (2, 7, 18, 'final', 0))
+    with raises(ValueError):
+        enable_table_cache(str(tmp_path / 'tables'))
+    assert table_cache_directory() is None
+    assert not os.path.exists(str(tmp_path / 'tables'))
+
+
+def test_stale_table_is_rebuilt(cache_directory):
+    series_key = register_series('REELS', [1.0, 2.2, 4.7], tolerance=0.05)
+    try:
+        _decade_table(series_key)
+    finally:
+        unregister_series(series_key)
+    series_key = register_series('REELS', [1.0, 3.3], tolerance=0.05)
+    try:
+        assert list(erange(series_key, 1, 10)) == [1.0, 3.3, 10.0]
+    finally:
+        unregister_series(series_key)
+
+
+def test_damaged_table_is_rebuilt(cache_directory):
+    built = list(_decade_table(E24))
+    clear_tables()
+    path = os.path.join(cache_directory, 'decade-E24.bin')
+    with open(path, 'rb') as file:
+        data = file.read()
+    with open(path, 'wb') as file:
+        file.write(data[:len(data) // 2])
+    assert list(_decade_table(E24)) == built
+    clear_tables()
+    assert isinstance(_decade_table(E24), memoryview)
+
+
+def test_table_with_damaged_values_is_rebuilt(cache_directory):
+    built = list(_decade_table(E24))
+    clear_tables()
+    path = os.path.join(cache_directory, 'decade-E24.bin')
+    with open(path, 'rb') as file:
+        data = file.read()
+    with open(path, 'wb') as file:
+        file.write(data[:-64] + b'\0' * 64)
+    assert list(_decade_table(E24)) == built
+    assert find_nearest(E24, 9.05e12) == 9.1e12
+
+
+def test_custom_series_names_are_safe_file_names(cache_directory):
+    series_keys = [register_series(name, [1.0, 2.2, 4.7], tolerance=0.05) for name in ('../REELS', '__/REELS')]
+    try:
+        for series_key in series_keys:
+            assert list(erange(series_key, 1, 10)) == [1.0, 2.2, 4.7, 10.0]
+    finally:
+        for series_key in series_keys:
+            unregister_series(series_key)
+    file_names = os.listdir(cache_directory)
+    assert len(file_names) == 2
+    assert all(file_name.startswith('decade-___REELS-') for file_name in file_names)
+
+
+def test_cached_tables_preserves_typecodes(cache_directory):
+    def build():
+        return array('d', [1.5, 2.5]), array('l', [3, 4, 5])
+
+    built = cached_tables('test', ('inputs',), build)
+    loaded = cached_tables('test', ('inputs',), build)
+    assert [table.format for table in loaded] == ['d', 'l']
+    assert [list(table) for table in loaded] == [list(table) for table in built]
+
+
+def test_cached_tables_different_inputs_are_rebuilt(cache_directory):
+    assert list(cached_tables('test', (1,), lambda: (array('d', [1.0]),))[0]) == [1.0]
+    assert list(cached_tables('test', (2,), lambda: (array('d', [2.0]),))[0]) == [2.0]